@@ -78,10 +78,17 @@ from .coordinates import (
     sSEZtoECEF,
     sENZtoAZEL,
     sSEZtoAZEL,
+    sGEODtoECEF_batch,
+    sECEFtoGEOD_batch,
+    sECEFtoENZ_batch,
+    sECEFtoSEZ_batch,
+    sENZtoAZEL_batch,
 )
 
 from .eop import EOP
 
+from .ephemeris import Ephemeris
+
 from .ephemerides import (
     sun_position,
     moon_position,
@@ -89,6 +96,7 @@ from .ephemerides import (
 
 from .epoch import (
     Epoch,
+    EpochArray,
     epoch_range,
 )
 
@@ -100,6 +108,13 @@ from .frames import (
     rECEFtoECI,
     sECItoECEF,
     sECEFtoECI,
+    bias_precession_nutation_batch,
+    earth_rotation_batch,
+    polar_motion_batch,
+    rECItoECEF_batch,
+    rECEFtoECI_batch,
+    sECItoECEF_batch,
+    sECEFtoECI_batch,
 )
 
 from .relative_coordinates import (
@@ -115,9 +130,15 @@ from .time import (
     caldate_to_jd,
     jd_to_caldate,
     time_system_offset,
+    tai_utc,
+    load_tai_utc,
 )
 
 from .tle import (
     tle_string_from_elements,
-    TLE
+    intern_tle,
+    read_tle_lines,
+    read_tles,
+    TLE,
+    TLECatalog
 )
\ No newline at end of file
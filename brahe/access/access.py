@@ -5,6 +5,7 @@ geometry, and boundaries under different constraints.
 import logging
 import typing
 import copy
+import functools
 import datetime
 import math
 import numpy as np
@@ -12,12 +13,13 @@ import numpy as np
 from brahe.constants import RAD2DEG
 from brahe.epoch import Epoch
 from brahe.tle import TLE
-from brahe.coordinates import sECEFtoGEOD
+from brahe.coordinates import sECEFtoGEOD, rECEFtoENZ
 from brahe.astro import orbital_period, sCARTtoOSC
 
 import brahe.data_models as bdm
 import brahe.utils as utils
 from . import access_geometry as ageo
+from .spatial_index import LocationIndex
 
 
 logger = logging.getLogger(__name__)
@@ -199,6 +201,194 @@ def tile_direction_constraint(epc: Epoch,
     else:
         return False
 
+def look_direction_constraint_batch(sat_ecef: np.ndarray, loc_ecef: np.ndarray,
+                                    constraints: bdm.AccessConstraints, **kwargs) -> np.ndarray:
+    '''Look direction access constraint for multiple satellite states.
+
+    Args:
+        sat_ecef (:obj:`np.ndarray`): Satellite ECEF (ITRF) states with shape (N, 6)
+        loc_ecef (:obj:`np.ndarray`): Location ECEF (ITRF) state
+        constraints (:obj:`AccessConstraints`): Constraint settings
+
+    Returns:
+        np.ndarray: Boolean mask of states at which the constraint is satisfied.
+    '''
+
+    if constraints.look_direction == bdm.LookDirection.either:
+        return np.ones(len(sat_ecef), dtype=bool)
+
+    # Compare as objects. Enum members are strings so numpy would otherwise
+    # compare their string representations
+    look_dir = ageo.look_direction_batch(sat_ecef, loc_ecef)
+
+    return look_dir == np.array(constraints.look_direction, dtype=object)
+
+
+def ascdsc_constraint_batch(sat_ecef: np.ndarray, loc_ecef: np.ndarray,
+                            constraints: bdm.AccessConstraints, **kwargs) -> np.ndarray:
+    '''Ascending/descending access constraint for multiple satellite states.
+
+    Args:
+        sat_ecef (:obj:`np.ndarray`): Satellite ECEF (ITRF) states with shape (N, 6)
+        loc_ecef (:obj:`np.ndarray`): Location ECEF (ITRF) state
+        constraints (:obj:`AccessConstraints`): Constraint settings
+
+    Returns:
+        np.ndarray: Boolean mask of states at which the constraint is satisfied.
+    '''
+
+    if constraints.ascdsc == bdm.AscendingDescending.either:
+        return np.ones(len(sat_ecef), dtype=bool)
+
+    # Compare as objects. Enum members are strings so numpy would otherwise
+    # compare their string representations
+    ascdsc = ageo.ascdsc_batch(sat_ecef)
+
+    return ascdsc == np.array(constraints.ascdsc, dtype=object)
+
+
+def look_angle_constraint_batch(sat_ecef: np.ndarray, loc_ecef: np.ndarray,
+                                constraints: bdm.AccessConstraints, **kwargs) -> np.ndarray:
+    '''Look angle access constraint for multiple satellite states.
+
+    Args:
+        sat_ecef (:obj:`np.ndarray`): Satellite ECEF (ITRF) states with shape (N, 6)
+        loc_ecef (:obj:`np.ndarray`): Location ECEF (ITRF) state
+        constraints (:obj:`AccessConstraints`): Constraint settings
+
+    Returns:
+        np.ndarray: Boolean mask of states at which the constraint is satisfied.
+    '''
+
+    look_angle = ageo.look_angle_batch(sat_ecef, loc_ecef, use_degrees=True)
+
+    return (constraints.look_angle_min <= look_angle) & (look_angle <= constraints.look_angle_max)
+
+
+def elevation_constraint_batch(sat_ecef: np.ndarray, loc_ecef: np.ndarray,
+                               constraints: bdm.AccessConstraints,
+                               loc_enz: np.ndarray = None, **kwargs) -> np.ndarray:
+    '''Elevation constraint for multiple satellite states.
+
+    Args:
+        sat_ecef (:obj:`np.ndarray`): Satellite ECEF (ITRF) states with shape (N, 6)
+        loc_ecef (:obj:`np.ndarray`): Location ECEF (ITRF) state
+        constraints (:obj:`AccessConstraints`): Constraint settings
+        loc_enz (:obj:`np.ndarray`): ECEF to ENZ rotation of the location.
+
+    Returns:
+        np.ndarray: Boolean mask of states at which the constraint is satisfied.
+    '''
+
+    elevation = ageo.azelrng_batch(sat_ecef, loc_ecef, use_degrees=True, loc_enz=loc_enz)[:, 1]
+
+    return (constraints.elevation_min <= elevation) & (elevation <= constraints.elevation_max)
+
+
+def tile_direction_constraint_batch(sat_ecef: np.ndarray, loc_ecef: np.ndarray,
+                                    constraints: bdm.AccessConstraints,
+                                    tile: bdm.Tile = None,
+                                    max_alignment_deviation: float = 10,
+                                    **kwargs) -> np.ndarray:
+    '''Tile direction access constraint for multiple satellite states. Limits
+    access to satellites aligned with tile direction.
+
+    Args:
+        sat_ecef (:obj:`np.ndarray`): Satellite ECEF (ITRF) states with shape (N, 6)
+        loc_ecef (:obj:`np.ndarray`): Location ECEF (ITRF) state
+        constraints (:obj:`AccessConstraints`): Constraint settings
+        tile (:obj:`tile`): Tile associated with collect
+        max_alignment_deviation (float): Maximum deviation of satellite velocity 
+            vector and tile direction.
+
+    Returns:
+        np.ndarray: Boolean mask of states at which the constraint is satisfied.
+    '''
+
+    if np.shape(sat_ecef)[-1] < 6:
+        raise RuntimeError(
+            f'Invalid input length of {np.shape(sat_ecef)[-1]}. Must be at least length 6.'
+        )
+
+    if not tile:
+        raise RuntimeError(f'Missing expected keyword argument "tile"')
+
+    # Satellite Point
+    sat_pnt = sat_ecef[:, 0:3] / np.linalg.norm(sat_ecef[:, 0:3], axis=1)[:, np.newaxis]
+
+    # Get Direction vectors
+    sat_dir = sat_ecef[:, 3:6] / np.linalg.norm(sat_ecef[:, 3:6], axis=1)[:, np.newaxis]
+    tile_dir = np.asarray(tile.tile_direction)
+    tile_dir = tile_dir / np.linalg.norm(tile_dir)
+
+    # Remove component of satellite velocity normal to Earth's surface
+    sat_dir = sat_dir - np.sum(sat_dir * sat_pnt, axis=1)[:, np.newaxis]
+    sat_dir = sat_dir / np.linalg.norm(sat_dir, axis=1)[:, np.newaxis]
+
+    # Compute alignment of satellite velocity and tile direction
+    alignment_angle = np.arccos(np.clip(sat_dir @ tile_dir, -1.0, 1.0)) * RAD2DEG
+
+    return alignment_angle < max_alignment_deviation
+
+
+class AccessConstraintPipeline():
+    '''Access constraints resolved for a single location. Constraint functions
+    and their keyword arguments are bound once on construction so repeated
+    evaluation only has to do the geometry.
+
+    Args:
+        loc_ecef (:obj:`np.ndarray`): Location ECEF (ITRF) state
+        constraints (:obj:`AccessConstraints`): Constraint settings
+        constraint_list (List[str]): List of constraint functions to apply to
+            check for access.
+        kwargs (dict): Accepts keyword arguments passed to constraint functions
+    '''
+
+    def __init__(self, loc_ecef: np.ndarray, constraints: bdm.AccessConstraints,
+                 constraint_list: typing.List[str], **kwargs):
+
+        self.loc_ecef = np.asarray(loc_ecef)
+        self.constraints = constraints
+        self.constraint_list = list(constraint_list)
+
+        # Topocentric basis of location
+        self.loc_enz = rECEFtoENZ(self.loc_ecef[0:3], conversion='geodetic')
+
+        self._functions = []
+        for field in self.constraint_list:
+            func = globals().get(f'{field}_constraint_batch', None)
+
+            if func is None:
+                raise RuntimeError(f'Unknown access constraint "{field}".')
+
+            self._functions.append(functools.partial(func, loc_ecef=self.loc_ecef,
+                                                     constraints=constraints,
+                                                     loc_enz=self.loc_enz, **kwargs))
+
+    def __call__(self, sat_ecef: np.ndarray) -> np.ndarray:
+        '''Check if all access constraints are satisfied.
+
+        Args:
+            sat_ecef (:obj:`np.ndarray`): Satellite ECEF (ITRF) states with shape (N, 6)
+
+        Returns:
+            np.ndarray: Boolean mask of states at which all constraints are satisfied.
+        '''
+
+        sat_ecef = np.asarray(sat_ecef).reshape(-1, 6)
+        valid = np.ones(len(sat_ecef), dtype=bool)
+
+        # Only evaluate states which satisfy all previous constraints
+        for func in self._functions:
+            idx = np.nonzero(valid)[0]
+
+            if len(idx) == 0:
+                break
+
+            valid[idx] = func(sat_ecef[idx])
+
+        return valid
+
 # ######################
 # # Access Computation #
 # ######################
@@ -215,7 +405,7 @@ def find_geometric_constraint_boundary(tle: TLE,
     to opposite visibility status (True/False).
 
     Args:
-        tle (:obj:`TLE`): TLE object.
+        tle (:obj:`Union[TLE, Ephemeris]`): TLE or Ephemeris object.
         center_ecef (np.ndarray): Center location to compute access constraints with respect to.
         constraints (typing.List[str]): Access constraint properties.
         constraint_list (List[str]): List of constraint functions to apply to check for access
@@ -249,7 +439,7 @@ def compute_access_properties(tle: TLE, center_ecef: np.ndarray,
     '''Compute access properties of Contact or Collect.
 
     Args:
-        tle (:obj:`TLE`): TLE object
+        tle (:obj:`Union[TLE, Ephemeris]`): TLE or Ephemeris object.
         center_ecef (np.ndarray): Center location to compute access constraints with respect to.
         t_start (:obj:`Epoch`): Start of access window
         t_end (:obj:`Epoch`): End of access window
@@ -304,39 +494,354 @@ def compute_access_properties(tle: TLE, center_ecef: np.ndarray,
 
     return access_properties
 
-def find_location_accesses(spacecraft: bdm.Spacecraft, geojson: bdm.GeoJSONObject,
-                           t_start: Epoch, t_end: Epoch,
-                           timestep: float = 120.0, tol: float = 1e-3,
-                           orbit_fraction: float = 0.75, **kwargs):
-    '''Final all opportunities for accesses over the period `t_start` to `t_end`. 
-    Accepts either `Station` or `Tile` as primary inputs and returns `Contact`
-    or `Collect` respectively.
+def _access_property_columns(tle: TLE, center_ecef: np.ndarray, t_start: Epoch,
+                             dt_start: np.ndarray, dt_end: np.ndarray) -> typing.Dict[str, np.ndarray]:
+    '''Compute the access properties of multiple windows to the same location
+    as arrays, with all satellite states propagated in a single call.
 
     Args:
-        spacecraft (:obj:`Spacecraft`): Spacecraft object.
-        geojson (:obj:`Union[Station, Tile]`): Location object with center_point for access. Tile or Station
-        t_start (:obj:`Epoch`): Start of window for access computation. GPS Time.
-        t_end (:obj:`Epoch`): End of window for access computation. GPS Time.
-        timestep (float, Default: 120): timestep for search
+        tle (:obj:`Union[TLE, Ephemeris]`): TLE or Ephemeris object.
+        center_ecef (np.ndarray): Center location to compute access constraints with respect to.
+        t_start (:obj:`Epoch`): Reference epoch of window times.
+        dt_start (np.ndarray): Start of each window since `t_start`. Units: [s]
+        dt_end (np.ndarray): End of each window since `t_start`. Units: [s]
+
+    Returns:
+        Dict[str, np.ndarray]: Each `AccessProperties` field of every window.
+    '''
+
+    center_ecef = np.asarray(center_ecef)
+    n = len(dt_start)
+
+    # Get Window Start, Mid, and End Times
+    dt = np.stack((dt_start, dt_start + (dt_end - dt_start) / 2.0, dt_end), axis=1)
+
+    x = tle.states_itrf(dt.reshape(-1), epoch=t_start).reshape(n, 3, 6)
+    sat_start, sat_midtime, sat_end = x[:, 0], x[:, 1], x[:, 2]
+
+    # Compute Geometry
+    enz = rECEFtoENZ(center_ecef[0:3], conversion='geodetic')
+    azelrng = ageo.azelrng_batch(x.reshape(-1, 6), center_ecef, use_degrees=True, loc_enz=enz).reshape(n, 3, 3)
+    look_angle = ageo.look_angle_batch(x.reshape(-1, 6), center_ecef, use_degrees=True).reshape(n, 3)
+
+    # Compute LOS start and end
+    z_los_start = center_ecef[0:3] - sat_start[:, 0:3]
+    z_los_start /= np.linalg.norm(z_los_start, axis=1)[:, np.newaxis]
+
+    z_los_end = center_ecef[0:3] - sat_end[:, 0:3]
+    z_los_end /= np.linalg.norm(z_los_end, axis=1)[:, np.newaxis]
+
+    # NOTE: Assumes that maximal values for look angle and elevation occur
+    # at either the start, end, or midtime.
+    return {
+        'ascdsc': ageo.ascdsc_batch(sat_midtime),
+        'look_direction': ageo.look_direction_batch(sat_midtime, center_ecef),
+        'azimuth_open': azelrng[:, 0, 0],
+        'azimuth_close': azelrng[:, 2, 0],
+        'elevation_min': np.round(np.minimum(azelrng[:, 0, 1], azelrng[:, 2, 1]), 6),
+        'elevation_max': np.round(azelrng[:, 1, 1], 6),
+        'look_angle_min': np.round(look_angle[:, 1], 6),
+        'look_angle_max': np.round(np.maximum(look_angle[:, 0], look_angle[:, 2]), 6),
+        'los_start': z_los_start,
+        'los_end': z_los_end,
+    }
+
+def compute_access_properties_batch(tle: TLE, center_ecef: np.ndarray,
+                                    windows: typing.List[typing.Tuple[Epoch, Epoch]]):
+    '''Compute access properties of multiple Contacts or Collects of the same
+    location. Equivalent to `compute_access_properties` for each window, with
+    all satellite states propagated in a single call.
+
+    Args:
+        tle (:obj:`Union[TLE, Ephemeris]`): TLE or Ephemeris object.
+        center_ecef (np.ndarray): Center location to compute access constraints with respect to.
+        windows (List[Tuple[Epoch, Epoch]]): Start and end of each access window
+
+    Returns:
+        List[AccessProperties]: Geometric properties of each access
+    '''
+
+    if len(windows) == 0:
+        return []
+
+    dt_start = np.array([t_start - tle.epoch for t_start, _ in windows])
+    dt_end = np.array([t_end - tle.epoch for _, t_end in windows])
+
+    columns = _access_property_columns(tle, center_ecef, tle.epoch, dt_start, dt_end)
+
+    properties = []
+    for k in range(len(windows)):
+        properties.append(bdm.AccessProperties(
+            ascdsc=columns['ascdsc'][k],
+            look_direction=columns['look_direction'][k],
+            azimuth_open=float(columns['azimuth_open'][k]),
+            azimuth_close=float(columns['azimuth_close'][k]),
+            elevation_min=float(columns['elevation_min'][k]),
+            elevation_max=float(columns['elevation_max'][k]),
+            look_angle_min=float(columns['look_angle_min'][k]),
+            look_angle_max=float(columns['look_angle_max'][k]),
+            los_start=columns['los_start'][k].tolist(),
+            los_end=columns['los_end'][k].tolist(),
+        ))
+
+    return properties
+
+
+def _location_index(pipelines: typing.List[AccessConstraintPipeline]) -> LocationIndex:
+    '''Create a spatial index of the locations of access constraint pipelines.
+
+    Args:
+        pipelines (List[:obj:`AccessConstraintPipeline`]): Access constraints
+            of each location.
+
+    Returns:
+        LocationIndex: Index of the locations.
+    '''
+
+    elevation_min = [p.constraints.elevation_min if 'elevation' in p.constraint_list else np.nan for p in pipelines]
+    look_angle_max = [p.constraints.look_angle_max if 'look_angle' in p.constraint_list else np.nan for p in pipelines]
+
+    return LocationIndex(np.array([p.loc_ecef[0:3] for p in pipelines]).reshape(-1, 3),
+                         elevation_min=elevation_min, look_angle_max=look_angle_max)
+
+
+def _constraint_masks(sat_ecef: np.ndarray,
+                      pipelines: typing.List[AccessConstraintPipeline],
+                      index: LocationIndex,
+                      active: np.ndarray = None) -> np.ndarray:
+    '''Evaluate access constraints of multiple locations for shared satellite
+    states. Constraints are only evaluated for the satellite states from which
+    the spatial index finds a location may be accessible.
+
+    Args:
+        sat_ecef (:obj:`np.ndarray`): Satellite ECEF (ITRF) states with shape (N, 6)
+        pipelines (List[:obj:`AccessConstraintPipeline`]): Access constraints
+            of each of M locations.
+        index (:obj:`LocationIndex`): Spatial index of the M locations.
+        active (np.ndarray): Boolean mask of locations to evaluate. Inactive
+            locations are set to False. Default: all locations.
+
+    Returns:
+        np.ndarray: Boolean mask with shape (M, N) of states at which all
+            constraints of each location are satisfied.
+    '''
+
+    masks = np.zeros((len(pipelines), len(sat_ecef)), dtype=bool)
+
+    sat_idx, loc_idx = index.query(sat_ecef)
+
+    # Candidate pairs are ordered by location
+    locs, starts = np.unique(loc_idx, return_index=True)
+    for m, idx in zip(locs, np.split(sat_idx, starts[1:])):
+        if active is not None and not active[m]:
+            continue
+
+        masks[m, idx] = pipelines[m](sat_ecef[idx])
+
+    return masks
+
+
+def _refine_constraint_boundaries(tle: TLE, t_start: Epoch, t_lo: np.ndarray,
+                                  t_hi: np.ndarray, visible_lo: np.ndarray,
+                                  owner: np.ndarray,
+                                  pipelines: typing.List[AccessConstraintPipeline],
+                                  tol: float = 0.001) -> np.ndarray:
+    '''Refine all bracketed constraint boundaries by simultaneous bisection.
+    Each iteration propagates the midpoints of every bracket in one batch.
+
+    Args:
+        tle (:obj:`Union[TLE, Ephemeris]`): TLE or Ephemeris object.
+        t_start (:obj:`Epoch`): Reference epoch of times.
+        t_lo (np.ndarray): Lower bound of each bracket. Units: [s]
+        t_hi (np.ndarray): Upper bound of each bracket. Units: [s]
+        visible_lo (np.ndarray): Constraint status at the lower bound of each
+            bracket. The status at the upper bound is the opposite.
+        owner (np.ndarray): Index of the pipeline of each bracket.
+        pipelines (List[:obj:`AccessConstraintPipeline`]): Access constraints
+            of each location.
+        tol (float): Time tolerance for constraint boundaries.
+
+    Returns:
+        np.ndarray: Time of each boundary. Units: [s]
+    '''
+
+    t_lo = np.array(t_lo, dtype=float)
+    t_hi = np.array(t_hi, dtype=float)
+
+    if len(t_lo) == 0:
+        return t_lo
+
+    groups = [(m, np.nonzero(owner == m)[0]) for m in np.unique(owner)]
+
+    while np.max(t_hi - t_lo) > tol:
+        t_mid = (t_lo + t_hi)/2.0
+        x_mid = tle.states_itrf(t_mid, epoch=t_start)
+
+        visible = np.empty(len(t_mid), dtype=bool)
+        for m, idx in groups:
+            visible[idx] = pipelines[m](x_mid[idx])
+
+        same = visible == visible_lo
+        t_lo = np.where(same, t_mid, t_lo)
+        t_hi = np.where(same, t_hi, t_mid)
+
+    return (t_lo + t_hi)/2.0
+
+
+def _search_grid(t_start: Epoch, t_end: Epoch, timestep: float = 120.0) -> np.ndarray:
+    '''Times of the access search grid.
+
+    Args:
+        t_start (:obj:`Epoch`): Start of search window.
+        t_end (:obj:`Epoch`): End of search window.
+        timestep (float, Default: 120): Grid spacing of search.
+
+    Returns:
+        np.ndarray: Elapsed time since `t_start` of each grid point. Units: [s]
+    '''
+
+    return np.arange(0.0, t_end - t_start, timestep)
+
+
+def _find_windows(tle: TLE, pipelines: typing.List[AccessConstraintPipeline],
+                  t_start: Epoch, t_end: Epoch, timestep: float = 120.0,
+                  tol: float = 1e-3, states: np.ndarray = None,
+                  max_extension: float = None) -> typing.List[typing.List[typing.Tuple[Epoch, Epoch]]]:
+    '''Find the access windows of one satellite to multiple locations. The
+    satellite is propagated once over the search grid for all locations.
+
+    Args:
+        tle (:obj:`Union[TLE, Ephemeris]`): TLE or Ephemeris object.
+        pipelines (List[:obj:`AccessConstraintPipeline`]): Access constraints
+            of each location.
+        t_start (:obj:`Epoch`): Start of search window.
+        t_end (:obj:`Epoch`): End of search window.
+        timestep (float, Default: 120): Grid spacing of search.
         tol (float, Default: 1e-3): Time tolerance for constraint boundaries.
-        orbit_fraction (float, Default: 0.75): Fraction of orbital period to advance search after finding an access.
-        request (:obj:`Request`): Request. Only required if input GeoJSON is `Tile`
-        kwargs (dict): Accepts keyword arguments passed to constraint function.
+        states (np.ndarray, optional): Satellite ECEF (ITRF) states on the
+            search grid. Propagated if not provided.
+        max_extension (float, optional): Maximum extension of the search
+            grid past either end of the search period to close open windows.
+            Defaults to one orbital period. Units: [s]
 
     Returns:
-        List[Union[Contact, Collect]]: `Contact` or `Collect` opportunities.
+        List[List[Tuple[Epoch, Epoch]]]: Start and end of each access window
+            for each location.
     '''
 
-    opportunities = []
+    # Evaluate constraints over search grid
+    dt = _search_grid(t_start, t_end, timestep)
 
-    # Assert time types as epochs
-    t_start = Epoch(t_start, time_system='UTC')
-    t_end = Epoch(t_end, time_system='UTC')
+    if len(dt) == 0 or len(pipelines) == 0:
+        return [[] for _ in pipelines]
+
+    index = _location_index(pipelines)
+
+    # Satellites propagated over the same grid share its frame rotations
+    if states is None:
+        states = tle.states_itrf(dt, epoch=t_start)
+
+    masks = _constraint_masks(states, pipelines, index)
+
+    if max_extension is None:
+        max_extension = orbital_period(sCARTtoOSC(tle.state_gcrf(t_start), use_degrees=True)[0])
+
+    # Extend grid until any windows open at either end have closed, for at
+    # most `max_extension`. Only locations with an open window are evaluated
+    # on the extension.
+    n_ext = 16
+    dt_min, dt_max = -max_extension, dt[-1] + max_extension
+
+    while np.any(masks[:, 0]) and dt[0] > dt_min:
+        dt_ext = dt[0] - timestep*np.arange(n_ext, 0, -1)
+        masks_ext = _constraint_masks(tle.states_itrf(dt_ext, epoch=t_start), pipelines, index, active=masks[:, 0])
+        dt = np.concatenate((dt_ext, dt))
+        masks = np.concatenate((masks_ext, masks), axis=1)
+
+    while np.any(masks[:, -1]) and dt[-1] < dt_max:
+        dt_ext = dt[-1] + timestep*np.arange(1, n_ext + 1)
+        masks_ext = _constraint_masks(tle.states_itrf(dt_ext, epoch=t_start), pipelines, index, active=masks[:, -1])
+        dt = np.concatenate((dt, dt_ext))
+        masks = np.concatenate((masks, masks_ext), axis=1)
+
+    # Windows which have not closed by the end of the extension are clipped
+    # to the search period. Closing them at the ends of the grid with
+    # zero-width brackets keeps transitions alternating between opening and
+    # closing.
+    open_start, open_end = masks[:, 0].copy(), masks[:, -1].copy()
+
+    dt = np.concatenate(([dt[0]], dt, [dt[-1]]))
+    masks = np.pad(masks, ((0, 0), (1, 1)))
+
+    # Find grid intervals containing a transition
+    owner, edges = np.nonzero(np.diff(masks.astype(np.int8), axis=1))
+
+    t_edge = _refine_constraint_boundaries(tle, t_start, dt[edges], dt[edges + 1],
+                                           masks[owner, edges], owner, pipelines, tol=tol)
+
+    windows = [[] for _ in pipelines]
+    for m, ts, te in zip(owner[0::2], t_edge[0::2], t_edge[1::2]):
+        if open_start[m] and ts <= dt[0]:
+            ts = 0.0
+        if open_end[m] and te >= dt[-1]:
+            te = t_end - t_start
+
+        windows[m].append((t_start + float(ts), t_start + float(te)))
+
+    return windows
+
+
+def find_access_windows(tle: TLE, center_ecef: np.ndarray,
+                        constraints: bdm.AccessConstraints,
+                        constraint_list: typing.List[str],
+                        t_start: Epoch, t_end: Epoch,
+                        timestep: float = 120.0, tol: float = 1e-3,
+                        **kwargs) -> typing.List[typing.Tuple[Epoch, Epoch]]:
+    '''Find all windows over the period `t_start` to `t_end` during which the
+    access constraints are satisfied.
+
+    Constraints are evaluated on a grid of spacing `timestep` spanning the
+    search period, transitions are located from the changes in the resulting
+    mask, and the bracketed boundaries are then refined together to within
+    `tol`. Windows open at the start or end of the search period are extended
+    outside of it until they close, by at most one orbital period. Windows
+    still open after the extension are clipped to the search period.
+
+    Args:
+        tle (:obj:`Union[TLE, Ephemeris]`): TLE or Ephemeris object.
+        center_ecef (np.ndarray): Center location to compute access constraints with respect to.
+        constraints (:obj:`AccessConstraints`): Constraint object
+        constraint_list (List[str]): List of constraint functions to apply to check for access
+        t_start (:obj:`Epoch`): Start of search window.
+        t_end (:obj:`Epoch`): End of search window.
+        timestep (float, Default: 120): Grid spacing of search. Windows shorter
+            than this may be missed.
+        tol (float, Default: 1e-3): Time tolerance for constraint boundaries.
+        kwargs (dict): Accepts keyword arguments passed to constraint function
+
+    Returns:
+        List[Tuple[Epoch, Epoch]]: Start and end of each access window.
+    '''
+
+    pipeline = AccessConstraintPipeline(center_ecef, constraints, constraint_list, **kwargs)
+
+    return _find_windows(tle, [pipeline], t_start, t_end, timestep=timestep, tol=tol)[0]
+
+
+def _location_constraints(geojson: bdm.GeoJSONObject, request: bdm.Request = None):
+    '''Get the access constraints which apply to a location.
+
+    Args:
+        geojson (:obj:`Union[Station, Tile]`): Location object. Tile or Station
+        request (:obj:`Request`): Request. Only required if input GeoJSON is `Tile`
+
+    Returns:
+        Tuple[AccessConstraints, List[str]]: Constraint settings and list of
+            constraint functions to apply.
+    '''
 
     # Set search window based on request window
     if type(geojson) == bdm.Tile:
-        request = kwargs.get('request', None)
-
         if not request:
             raise ValueError(f'Missing kwarg "request"')
 
@@ -359,13 +864,113 @@ def find_location_accesses(spacecraft: bdm.Spacecraft, geojson: bdm.GeoJSONObjec
     else:
         raise ValueError(f'No constraint list defined for geojson input of type {type(geojson)}. Must be Tile or GroundStation.')
 
-    # Add Auxiliary Variables to kwargs
-    kwargs['spacecraft_id'] = spacecraft.id
+    return constraints, constraint_list
+
+
+def _location_opportunities(spacecraft: bdm.Spacecraft, geojson: bdm.GeoJSONObject,
+                            windows: typing.List[typing.Tuple[Epoch, Epoch]],
+                            T: float, t_start: Epoch, orbit_fraction: float = 0.75,
+                            request: bdm.Request = None) -> bdm.OpportunitySet:
+    '''Create the opportunities of access windows to a location.
+
+    Args:
+        spacecraft (:obj:`Spacecraft`): Spacecraft object.
+        geojson (:obj:`Union[Station, Tile]`): Location object. Tile or Station
+        windows (List[Tuple[Epoch, Epoch]]): Start and end of each access window.
+        T (float): Orbital period of spacecraft. Units: [s]
+        t_start (:obj:`Epoch`): Reference epoch of the opportunity set.
+        orbit_fraction (float, Default: 0.75): Minimum separation of access start times as a fraction of the orbital period.
+        request (:obj:`Request`): Request. Only required if input GeoJSON is `Tile`
+
+    Returns:
+        OpportunitySet: `Contact` or `Collect` opportunities.
+    '''
+
+    tle = spacecraft.tle
+
+    # Skip accesses starting within orbit fraction of the previous access
+    accepted = []
+    for collect_ts, collect_te in windows:
+        if accepted and (collect_ts - t_start) - accepted[-1][0] < orbit_fraction * T:
+            continue
+
+        accepted.append((collect_ts - t_start, collect_te - t_start))
+
+    dt_start = np.array([ts for ts, _ in accepted], dtype=float)
+    dt_end = np.array([te for _, te in accepted], dtype=float)
+
+    # Create Collect Properties
     if type(geojson) == bdm.Tile:
-        kwargs['tile'] = geojson
+        # Adjust t_start / t_end based on request properites
+        dt_mid = dt_start + (dt_end - dt_start)/2.0
+        dt_start = dt_mid - request.properties.collect_duration/2.0
+        dt_end = dt_mid + request.properties.collect_duration/2.0
+
+    # Compute Opportunity Properties
+    properties = {}
+    if len(accepted) > 0:
+        properties = _access_property_columns(tle, geojson.center_ecef, t_start, dt_start, dt_end)
 
-    # Set start time as initial Epoch
-    epc = copy.deepcopy(t_start)
+    return bdm.OpportunitySet.from_windows(t_start, spacecraft.id, geojson, dt_start, dt_end,
+                                           properties, request=request)
+
+
+def find_location_accesses(spacecraft: bdm.Spacecraft, geojson: bdm.GeoJSONObject,
+                           t_start: Epoch, t_end: Epoch,
+                           timestep: float = 120.0, tol: float = 1e-3,
+                           orbit_fraction: float = 0.75, **kwargs):
+    '''Final all opportunities for accesses over the period `t_start` to `t_end`. 
+    Accepts either `Station` or `Tile` as primary inputs and returns `Contact`
+    or `Collect` respectively.
+
+    Args:
+        spacecraft (:obj:`Spacecraft`): Spacecraft object.
+        geojson (:obj:`Union[Station, Tile]`): Location object with center_point for access. Tile or Station
+        t_start (:obj:`Epoch`): Start of window for access computation. GPS Time.
+        t_end (:obj:`Epoch`): End of window for access computation. GPS Time.
+        timestep (float, Default: 120): timestep for search
+        tol (float, Default: 1e-3): Time tolerance for constraint boundaries.
+        orbit_fraction (float, Default: 0.75): Minimum separation of access start times as a fraction of the orbital period.
+            Accesses starting sooner after the previous access are discarded.
+        request (:obj:`Request`): Request. Only required if input GeoJSON is `Tile`
+        kwargs (dict): Accepts keyword arguments passed to constraint function.
+
+    Returns:
+        List[Union[Contact, Collect]]: `Contact` or `Collect` opportunities.
+    '''
+
+    return find_accesses([spacecraft], [geojson], t_start, t_end, timestep=timestep,
+                         tol=tol, orbit_fraction=orbit_fraction, **kwargs)
+
+
+def _spacecraft_accesses(spacecraft: bdm.Spacecraft,
+                         locations: typing.List[bdm.GeoJSONObject],
+                         location_requests: typing.List[bdm.Request],
+                         t_start: Epoch, t_end: Epoch,
+                         timestep: float = 120.0, tol: float = 1e-3,
+                         orbit_fraction: float = 0.75,
+                         states: np.ndarray = None, **kwargs):
+    '''Find all opportunities for accesses of one spacecraft to multiple
+    locations.
+
+    Args:
+        spacecraft (:obj:`Spacecraft`): Spacecraft object.
+        locations (List[:obj:`Union[Station, Tile]`]): Location objects. Tile or Station
+        location_requests (List[:obj:`Request`]): Request of each location. `None` for stations.
+        t_start (:obj:`Epoch`): Start of window for access computation.
+        t_end (:obj:`Epoch`): End of window for access computation.
+        timestep (float, Default: 120): timestep for search
+        tol (float, Default: 1e-3): Time tolerance for constraint boundaries.
+        orbit_fraction (float, Default: 0.75): Minimum separation of access start times as a fraction of the orbital period.
+        states (np.ndarray, optional): Spacecraft ECEF (ITRF) states on the
+            search grid. Propagated if not provided.
+        kwargs (dict): Accepts keyword arguments passed to constraint function.
+
+    Returns:
+        OpportunitySet: `Contact` or `Collect` opportunities ordered by location.
+    '''
+
+    opportunities = []
 
     # SGP TLE Propagator
     tle = spacecraft.tle
@@ -373,66 +978,134 @@ def find_location_accesses(spacecraft: bdm.Spacecraft, geojson: bdm.GeoJSONObjec
     # Compute orbital period
     T = orbital_period(sCARTtoOSC(tle.state_gcrf(t_start), use_degrees=True)[0])
 
-    while epc < t_end:
+    # Resolve constraints of all locations
+    pipelines = []
+    for geojson, request in zip(locations, location_requests):
+        constraints, constraint_list = _location_constraints(geojson, request)
 
-        # Compute satellite state in pseudo-earth-fixed fame
-        x_ecef = tle.state_itrf(epc)
+        # Add Auxiliary Variables to kwargs
+        location_kwargs = dict(kwargs, spacecraft_id=spacecraft.id)
+        if type(geojson) == bdm.Tile:
+            location_kwargs['request'] = request
+            location_kwargs['tile'] = geojson
 
-        if access_constraints(epc, x_ecef, geojson.center_ecef, constraints, constraint_list, **kwargs):
-
-            # Search for AOS (before initial guess epoch)
-            collect_ts = find_geometric_constraint_boundary(tle, geojson.center_ecef,
-                constraints, constraint_list, epc, timestep=-timestep, tol=tol, **kwargs
-            )
-
-            collect_te = find_geometric_constraint_boundary(tle, geojson.center_ecef,
-                constraints, constraint_list, epc, timestep=timestep, tol=tol, **kwargs
-            )
-
-            # Create Collect Properties
-            if type(geojson) == bdm.Tile:
-                # Adjust t_start / t_end based on request properites
-                collect_tm = collect_ts + (collect_te - collect_ts)/2.0
-                collect_ts = collect_tm - request.properties.collect_duration/2.0
-                collect_te = collect_tm + request.properties.collect_duration/2.0
-
-            # Compute Opportunity Properties
-            access_properties = compute_access_properties(tle, geojson.center_ecef, collect_ts, collect_te)
-
-            # Create opportunity object
-            opportunity = None
-            if type(geojson) == bdm.Tile:
-                opportunity = bdm.Collect(
-                    center=geojson.center.tolist(),
-                    center_ecef=geojson.center_ecef.tolist(),
-                    t_start=collect_ts.to_datetime(tsys='UTC'),
-                    t_end=collect_te.to_datetime(tsys='UTC'),
-                    spacecraft_id=spacecraft.id,
-                    access_properties=access_properties,
-                    tile_id=geojson.tile_id,
-                    tile_group_id=geojson.tile_group_id,
-                    request_id=request.request_id,
-                )
-
-            elif type(geojson) == bdm.Station:
-                
-                opportunity = bdm.Contact(
-                    center=geojson.center.tolist(),
-                    center_ecef=geojson.center_ecef.tolist(),
-                    t_start=collect_ts.to_datetime(tsys='UTC'),
-                    t_end=collect_te.to_datetime(tsys='UTC'),
-                    spacecraft_id=spacecraft.id,
-                    access_properties=access_properties,
-                    station_id=geojson.station_id,
-                    station_name=geojson.station_name,
-                )
-
-            # Add opportunity to constraints
-            opportunities.append(opportunity)
-
-            # Step fraction of an orbit
-            epc += orbit_fraction * T
-        else:
-            epc += timestep
+        pipelines.append(AccessConstraintPipeline(geojson.center_ecef, constraints, constraint_list, **location_kwargs))
+
+    # Find all access windows in search period
+    windows = _find_windows(tle, pipelines, t_start, t_end, timestep=timestep, tol=tol, states=states,
+                            max_extension=T)
+
+    for geojson, request, location_windows in zip(locations, location_requests, windows):
+        opportunities.append(_location_opportunities(spacecraft, geojson, location_windows, T, t_start,
+                                                     orbit_fraction=orbit_fraction, request=request))
+
+    return bdm.OpportunitySet.concatenate(opportunities, epoch=t_start)
+
+
+def _location_requests(locations: typing.List[bdm.GeoJSONObject],
+                       requests: typing.List[bdm.Request] = None,
+                       request: bdm.Request = None) -> typing.List[bdm.Request]:
+    '''Match tile locations with their requests.
+
+    Args:
+        locations (List[:obj:`Union[Station, Tile]`]): Location objects. Tile or Station
+        requests (List[:obj:`Request`]): Requests of all `Tile` locations.
+        request (:obj:`Request`): Request used for `Tile` locations not found in `requests`.
+
+    Returns:
+        List[:obj:`Request`]: Request of each location. `None` for stations.
+    '''
+
+    requests_by_id = {r.request_id: r for r in (requests or [])}
+
+    location_requests = []
+    for geojson in locations:
+        location_request = None
+        if type(geojson) == bdm.Tile:
+            location_request = requests_by_id.get(geojson.request_id, request)
+
+        # Validate location inputs
+        _location_constraints(geojson, location_request)
+
+        location_requests.append(location_request)
+
+    return location_requests
+
+
+def find_access_set(spacecraft: typing.List[bdm.Spacecraft],
+                    locations: typing.List[bdm.GeoJSONObject],
+                    t_start: Epoch, t_end: Epoch,
+                    timestep: float = 120.0, tol: float = 1e-3,
+                    orbit_fraction: float = 0.75,
+                    requests: typing.List[bdm.Request] = None, **kwargs) -> bdm.OpportunitySet:
+    '''Find all opportunities for accesses of every spacecraft to every
+    location over the period `t_start` to `t_end`. Returns the same
+    opportunities as `find_accesses` as a columnar `OpportunitySet`, without
+    creating a model of each opportunity.
+
+    Args:
+        spacecraft (List[:obj:`Spacecraft`]): Spacecraft objects.
+        locations (List[:obj:`Union[Station, Tile]`]): Location objects with center_point for access. Tile or Station
+        t_start (:obj:`Epoch`): Start of window for access computation. GPS Time.
+        t_end (:obj:`Epoch`): End of window for access computation. GPS Time.
+        timestep (float, Default: 120): timestep for search
+        tol (float, Default: 1e-3): Time tolerance for constraint boundaries.
+        orbit_fraction (float, Default: 0.75): Minimum separation of access start times as a fraction of the orbital period.
+            Accesses starting sooner after the previous access are discarded.
+        requests (List[:obj:`Request`]): Requests of all `Tile` locations.
+        request (:obj:`Request`): Request used for `Tile` locations not found in `requests`.
+        kwargs (dict): Accepts keyword arguments passed to constraint function.
+
+    Returns:
+        OpportunitySet: `Contact` or `Collect` opportunities, ordered by
+            spacecraft and then location. Times are relative to `t_start`.
+    '''
+
+    opportunities = []
+
+    # Assert time types as epochs
+    t_start = Epoch(t_start, time_system='UTC')
+    t_end = Epoch(t_end, time_system='UTC')
+
+    # Match tiles with their requests
+    location_requests = _location_requests(locations, requests, kwargs.get('request', None))
+
+    for sc in spacecraft:
+        opportunities.append(_spacecraft_accesses(sc, locations, location_requests, t_start, t_end,
+                                                  timestep=timestep, tol=tol,
+                                                  orbit_fraction=orbit_fraction, **kwargs))
+
+    return bdm.OpportunitySet.concatenate(opportunities, epoch=t_start)
+
+
+def find_accesses(spacecraft: typing.List[bdm.Spacecraft],
+                  locations: typing.List[bdm.GeoJSONObject],
+                  t_start: Epoch, t_end: Epoch,
+                  timestep: float = 120.0, tol: float = 1e-3,
+                  orbit_fraction: float = 0.75,
+                  requests: typing.List[bdm.Request] = None, **kwargs):
+    '''Find all opportunities for accesses of every spacecraft to every
+    location over the period `t_start` to `t_end`. Equivalent to calling
+    `find_location_accesses` for each pair, but each spacecraft is only
+    propagated once for all locations.
+
+    Args:
+        spacecraft (List[:obj:`Spacecraft`]): Spacecraft objects.
+        locations (List[:obj:`Union[Station, Tile]`]): Location objects with center_point for access. Tile or Station
+        t_start (:obj:`Epoch`): Start of window for access computation. GPS Time.
+        t_end (:obj:`Epoch`): End of window for access computation. GPS Time.
+        timestep (float, Default: 120): timestep for search
+        tol (float, Default: 1e-3): Time tolerance for constraint boundaries.
+        orbit_fraction (float, Default: 0.75): Minimum separation of access start times as a fraction of the orbital period.
+            Accesses starting sooner after the previous access are discarded.
+        requests (List[:obj:`Request`]): Requests of all `Tile` locations.
+        request (:obj:`Request`): Request used for `Tile` locations not found in `requests`.
+        kwargs (dict): Accepts keyword arguments passed to constraint function.
+
+    Returns:
+        List[Union[Contact, Collect]]: `Contact` or `Collect` opportunities,
+            ordered by spacecraft and then location.
+    '''
 
-    return opportunities
+    return find_access_set(spacecraft, locations, t_start, t_end, timestep=timestep, tol=tol,
+                           orbit_fraction=orbit_fraction, requests=requests, **kwargs).to_list()
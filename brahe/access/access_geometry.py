@@ -7,7 +7,8 @@ import numpy as np
 import brahe.data_models as bdm
 from brahe.utils import fcross
 from brahe.constants import RAD2DEG
-from brahe.coordinates import sECEFtoENZ, sENZtoAZEL, sECEFtoGEOD, sGEODtoECEF
+from brahe.coordinates import sECEFtoENZ, sENZtoAZEL, sECEFtoGEOD, sGEODtoECEF, rECEFtoENZ, \
+    sECEFtoGEOD_batch, sENZtoAZEL_batch
 from brahe.relative_coordinates import rCARTtoRTN
 
 
@@ -175,4 +176,130 @@ def look_direction(sat_ecef: np.ndarray,
     if np.sign(cp[0]) < 0:
         return bdm.LookDirection.right
     else:
-        return bdm.LookDirection.left
\ No newline at end of file
+        return bdm.LookDirection.left
+
+
+def _geodetic_normal(r_ecef: np.ndarray) -> np.ndarray:
+    '''Compute the unit normal of the WGS84 ellipsoid passing through each
+    position.
+
+    Args:
+        r_ecef (:obj:`np.ndarray`): Positions in the ECEF frame with shape (N, 3).
+
+    Returns:
+        np.ndarray: Outward geodetic normal at each position with shape (N, 3).
+    '''
+
+    geod = sECEFtoGEOD_batch(r_ecef)
+    lon, lat = geod[:, 0], geod[:, 1]
+
+    return np.stack((np.cos(lat)*np.cos(lon), np.cos(lat)*np.sin(lon), np.sin(lat)), axis=-1)
+
+
+def azelrng_batch(sat_ecef: np.ndarray,
+                  loc_ecef: np.ndarray,
+                  use_degrees: bool = True,
+                  loc_enz: np.ndarray = None) -> np.ndarray:
+    '''Compute satellite azimuth, elevation, and range as viewed from the
+    specified location for multiple satellite states.
+
+    Args:
+        sat_ecef (:obj:`np.ndarray`): Satellite positions in the ECEF frame with shape (N, 3) or (N, 6).
+        loc_ecef (:obj:`np.ndarray`): Location in ECEF (ITRF) frame.
+        use_degrees (:obj:`bool`, optional): Return output in degrees. Default: `True`
+        loc_enz (:obj:`np.ndarray`, optional): ECEF to ENZ rotation of the
+            location. Computed from `loc_ecef` if not provided.
+
+    Returns:
+        np.ndarray: azimuth elevation and range with shape (N, 3) [deg, deg, m]
+    '''
+
+    # Ensure np-ness
+    sat_ecef = np.asarray(sat_ecef).reshape(-1, np.shape(sat_ecef)[-1])
+    loc_ecef = np.asarray(loc_ecef)
+
+    # Compute Satellite Positions in ENZ frame
+    E = loc_enz if loc_enz is not None else rECEFtoENZ(loc_ecef[0:3], conversion='geodetic')
+    sat_enz = (sat_ecef[:, 0:3] - loc_ecef[0:3]) @ E.T
+
+    return sENZtoAZEL_batch(sat_enz, use_degrees=use_degrees)
+
+
+def look_angle_batch(sat_ecef: np.ndarray, loc_ecef: np.ndarray,
+                     use_degrees: bool = True) -> np.ndarray:
+    '''Compute the look angle between the satellite and the specific location
+    for multiple satellite states.
+
+    Args:
+        sat_ecef (:obj:`np.ndarray`): Satellite positions in the ECEF frame with shape (N, 3) or (N, 6).
+        loc_ecef (:obj:`np.ndarray`): Location in ECEF (ITRF) frame.
+        use_degrees (:obj:`bool`, optional): Return output in degrees. Default: `True`
+
+    Returns:
+        np.ndarray: look angles with shape (N,) [deg]
+    '''
+
+    # Ensure np-ness
+    sat_ecef = np.asarray(sat_ecef).reshape(-1, np.shape(sat_ecef)[-1])
+    loc_ecef = np.asarray(loc_ecef)
+
+    r_sat = sat_ecef[:, 0:3]
+
+    # The geodetic sub-satellite point lies along the ellipsoid normal
+    nadir_dir = -_geodetic_normal(r_sat)
+    target_dir = loc_ecef[0:3] - r_sat
+    target_dir /= np.linalg.norm(target_dir, axis=1)[:, np.newaxis]
+
+    look_angle = np.arccos(np.clip(np.sum(nadir_dir * target_dir, axis=1), -1.0, 1.0))
+
+    if use_degrees:
+        look_angle *= RAD2DEG
+
+    return look_angle
+
+
+def ascdsc_batch(sat_ecef: np.ndarray) -> np.ndarray:
+    '''Compute whether satellite is ascending or descending for multiple
+    satellite states.
+
+    Args:
+        sat_ecef (:obj:`np.ndarray`): Satellite states in the ECEF frame with shape (N, 6).
+
+    Returns:
+        np.ndarray: `bdm.AscendingDescending` state of each satellite state.
+    '''
+
+    # Ensure np-ness
+    sat_ecef = np.asarray(sat_ecef).reshape(-1, 6)
+
+    # Handle unlikely case that satellite is exaclty at 0 Z-velocity
+    ascending = (sat_ecef[:, 5] > 0) | ((sat_ecef[:, 5] == 0) & (sat_ecef[:, 2] < 0))
+
+    return np.array([bdm.AscendingDescending.descending, bdm.AscendingDescending.ascending], dtype=object)[ascending.astype(int)]
+
+
+def look_direction_batch(sat_ecef: np.ndarray,
+                         loc_ecef: np.ndarray) -> np.ndarray:
+    '''Compute the look direction for viewing the location for multiple
+    satellite states.
+
+    Args:
+        sat_ecef (:obj:`np.ndarray`): Satellite states in the ECEF frame with shape (N, 6).
+        loc_ecef (:obj:`np.ndarray`): Location in ECEF (ITRF) frame.
+
+    Returns:
+        np.ndarray: `bdm.LookDirection` of each satellite state. 'left' or 'right'
+    '''
+
+    # Ensure np-ness
+    sat_ecef = np.asarray(sat_ecef).reshape(-1, 6)
+    loc_ecef = np.asarray(loc_ecef)
+
+    # The location is to the right if the line of sight is opposite the
+    # orbit normal
+    los_ecef = loc_ecef[0:3] - sat_ecef[:, 0:3]
+    h = np.cross(sat_ecef[:, 0:3], sat_ecef[:, 3:6])
+
+    right = np.sum(los_ecef * h, axis=1) < 0
+
+    return np.array([bdm.LookDirection.left, bdm.LookDirection.right], dtype=object)[right.astype(int)]
@@ -0,0 +1,233 @@
+'''Parallel computation of access opportunities over a pool of processes.
+
+Spacecraft are propagated once over the search grid by the calling process
+and the resulting ephemerides are placed in shared memory. Work is divided
+into chunks of locations for each spacecraft which worker processes evaluate
+against the shared ephemerides. Workers return their opportunities as
+columnar `OpportunitySet` records.
+'''
+
+import logging
+import typing
+import concurrent.futures
+import multiprocessing.shared_memory
+import numpy as np
+
+import brahe.frames as _frames
+from brahe.eop import EOP as _EOP
+from brahe.epoch import Epoch
+
+import brahe.data_models as bdm
+from . import access as acc
+
+
+logger = logging.getLogger(__name__)
+
+# Ephemerides attached by each worker process
+_WORKER_EPHEMERIDES = None
+
+
+def _attach_ephemerides(name: str, shape: typing.Tuple[int, ...]):
+    '''Attach worker process to shared ephemerides.
+
+    Args:
+        name (str): Name of shared memory block.
+        shape (Tuple[int, ...]): Shape of ephemerides array.
+    '''
+
+    global _WORKER_EPHEMERIDES
+
+    # The calling process owns the block and is responsible for removing it
+    shm = multiprocessing.shared_memory.SharedMemory(name=name)
+
+    ephemerides = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+    ephemerides.flags.writeable = False
+
+    _WORKER_EPHEMERIDES = (shm, ephemerides)
+
+
+def _initialize_worker(name: str, shape: typing.Tuple[int, ...], eop_data: np.ndarray, precision: str):
+    '''Initialize worker process with the Earth orientation data and frame
+    precision of the calling process, and attach it to shared ephemerides.
+    Worker processes which are spawned rather than forked would otherwise use
+    the default Earth orientation data and frame precision when refining
+    constraint boundaries.
+
+    Args:
+        name (str): Name of shared memory block.
+        shape (Tuple[int, ...]): Shape of ephemerides array.
+        eop_data (np.ndarray): Earth orientation data of the calling process.
+        precision (str): Frame precision of the calling process.
+    '''
+
+    _EOP._data = eop_data
+    _EOP._initialized = True
+
+    _frames.set_frame_precision(precision)
+
+    _attach_ephemerides(name, shape)
+
+
+def _accesses_worker(task):
+    '''Compute the accesses of one spacecraft to a chunk of locations using
+    the shared ephemerides.
+
+    Args:
+        task (tuple): Spacecraft index, spacecraft, locations, location
+            requests, and arguments of `_spacecraft_accesses`.
+
+    Returns:
+        Tuple[np.ndarray, List[int]]: Records of `Contact` or `Collect`
+            opportunities, and the index in the chunk of each location the
+            records reference.
+    '''
+
+    sc_idx, spacecraft, locations, location_requests, t_start, t_end, options, kwargs = task
+
+    _, ephemerides = _WORKER_EPHEMERIDES
+
+    opportunities = acc._spacecraft_accesses(spacecraft, locations, location_requests, t_start, t_end,
+                                             states=ephemerides[sc_idx], **options, **kwargs)
+
+    # Locations are returned by index so they are not copied back to the
+    # calling process
+    index = {id(location): k for k, location in enumerate(locations)}
+
+    return opportunities.records, [index[id(location)] for location in opportunities.locations]
+
+
+def find_access_set_parallel(spacecraft: typing.List[bdm.Spacecraft],
+                             locations: typing.List[bdm.GeoJSONObject],
+                             t_start: Epoch, t_end: Epoch,
+                             timestep: float = 120.0, tol: float = 1e-3,
+                             orbit_fraction: float = 0.75,
+                             requests: typing.List[bdm.Request] = None,
+                             max_workers: int = None, chunk_size: int = 256,
+                             **kwargs) -> bdm.OpportunitySet:
+    '''Find all opportunities for accesses of every spacecraft to every
+    location over the period `t_start` to `t_end` using a pool of worker
+    processes. Returns the same opportunities, in the same order, as
+    `find_access_set`.
+
+    Args:
+        spacecraft (List[:obj:`Spacecraft`]): Spacecraft objects.
+        locations (List[:obj:`Union[Station, Tile]`]): Location objects with center_point for access. Tile or Station
+        t_start (:obj:`Epoch`): Start of window for access computation. GPS Time.
+        t_end (:obj:`Epoch`): End of window for access computation. GPS Time.
+        timestep (float, Default: 120): timestep for search
+        tol (float, Default: 1e-3): Time tolerance for constraint boundaries.
+        orbit_fraction (float, Default: 0.75): Minimum separation of access start times as a fraction of the orbital period.
+            Accesses starting sooner after the previous access are discarded.
+        requests (List[:obj:`Request`]): Requests of all `Tile` locations.
+        max_workers (int, optional): Number of worker processes. Defaults to
+            the number of processors.
+        chunk_size (int, Default: 256): Number of locations evaluated by a
+            worker in a single task.
+        request (:obj:`Request`): Request used for `Tile` locations not found in `requests`.
+        kwargs (dict): Accepts keyword arguments passed to constraint function.
+
+    Returns:
+        OpportunitySet: `Contact` or `Collect` opportunities, ordered by
+            spacecraft and then location. Times are relative to `t_start`.
+    '''
+
+    if chunk_size < 1:
+        raise RuntimeError(f'Invalid chunk size {chunk_size}. Must be at least 1.')
+
+    # Assert time types as epochs
+    t_start = Epoch(t_start, time_system='UTC')
+    t_end = Epoch(t_end, time_system='UTC')
+
+    # Match tiles with their requests
+    location_requests = acc._location_requests(locations, requests, kwargs.get('request', None))
+
+    dt = acc._search_grid(t_start, t_end, timestep)
+
+    if len(spacecraft) == 0 or len(locations) == 0 or len(dt) == 0:
+        return acc.find_access_set(spacecraft, locations, t_start, t_end, timestep=timestep, tol=tol,
+                                   orbit_fraction=orbit_fraction, requests=requests, **kwargs)
+
+    options = {'timestep': timestep, 'tol': tol, 'orbit_fraction': orbit_fraction}
+
+    shape = (len(spacecraft), len(dt), 6)
+    shm = multiprocessing.shared_memory.SharedMemory(create=True, size=int(np.prod(shape)) * 8)
+
+    try:
+        # Propagate each spacecraft once over the search grid
+        ephemerides = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+        for k, sc in enumerate(spacecraft):
+            tle = sc.tle
+            ephemerides[k] = tle.states_itrf(dt, epoch=t_start)
+
+        # Tasks are ordered by spacecraft and then location
+        tasks = []
+        offsets = []
+        for k, sc in enumerate(spacecraft):
+            for i in range(0, len(locations), chunk_size):
+                tasks.append((k, sc, locations[i:i + chunk_size], location_requests[i:i + chunk_size],
+                              t_start, t_end, options, kwargs))
+                offsets.append(i)
+
+        logger.debug(f'Computing accesses for {len(spacecraft)} spacecraft and {len(locations)} locations in {len(tasks)} tasks.')
+
+        # Workers use the same Earth orientation data and frame precision
+        _EOP._initialize()
+        initargs = (shm.name, shape, np.array(_EOP._data), _frames.frame_precision())
+
+        opportunities = []
+        with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers,
+                                                    initializer=_initialize_worker,
+                                                    initargs=initargs) as executor:
+            for i, (records, index) in zip(offsets, executor.map(_accesses_worker, tasks)):
+                # Each location with opportunities references its request
+                task_locations = [locations[i + k] for k in index]
+                task_requests = [location_requests[i + k] for k in index if location_requests[i + k] is not None]
+
+                opportunities.append(bdm.OpportunitySet(t_start, records, task_locations, task_requests))
+
+        del ephemerides
+    finally:
+        shm.close()
+        shm.unlink()
+
+    return bdm.OpportunitySet.concatenate(opportunities, epoch=t_start)
+
+
+def find_accesses_parallel(spacecraft: typing.List[bdm.Spacecraft],
+                           locations: typing.List[bdm.GeoJSONObject],
+                           t_start: Epoch, t_end: Epoch,
+                           timestep: float = 120.0, tol: float = 1e-3,
+                           orbit_fraction: float = 0.75,
+                           requests: typing.List[bdm.Request] = None,
+                           max_workers: int = None, chunk_size: int = 256,
+                           **kwargs):
+    '''Find all opportunities for accesses of every spacecraft to every
+    location over the period `t_start` to `t_end` using a pool of worker
+    processes. Returns the same opportunities, in the same order, as
+    `find_accesses`.
+
+    Args:
+        spacecraft (List[:obj:`Spacecraft`]): Spacecraft objects.
+        locations (List[:obj:`Union[Station, Tile]`]): Location objects with center_point for access. Tile or Station
+        t_start (:obj:`Epoch`): Start of window for access computation. GPS Time.
+        t_end (:obj:`Epoch`): End of window for access computation. GPS Time.
+        timestep (float, Default: 120): timestep for search
+        tol (float, Default: 1e-3): Time tolerance for constraint boundaries.
+        orbit_fraction (float, Default: 0.75): Minimum separation of access start times as a fraction of the orbital period.
+            Accesses starting sooner after the previous access are discarded.
+        requests (List[:obj:`Request`]): Requests of all `Tile` locations.
+        max_workers (int, optional): Number of worker processes. Defaults to
+            the number of processors.
+        chunk_size (int, Default: 256): Number of locations evaluated by a
+            worker in a single task.
+        request (:obj:`Request`): Request used for `Tile` locations not found in `requests`.
+        kwargs (dict): Accepts keyword arguments passed to constraint function.
+
+    Returns:
+        List[Union[Contact, Collect]]: `Contact` or `Collect` opportunities,
+            ordered by spacecraft and then location.
+    '''
+
+    return find_access_set_parallel(spacecraft, locations, t_start, t_end, timestep=timestep, tol=tol,
+                                    orbit_fraction=orbit_fraction, requests=requests,
+                                    max_workers=max_workers, chunk_size=chunk_size, **kwargs).to_list()
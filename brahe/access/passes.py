@@ -0,0 +1,279 @@
+'''Analytic pass prediction of spacecraft over ground stations.
+
+Elevation of a spacecraft above a station is a smooth function of time with
+one maximum per pass. Rather than stepping through the search period and
+bisecting the boundaries of the elevation mask, the time of closest approach
+(TCA) of every pass is found as a root of the elevation rate, which is
+computed directly from the Earth-fixed spacecraft velocity. The acquisition
+(AOS) and loss of signal (LOS) are then the crossings of the minimum
+elevation on either side of the TCA. All roots are refined with bracketed
+Newton iterations, evaluated for all passes together in a single propagation
+per iteration.
+
+Since every extremum of elevation is located, a pass is found whenever its
+maximum elevation exceeds the minimum, no matter how short the pass is.
+'''
+
+import logging
+import typing
+import numpy as np
+
+from brahe.epoch import Epoch
+from brahe.tle import TLE
+from brahe.coordinates import rECEFtoENZ
+from brahe.astro import orbital_period, sCARTtoOSC
+from brahe.constants import DEG2RAD
+
+import brahe.data_models as bdm
+from . import access as acc
+
+
+logger = logging.getLogger(__name__)
+
+# Step used to difference the elevation rate. Units: [s]
+_RATE_STEP = 0.01
+
+
+def elevation_rate(tle: TLE, t_start: Epoch, dt: np.ndarray,
+                   loc_ecef: np.ndarray, loc_enz: np.ndarray = None) -> typing.Tuple[np.ndarray, np.ndarray]:
+    '''Compute the elevation and elevation rate of a spacecraft as viewed from
+    a fixed location.
+
+    Args:
+        tle (:obj:`Union[TLE, Ephemeris]`): TLE or Ephemeris object.
+        t_start (:obj:`Epoch`): Reference epoch of times.
+        dt (np.ndarray): Elapsed time since `t_start`. Units: [s]
+        loc_ecef (:obj:`np.ndarray`): Location ECEF (ITRF) position.
+        loc_enz (:obj:`np.ndarray`, optional): ECEF to ENZ rotation of the location.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Elevation and elevation rate. Units: [rad] and [rad/s]
+    '''
+
+    loc_ecef = np.asarray(loc_ecef, dtype=float)[0:3]
+
+    if loc_enz is None:
+        loc_enz = rECEFtoENZ(loc_ecef)
+
+    states = tle.states_itrf(np.asarray(dt, dtype=float), epoch=t_start)
+
+    # Range and range rate in the topocentric frame. The location is fixed in
+    # the Earth-fixed frame so the range rate is the spacecraft velocity.
+    rho = (states[:, 0:3] - loc_ecef) @ loc_enz.T
+    rho_dot = states[:, 3:6] @ loc_enz.T
+
+    s = np.linalg.norm(rho, axis=1)
+    s_dot = np.sum(rho*rho_dot, axis=1)/s
+
+    sin_el = rho[:, 2]/s
+    el = np.arcsin(np.clip(sin_el, -1.0, 1.0))
+    el_dot = (rho_dot[:, 2] - sin_el*s_dot)/(s*np.cos(el))
+
+    return el, el_dot
+
+
+def _bracketed_newton(func: typing.Callable, t_lo: np.ndarray, t_hi: np.ndarray,
+                      f_lo: np.ndarray, f_hi: np.ndarray, tol: float = 1e-3,
+                      max_iter: int = 50) -> np.ndarray:
+    '''Find the roots of a function in multiple brackets with Newton iterations.
+    Steps leaving the bracket are replaced by bisection so every root is
+    always retained.
+
+    Args:
+        func (Callable): Function returning the value and derivative at each time.
+        t_lo (np.ndarray): Lower bound of each bracket. Units: [s]
+        t_hi (np.ndarray): Upper bound of each bracket. Units: [s]
+        f_lo (np.ndarray): Function value at the lower bound of each bracket.
+        f_hi (np.ndarray): Function value at the upper bound of each bracket.
+        tol (float): Time tolerance of roots.
+        max_iter (int): Maximum number of iterations.
+
+    Returns:
+        np.ndarray: Time of each root. Units: [s]
+    '''
+
+    t_lo = np.array(t_lo, dtype=float)
+    t_hi = np.array(t_hi, dtype=float)
+    s_lo = np.sign(f_lo)
+
+    # Initial guess by linear interpolation
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = t_lo - f_lo*(t_hi - t_lo)/(f_hi - f_lo)
+    t = np.where(np.isfinite(t), t, (t_lo + t_hi)/2.0)
+
+    active = np.arange(len(t))
+
+    for _ in range(max_iter):
+        if len(active) == 0:
+            break
+
+        f, f_dot = func(t[active])
+
+        # Shrink brackets
+        same = np.sign(f) == s_lo[active]
+        t_lo[active] = np.where(same, t[active], t_lo[active])
+        t_hi[active] = np.where(same, t_hi[active], t[active])
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t_new = t[active] - f/f_dot
+
+        outside = ~np.isfinite(t_new) | (t_new <= t_lo[active]) | (t_new >= t_hi[active])
+        t_new = np.where(outside, (t_lo[active] + t_hi[active])/2.0, t_new)
+
+        converged = (np.abs(t_new - t[active]) <= tol) | (f == 0.0) | \
+                    (t_hi[active] - t_lo[active] <= tol)
+
+        t[active] = t_new
+        active = active[~converged]
+
+    return t
+
+
+def predict_passes(tle: TLE, loc_ecef: np.ndarray, t_start: Epoch, t_end: Epoch,
+                   elevation_min: float = 0.0, steps_per_orbit: int = 16,
+                   tol: float = 1e-3) -> typing.List[typing.Tuple[Epoch, Epoch, Epoch]]:
+    '''Predict all passes of a spacecraft over a location in the period
+    `t_start` to `t_end`.
+
+    The elevation rate is sampled on a coarse grid of `steps_per_orbit`
+    points per orbital period to bracket every extremum of elevation. The
+    extrema are refined by Newton iterations on the elevation rate, and the
+    crossings of `elevation_min` between consecutive extrema by Newton
+    iterations on the elevation. Passes in progress at the start or end of the
+    search period are extended outside of it until they close.
+
+    Args:
+        tle (:obj:`Union[TLE, Ephemeris]`): TLE or Ephemeris object.
+        loc_ecef (:obj:`np.ndarray`): Location ECEF (ITRF) position.
+        t_start (:obj:`Epoch`): Start of search window.
+        t_end (:obj:`Epoch`): End of search window.
+        elevation_min (float, Default: 0.0): Minimum elevation of pass. Units: [deg]
+        steps_per_orbit (int, Default: 16): Number of grid points per orbital
+            period used to bracket extrema of elevation.
+        tol (float, Default: 1e-3): Time tolerance of AOS, TCA, and LOS.
+
+    Returns:
+        List[Tuple[Epoch, Epoch, Epoch]]: AOS, TCA, and LOS of each pass.
+    '''
+
+    if steps_per_orbit < 4:
+        raise RuntimeError(f'Invalid number of steps per orbit {steps_per_orbit}. Must be at least 4.')
+
+    t_start = Epoch(t_start, time_system='UTC')
+    t_end = Epoch(t_end, time_system='UTC')
+
+    loc_ecef = np.asarray(loc_ecef, dtype=float)[0:3]
+    loc_enz = rECEFtoENZ(loc_ecef)
+    el_min = elevation_min*DEG2RAD
+
+    if t_end - t_start <= 0.0:
+        return []
+
+    # Pad the search grid by half an orbit so passes open at either end of the
+    # search period are bracketed
+    T = orbital_period(sCARTtoOSC(tle.state_gcrf(t_start), use_degrees=True)[0])
+    step = T/steps_per_orbit
+    pad = T/2.0
+
+    n = int(np.ceil((t_end - t_start + 2*pad)/step))
+    dt = -pad + step*np.arange(n + 1)
+
+    el, el_dot = elevation_rate(tle, t_start, dt, loc_ecef, loc_enz=loc_enz)
+
+    # Extrema are bracketed by sign changes of the elevation rate
+    k = np.nonzero(np.sign(el_dot[:-1]) != np.sign(el_dot[1:]))[0]
+
+    def _rate(t):
+        _, rate = elevation_rate(tle, t_start, np.concatenate((t, t + _RATE_STEP)), loc_ecef, loc_enz=loc_enz)
+        return rate[0:len(t)], (rate[len(t):] - rate[0:len(t)])/_RATE_STEP
+
+    t_ext = _bracketed_newton(_rate, dt[k], dt[k + 1], el_dot[k], el_dot[k + 1], tol=tol)
+
+    # Elevation is monotonic between consecutive extrema and the ends of the grid
+    t_seg = np.concatenate(([dt[0]], t_ext, [dt[-1]]))
+    el_seg = np.concatenate(([el[0]], elevation_rate(tle, t_start, t_ext, loc_ecef, loc_enz=loc_enz)[0], [el[-1]]))
+
+    f_seg = el_seg - el_min
+    visible = f_seg >= 0.0
+
+    c = np.nonzero(visible[:-1] != visible[1:])[0]
+
+    def _elevation(t):
+        el, el_dot = elevation_rate(tle, t_start, t, loc_ecef, loc_enz=loc_enz)
+        return el - el_min, el_dot
+
+    t_cross = _bracketed_newton(_elevation, t_seg[c], t_seg[c + 1], f_seg[c], f_seg[c + 1], tol=tol)
+
+    # Assemble passes from rising and setting crossings. Passes still open at
+    # the ends of the padded grid are closed there.
+    rising = ~visible[c]
+    aos = list(t_cross[rising])
+    los = list(t_cross[~rising])
+
+    if visible[0]:
+        aos.insert(0, t_seg[0])
+    if visible[-1]:
+        los.append(t_seg[-1])
+
+    passes = []
+    for t_aos, t_los in zip(aos, los):
+        # Passes not overlapping search period
+        if t_los < 0.0 or t_aos > t_end - t_start:
+            continue
+
+        # Closest approach is the highest extremum of the pass
+        inside = (t_seg >= t_aos) & (t_seg <= t_los)
+        t_tca = t_seg[inside][np.argmax(el_seg[inside])] if np.any(inside) else (t_aos + t_los)/2.0
+
+        passes.append((t_start + t_aos, t_start + t_tca, t_start + t_los))
+
+    logger.debug(f'Predicted {len(passes)} passes from {len(k)} elevation extrema.')
+
+    return passes
+
+
+def find_station_contacts(spacecraft: bdm.Spacecraft, station: bdm.Station,
+                          t_start: Epoch, t_end: Epoch,
+                          steps_per_orbit: int = 16, tol: float = 1e-3,
+                          orbit_fraction: float = 0.75) -> typing.List[bdm.Contact]:
+    '''Find all contacts of a spacecraft with a ground station using analytic
+    pass prediction. Equivalent to `find_location_accesses` for stations.
+
+    Args:
+        spacecraft (:obj:`Spacecraft`): Spacecraft object.
+        station (:obj:`Station`): Ground station.
+        t_start (:obj:`Epoch`): Start of window for access computation.
+        t_end (:obj:`Epoch`): End of window for access computation.
+        steps_per_orbit (int, Default: 16): Number of grid points per orbital
+            period used to bracket extrema of elevation.
+        tol (float, Default: 1e-3): Time tolerance for contact boundaries.
+        orbit_fraction (float, Default: 0.75): Minimum separation of access start times as a fraction of the orbital period.
+
+    Returns:
+        List[Contact]: Contact opportunities.
+    '''
+
+    if type(station) != bdm.Station:
+        raise ValueError(f'Cannot predict passes for geojson input of type {type(station)}. Must be GroundStation.')
+
+    t_start = Epoch(t_start, time_system='UTC')
+    t_end = Epoch(t_end, time_system='UTC')
+
+    constraints = station.constraints
+
+    # A maximum elevation splits passes into multiple windows
+    if constraints.elevation_max < 90.0:
+        return acc.find_location_accesses(spacecraft, station, t_start, t_end, tol=tol,
+                                          orbit_fraction=orbit_fraction)
+
+    tle = spacecraft.tle
+    T = orbital_period(sCARTtoOSC(tle.state_gcrf(t_start), use_degrees=True)[0])
+
+    passes = predict_passes(tle, station.center_ecef, t_start, t_end,
+                            elevation_min=constraints.elevation_min,
+                            steps_per_orbit=steps_per_orbit, tol=tol)
+
+    windows = [(t_aos, t_los) for t_aos, _, t_los in passes]
+
+    return acc._location_opportunities(spacecraft, station, windows, T, t_start,
+                                       orbit_fraction=orbit_fraction).to_list()
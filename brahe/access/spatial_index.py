@@ -0,0 +1,145 @@
+'''Spatial index of access locations used to quickly find the locations which
+may be accessible from a given satellite state.
+'''
+
+import typing
+import numpy as np
+import scipy.spatial
+
+from brahe.constants import DEG2RAD
+
+
+def access_central_angle(r_sat: np.ndarray, r_loc: np.ndarray,
+                         elevation_min: np.ndarray = None,
+                         look_angle_max: np.ndarray = None,
+                         use_degrees: bool = True) -> np.ndarray:
+    '''Compute the maximum Earth central angle between a satellite and a
+    location at which access constraints can be satisfied, assuming a
+    spherical Earth.
+
+    Args:
+        r_sat (:obj:`np.ndarray`): Geocentric radius of satellite. Units: [m]
+        r_loc (:obj:`np.ndarray`): Geocentric radius of location. Units: [m]
+        elevation_min (:obj:`np.ndarray`, optional): Minimum elevation of
+            satellite as viewed from location. `NaN` or `None` if unconstrained.
+        look_angle_max (:obj:`np.ndarray`, optional): Maximum look angle of
+            location from satellite. `NaN` or `None` if unconstrained. Only
+            applied together with an elevation constraint.
+        use_degrees (:obj:`bool`, optional): Handle angles in degrees. Default: `True`
+
+    Returns:
+        np.ndarray: Maximum central angle. Units: [rad]
+    '''
+
+    r_sat = np.asarray(r_sat, dtype=float)
+    r_loc = np.asarray(r_loc, dtype=float)
+
+    scale = DEG2RAD if use_degrees else 1.0
+    el = np.nan if elevation_min is None else np.asarray(elevation_min, dtype=float) * scale
+    eta = np.nan if look_angle_max is None else np.asarray(look_angle_max, dtype=float) * scale
+
+    # Elevation cone
+    lam = np.arccos(np.clip(r_loc * np.cos(el) / r_sat, -1.0, 1.0)) - el
+
+    # Look angle cone. Only applies to the visible side of the Earth and if
+    # the cone intersects the Earth.
+    sin_ground = np.clip(r_sat * np.sin(np.where(np.isnan(eta), np.pi/2, eta)) / r_loc, -1.0, 1.0)
+    lam_look = np.where(np.isnan(eta) | (sin_ground >= 1.0), np.pi, np.arcsin(sin_ground) - eta)
+
+    # Without an elevation constraint any location may be accessible
+    lam = np.where(np.isnan(el), np.pi, np.minimum(lam, lam_look))
+
+    return np.clip(lam, 0.0, np.pi)
+
+
+class LocationIndex():
+    '''KD-tree index of the directions of access locations. Finds the
+    locations which may be accessible from satellite states without evaluating
+    the geometry of every satellite-location pair.
+
+    The search uses a spherical Earth model. Constraint angles are widened by
+    `margin` to account for the difference between geodetic and geocentric
+    directions so that no accessible location is excluded.
+
+    Args:
+        loc_ecef (:obj:`np.ndarray`): Location ECEF (ITRF) positions with shape (M, 3)
+        elevation_min (:obj:`np.ndarray`, optional): Minimum elevation constraint
+            of each location. `NaN` for unconstrained locations. Units: [deg]
+        look_angle_max (:obj:`np.ndarray`, optional): Maximum look angle
+            constraint of each location. `NaN` for unconstrained locations. Units: [deg]
+        margin (float): Widening of constraint angles. Units: [deg]
+    '''
+
+    def __init__(self, loc_ecef: np.ndarray, elevation_min: np.ndarray = None,
+                 look_angle_max: np.ndarray = None, margin: float = 1.0):
+
+        loc_ecef = np.asarray(loc_ecef, dtype=float).reshape(-1, 3)
+        n = len(loc_ecef)
+
+        def _per_location(value):
+            if value is None:
+                return np.full(n, np.nan)
+            return np.broadcast_to(np.asarray(value, dtype=float), (n,)).copy()
+
+        self.r_loc = np.linalg.norm(loc_ecef, axis=1)
+        self.elevation_min = _per_location(elevation_min) - margin
+        self.look_angle_max = _per_location(look_angle_max) + margin
+        self.margin = margin
+
+        self._u_loc = loc_ecef / self.r_loc[:, np.newaxis]
+        self._tree = scipy.spatial.cKDTree(self._u_loc)
+
+        # Loosest constraints over all locations bound the search radius
+        def _loosest(values, func, default):
+            return default if np.any(np.isnan(values)) else func(values)
+
+        self._r_min = np.min(self.r_loc) if n > 0 else 0.0
+        self._el_bound = _loosest(self.elevation_min, np.min, np.nan)
+        self._eta_bound = _loosest(self.look_angle_max, np.max, np.nan)
+
+    def __len__(self):
+        return len(self.r_loc)
+
+    def query(self, sat_ecef: np.ndarray) -> typing.Tuple[np.ndarray, np.ndarray]:
+        '''Find all satellite state and location pairs which may satisfy the
+        access constraints.
+
+        Args:
+            sat_ecef (:obj:`np.ndarray`): Satellite ECEF (ITRF) states with shape (N, 3) or (N, 6)
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Indices of the satellite state and
+                of the location of each candidate pair, ordered by location.
+        '''
+
+        sat_ecef = np.asarray(sat_ecef, dtype=float)
+        sat_ecef = sat_ecef.reshape(-1, sat_ecef.shape[-1])
+
+        if len(sat_ecef) == 0 or len(self) == 0:
+            return np.zeros(0, dtype=int), np.zeros(0, dtype=int)
+
+        r_sat = np.linalg.norm(sat_ecef[:, 0:3], axis=1)
+        u_sat = sat_ecef[:, 0:3] / r_sat[:, np.newaxis]
+
+        # Search all locations within the loosest constraint of each state
+        lam = access_central_angle(r_sat, self._r_min, self._el_bound, self._eta_bound)
+        chord = 2.0 * np.sin(np.minimum(lam, np.pi) / 2.0) * (1.0 + 1.0e-12)
+
+        neighbors = self._tree.query_ball_point(u_sat, chord)
+
+        counts = np.fromiter((len(n) for n in neighbors), dtype=int, count=len(neighbors))
+        sat_idx = np.repeat(np.arange(len(sat_ecef)), counts)
+        loc_idx = np.fromiter((k for n in neighbors for k in n), dtype=int, count=counts.sum())
+
+        # Apply the constraints of each location
+        lam_pair = access_central_angle(r_sat[sat_idx], self.r_loc[loc_idx],
+                                        self.elevation_min[loc_idx],
+                                        self.look_angle_max[loc_idx])
+        cos_pair = np.sum(u_sat[sat_idx] * self._u_loc[loc_idx], axis=1)
+
+        keep = cos_pair >= np.cos(lam_pair) - 1.0e-12
+        sat_idx, loc_idx = sat_idx[keep], loc_idx[keep]
+
+        order = np.lexsort((sat_idx, loc_idx))
+
+        return sat_idx[order], loc_idx[order]
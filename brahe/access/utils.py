@@ -182,7 +182,7 @@ def find_latitude_crossing(tle: TLE, lat: float, epc_start: Epoch, epc_end: Epoc
     '''Find time of latitude crossing within given window.
 
     Args:
-        orbit (:obj:`TLE`): Orbit object
+        tle (:obj:`Union[TLE, Ephemeris]`): Orbit object. TLE or Ephemeris
         lat (float): Latitude to compute crossing for.
         epc_start (:obj:`Epoch`): Start of time window to search for crossing
         epc_end (:obj:`Epoch`): End of time window to search for crossing
@@ -239,7 +239,7 @@ def compute_along_track_directions(tle: TLE, point: np.ndarray):
     '''Compute the orbit along-track direction for when 
 
     Args:
-        tle (:obj:`TLE`): Orbit object 
+        tle (:obj:`Union[TLE, Ephemeris]`): Orbit object. TLE or Ephemeris 
         point (:obj:`np.ndarray`): Geodetic coordinates of point
 
     Returns:
@@ -499,13 +499,13 @@ def rECEFtoENZ(ecef:AbstractArray, conversion:str="geodetic") -> np.ndarray:
         raise RuntimeError(f"Unknown conversion method: {conversion}")
 
 
-    # Compute ENZ basis vectors
-    eE = np.array([[-math.sin(lon)], [math.cos(lon)], [0]])
-    eN = np.array([[-math.sin(lat)*math.cos(lon)], [-math.sin(lat)*math.sin(lon)], [math.cos(lat)]])
-    eZ = np.array([[math.cos(lat)*math.cos(lon)], [math.cos(lat)*math.sin(lon)], [math.sin(lat)]])
+    slon, clon = math.sin(lon), math.cos(lon)
+    slat, clat = math.sin(lat), math.cos(lat)
 
-    # Construct Rotation matrix
-    E = np.hstack((eE, eN, eZ)).T
+    # Construct Rotation matrix from ENZ basis vectors
+    E = np.array([[-slon,       clon,       0.0 ],
+                  [-slat*clon, -slat*slon,  clat],
+                  [ clat*clon,  clat*slon,  slat]])
 
     # Return Result
     return E
@@ -641,13 +641,13 @@ def rECEFtoSEZ(ecef:AbstractArray, conversion:str="geodetic") -> np.ndarray:
     # Ensure inputs are numpy arrays
     ecef = np.asarray(ecef)
 
-    # Compute SEZ basis vectors
-    eS = np.array([[math.sin(lat)*math.cos(lon)], [math.sin(lat)*math.sin(lon)], [-math.cos(lat)]])
-    eE = np.array([[-math.sin(lon)], [math.cos(lon)], [0]])
-    eZ = np.array([[math.cos(lat)*math.cos(lon)], [math.cos(lat)*math.sin(lon)], [math.sin(lat)]])
+    slon, clon = math.sin(lon), math.cos(lon)
+    slat, clat = math.sin(lat), math.cos(lat)
 
-    # Construct Rotation matrix
-    E = np.hstack((eS, eE, eZ)).T
+    # Construct Rotation matrix from SEZ basis vectors
+    E = np.array([[ slat*clon,  slat*slon, -clat],
+                  [-slon,       clon,       0.0 ],
+                  [ clat*clon,  clat*slon,  slat]])
 
     # Return Result
     return E
@@ -822,7 +822,7 @@ def sENZtoAZEL(x:AbstractArray, use_degrees:bool=False) -> np.ndarray:
         rhod = np.dot(x[0:3], x[3:6])/rho
 
         # Elevation-rate
-        eld = (rdZ - np.linalg.norm(x[3:6])*math.sin(el))/math.sqrt(rE**2 + rN**2)
+        eld = (rdZ - rhod*math.sin(el))/math.sqrt(rE**2 + rN**2)
 
         # Azimuth-rate
         azd = (rdE*rN - rdN*rE)/(rE**2 + rN**2)
@@ -896,7 +896,7 @@ def sSEZtoAZEL(x:AbstractArray, use_degrees:bool=False) -> np.ndarray:
         rhod = np.dot(x[0:3], x[3:6])/rho
 
         # Elevation-rate
-        eld = (rdZ - np.linalg.norm(x[3:6])*math.sin(el))/math.sqrt(rS**2 + rE**2)
+        eld = (rdZ - rhod*math.sin(el))/math.sqrt(rS**2 + rE**2)
 
         # Azimuth-rate
         azd = (rdS*rE - rdE*rS)/(rS**2 + rE**2)
@@ -911,4 +911,249 @@ def sSEZtoAZEL(x:AbstractArray, use_degrees:bool=False) -> np.ndarray:
     if len(x) == 6:
         return np.hstack((azel, azel_rate))
     else:
-        return azel
\ No newline at end of file
+        return azel
+
+################################
+# Batch Coordinate Conversions #
+################################
+
+def _batch_vectors(x:AbstractArray, lengths:typing.Tuple[int, ...], name:str) -> np.ndarray:
+    """Convert input to a 2D array of row vectors and check their length.
+
+    Args:
+        x (np.ndarray): Single vector or array of vectors with shape (N, M).
+        lengths (Tuple[int, ...]): Valid vector lengths.
+        name (str): Name of input used in error messages.
+
+    Returns:
+        x (np.ndarray): Array of vectors with shape (N, M).
+    """
+
+    x = np.asarray(x, dtype=float)
+    x = x.reshape(-1, x.shape[-1]) if x.ndim > 0 else x
+
+    if x.ndim != 2 or x.shape[1] not in lengths:
+        raise RuntimeError(f"Input {name} must have shape (N, M) with M one of: {', '.join(str(l) for l in lengths)}.")
+
+    return x
+
+def sGEODtoECEF_batch(geod:AbstractArray, use_degrees:bool=False) -> np.ndarray:
+    """Convert geodetic positions to equivalent Earth-fixed positions.
+
+    Args:
+        geod (np.ndarray): Geodetic coordinates (lon, lat, altitude) with shape (N, 2) or (N, 3). Units: *rad* or *deg* and *m*
+        use_degrees (bool): Handle input and output in degrees. (Default: ``False``)
+
+    Returns:
+        ecef (np.ndarray): Earth-fixed coordinates with shape (N, 3). Units *m*
+    """
+
+    geod = _batch_vectors(geod, (2, 3), "geodetic coordinates")
+
+    lon = geod[:, 0]
+    lat = geod[:, 1]
+    alt = geod[:, 2] if geod.shape[1] == 3 else 0.0
+
+    # Convert input to radians
+    if use_degrees:
+        lat = lat*math.pi/180.0
+        lon = lon*math.pi/180.0
+
+    # Check validity of input
+    if np.any((lat < -math.pi/2) | (lat > math.pi/2)):
+        raise RuntimeError("Latitude out of range. Must be between -90 and 90 degrees.")
+
+    # Compute Earth-fixed position vectors
+    slat = np.sin(lat)
+    clat = np.cos(lat)
+    N    = _constants.WGS84_a / np.sqrt(1.0 - _ECC2*slat**2)
+
+    return np.stack(((N + alt)*clat*np.cos(lon),
+                     (N + alt)*clat*np.sin(lon),
+                     ((1.0 - _ECC2)*N + alt)*slat), axis=-1)
+
+def sECEFtoGEOD_batch(ecef:AbstractArray, use_degrees:bool=False) -> np.ndarray:
+    """Convert Earth-fixed positions to geodetic locations.
+
+    Uses the closed-form solution of Vermeille (2002), which is exact for all
+    positions farther than about 43 km from the center of the Earth.
+
+    Args:
+        ecef (np.ndarray): Earth-fixed coordinates with shape (N, 3). Additional
+            columns, such as velocities, are ignored. Units *m*
+        use_degrees (bool): Handle input and output in degrees. (Default: ``False``)
+
+    Returns:
+        geod (np.ndarray): Geodetic coordinates (lon, lat, altitude) with shape (N, 3). Units: *rad* or *deg* and *m*
+    """
+
+    ecef = _batch_vectors(ecef, (3, 6), "ecef coordinates")
+    x, y, z = ecef[:, 0], ecef[:, 1], ecef[:, 2]
+
+    a    = _constants.WGS84_a
+    e4   = _ECC2**2
+    rho  = np.sqrt(x**2 + y**2)
+
+    # Vermeille (2002) solution for the parametric latitude
+    p = (rho/a)**2
+    q = (1.0 - _ECC2)*(z/a)**2
+    r = (p + q - e4)/6.0
+    s = e4*p*q/(4.0*r**3)
+    t = np.cbrt(1.0 + s + np.sqrt(s*(2.0 + s)))
+    u = r*(1.0 + t + 1.0/t)
+    v = np.sqrt(u**2 + e4*q)
+    w = _ECC2*(u + v - q)/(2.0*v)
+    k = np.sqrt(u + v + w**2) - w
+    D = k*rho/(k + _ECC2)
+
+    # Extract geodetic coordinates
+    Dz  = np.sqrt(D**2 + z**2)
+    lat = 2.0*np.arctan2(z, D + Dz)
+    lon = np.arctan2(y, x)
+    alt = (k + _ECC2 - 1.0)/k*Dz
+
+    # Convert output to degrees
+    if use_degrees:
+        lat = lat*180.0/math.pi
+        lon = lon*180.0/math.pi
+
+    return np.stack((lon, lat, alt), axis=-1)
+
+def _topocentric_basis_batch(station_ecef:np.ndarray, conversion:str="geodetic") -> typing.Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Compute the East, North, and Zenith unit vectors of stations.
+
+    Args:
+        station_ecef (np.ndarray): Earth-fixed Cartesian station coordinates with shape (N, 3)
+        conversion (bool): Conversion type to use. Can be "geocentric" or "geodetic"
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: East, North, and Zenith unit
+            vectors with shape (N, 3).
+    """
+
+    if conversion == "geodetic":
+        geo = sECEFtoGEOD_batch(station_ecef)
+        lon, lat = geo[:, 0], geo[:, 1]
+    elif conversion == "geocentric":
+        x, y, z = station_ecef[:, 0], station_ecef[:, 1], station_ecef[:, 2]
+        lon = np.arctan2(y, x)
+        lat = np.arctan2(z, np.sqrt(x**2 + y**2))
+    else:
+        raise RuntimeError(f"Unknown conversion method: {conversion}")
+
+    slon, clon = np.sin(lon), np.cos(lon)
+    slat, clat = np.sin(lat), np.cos(lat)
+
+    eE = np.stack((-slon, clon, np.zeros_like(lon)), axis=-1)
+    eN = np.stack((-slat*clon, -slat*slon, clat), axis=-1)
+    eZ = np.stack((clat*clon, clat*slon, slat), axis=-1)
+
+    return eE, eN, eZ
+
+def _topocentric_batch(station_ecef:AbstractArray, ecef:AbstractArray, conversion:str, south:bool) -> np.ndarray:
+    """Project relative positions and velocities of objects onto the
+    East-North-Zenith or South-East-Zenith basis of stations.
+    """
+
+    station_ecef = _batch_vectors(station_ecef, (3,), "station coordinates")
+    ecef         = _batch_vectors(ecef, (3, 6), "ecef state")
+
+    if len(station_ecef) != 1 and len(station_ecef) != len(ecef):
+        raise RuntimeError("Number of stations must be one or match the number of states.")
+
+    eE, eN, eZ = _topocentric_basis_batch(station_ecef, conversion=conversion)
+    basis = (-eN, eE, eZ) if south else (eE, eN, eZ)
+
+    range_ecef = ecef[:, 0:3] - station_ecef
+    columns = [np.sum(range_ecef*e, axis=1) for e in basis]
+
+    # Transform range-rate (if necessary)
+    if ecef.shape[1] == 6:
+        columns += [np.sum(ecef[:, 3:6]*e, axis=1) for e in basis]
+
+    return np.stack(columns, axis=-1)
+
+def sECEFtoENZ_batch(station_ecef:AbstractArray, ecef:AbstractArray, conversion:str="geodetic") -> np.ndarray:
+    """Compute the coordinates of objects in the East-North-Zenith topocentric
+    coordinate basis of fixed-location stations.
+
+    Args:
+        station_ecef (np.ndarray): Earth-fixed Cartesian coordinates of a single
+            station, or of one station per object with shape (N, 3)
+        ecef (np.ndarray): Earth-fixed coordinates of the objects with shape (N, 3) or (N, 6)
+        conversion (bool): Conversion type to use. Can be "geocentric" or "geodetic"
+
+    Returns:
+        x (np.ndarray): Object coordinates in East-North-Zenith basis with shape (N, 3) or (N, 6).
+    """
+
+    return _topocentric_batch(station_ecef, ecef, conversion, south=False)
+
+def sECEFtoSEZ_batch(station_ecef:AbstractArray, ecef:AbstractArray, conversion:str="geodetic") -> np.ndarray:
+    """Compute the coordinates of objects in the South-East-Zenith topocentric
+    coordinate basis of fixed-location stations.
+
+    Args:
+        station_ecef (np.ndarray): Earth-fixed Cartesian coordinates of a single
+            station, or of one station per object with shape (N, 3)
+        ecef (np.ndarray): Earth-fixed coordinates of the objects with shape (N, 3) or (N, 6)
+        conversion (bool): Conversion type to use. Can be "geocentric" or "geodetic"
+
+    Returns:
+        x (np.ndarray): SEZ coordinates of objects with shape (N, 3) or (N, 6).
+    """
+
+    return _topocentric_batch(station_ecef, ecef, conversion, south=True)
+
+def sENZtoAZEL_batch(x:AbstractArray, use_degrees:bool=False) -> np.ndarray:
+    """Convert East-North-Zenith topocentric coordinates of multiple objects
+    into azimuth, elevation, and range. Azimuth-rate, elevation-rate, and
+    range-rate are also computed if velocities are provided.
+
+    Args:
+        x (np.ndarray): East-North-Up coordinates with shape (N, 3) or (N, 6).
+        use_degrees (bool): If ``True`` returns result in units of degrees.
+
+    Returns:
+        azel (np.ndarray): Azimuth, elevation and range with shape (N, 3), or
+            (N, 6) with their rates. Units: *rad* or *deg* and *m*
+    """
+
+    x = _batch_vectors(x, (3, 6), "ENZ state")
+
+    rE, rN, rZ = x[:, 0], x[:, 1], x[:, 2]
+    rho_h2 = rE**2 + rN**2
+
+    rho = np.sqrt(rho_h2 + rZ**2)
+    el  = np.arctan2(rZ, np.sqrt(rho_h2))
+
+    # Azimuth is singular at 90 deg elevation, where the rate information is
+    # used to resolve it if available
+    singular = rho_h2 == 0.0
+    if x.shape[1] == 6:
+        az = np.where(singular, np.arctan2(x[:, 3], x[:, 4]), np.arctan2(rE, rN))
+    else:
+        az = np.where(singular, 0.0, np.arctan2(rE, rN))
+    az = np.where(az < 0, az + 2*math.pi, az)
+
+    columns = [az, el, rho]
+
+    # Process Rate information
+    if x.shape[1] == 6:
+        rdE, rdN, rdZ = x[:, 3], x[:, 4], x[:, 5]
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rhod = (rE*rdE + rN*rdN + rZ*rdZ)/rho
+            eld  = (rdZ - rhod*np.sin(el))/np.sqrt(rho_h2)
+            azd  = (rdE*rN - rdN*rE)/rho_h2
+
+        columns += [azd, eld, rhod]
+
+    azel = np.stack(columns, axis=-1)
+
+    if use_degrees:
+        azel[:, 0:2] *= 180.0/math.pi
+        if x.shape[1] == 6:
+            azel[:, 3:5] *= 180.0/math.pi
+
+    return azel
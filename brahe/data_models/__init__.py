@@ -19,6 +19,11 @@ from .earth_observation import (
     Contact
 )
 
+from .opportunity_set import (
+    OPPORTUNITY_DTYPE,
+    OpportunitySet
+)
+
 from .spacecraft import (
     Spacecraft,
     SpacecraftModel
@@ -0,0 +1,315 @@
+"""The opportunity set module provides a columnar store of access
+opportunities. Opportunities are held in a single structured array rather than
+as individual pydantic models, which are only created when requested.
+"""
+
+import os
+import uuid
+import typing
+import numpy as np
+
+from brahe.epoch import Epoch, EpochArray
+
+from .geojson import GeoJSONObject
+from .earth_observation import (
+    AscendingDescending,
+    LookDirection,
+    ScheduleStatus,
+    AccessProperties,
+    Request,
+    Tile,
+    Collect,
+    Contact
+)
+
+# Kinds of opportunity
+OPPORTUNITY_COLLECT = 0
+OPPORTUNITY_CONTACT = 1
+
+# Enumeration values stored by their index
+_ASCDSC = list(AscendingDescending)
+_LOOK_DIRECTION = list(LookDirection)
+_STATUS = list(ScheduleStatus)
+
+OPPORTUNITY_DTYPE = np.dtype([
+    ('id', np.uint8, (16,)),
+    ('kind', np.int8),
+    ('status', np.int8),
+    ('spacecraft_id', np.int64),
+    ('location', np.int64),
+    ('request', np.int64),
+    ('t_start', np.float64),
+    ('t_end', np.float64),
+    ('ascdsc', np.int8),
+    ('look_direction', np.int8),
+    ('azimuth_open', np.float64),
+    ('azimuth_close', np.float64),
+    ('look_angle_min', np.float64),
+    ('look_angle_max', np.float64),
+    ('elevation_min', np.float64),
+    ('elevation_max', np.float64),
+    ('los_start', np.float64, (3,)),
+    ('los_end', np.float64, (3,)),
+])
+
+
+def _uuid4_bytes(n:int) -> np.ndarray:
+    '''Generate random version 4 UUIDs.
+
+    Args:
+        n (int): Number of UUIDs.
+
+    Returns:
+        np.ndarray: Bytes of each UUID with shape (n, 16).
+    '''
+
+    ids = np.frombuffer(os.urandom(16*n), dtype=np.uint8).reshape(n, 16).copy()
+
+    # Set version and variant bits
+    ids[:, 6] = (ids[:, 6] & 0x0F) | 0x40
+    ids[:, 8] = (ids[:, 8] & 0x3F) | 0x80
+
+    return ids
+
+
+def _enum_codes(values:typing.Iterable, members:typing.List) -> np.ndarray:
+    '''Convert enumeration values to their index in the stored columns.
+
+    Args:
+        values (Iterable): Enumeration members or their values.
+        members (List): Members of the enumeration.
+
+    Returns:
+        np.ndarray: Index of each value.
+    '''
+    codes = {m: k for k, m in enumerate(members)}
+    codes.update({m.value: k for k, m in enumerate(members)})
+
+    return np.fromiter((codes[v] for v in values), dtype=np.int8)
+
+
+class OpportunitySet():
+    '''Columnar set of `Collect` and `Contact` opportunities.
+
+    Each opportunity is a record of `OPPORTUNITY_DTYPE`. Times are stored as
+    elapsed seconds since the reference `epoch` of the set, and locations and
+    requests as indices into the `locations` and `requests` lists shared by
+    all records. Individual opportunities are created as `Collect` or
+    `Contact` models only when indexed or iterated.
+
+    Args:
+        epoch (:obj:`Epoch`): Reference epoch of times.
+        records (np.ndarray): Opportunity records of `OPPORTUNITY_DTYPE`.
+        locations (List[:obj:`Union[Station, Tile]`]): Locations referenced by records.
+        requests (List[:obj:`Request`]): Requests referenced by records.
+
+    Attributes:
+        epoch (:obj:`Epoch`): Reference epoch of times.
+        records (np.ndarray): Opportunity records.
+        locations (List[:obj:`Union[Station, Tile]`]): Locations referenced by records.
+        requests (List[:obj:`Request`]): Requests referenced by records.
+    '''
+
+    def __init__(self, epoch:Epoch, records:np.ndarray=None,
+                 locations:typing.List[GeoJSONObject]=None,
+                 requests:typing.List[Request]=None):
+
+        if records is None:
+            records = np.zeros(0, dtype=OPPORTUNITY_DTYPE)
+
+        if records.dtype != OPPORTUNITY_DTYPE:
+            raise ValueError(f'Invalid opportunity record type {records.dtype}.')
+
+        self.epoch     = Epoch(epoch, time_system='UTC')
+        self.records   = records
+        self.locations = list(locations or [])
+        self.requests  = list(requests or [])
+
+    @classmethod
+    def from_windows(cls, epoch:Epoch, spacecraft_id:int, location:GeoJSONObject,
+                     t_start:np.ndarray, t_end:np.ndarray,
+                     properties:typing.Dict[str, np.ndarray],
+                     request:Request=None) -> 'OpportunitySet':
+        '''Create the opportunities of a spacecraft to a location.
+
+        Args:
+            epoch (:obj:`Epoch`): Reference epoch of times.
+            spacecraft_id (int): ID of spacecraft.
+            location (:obj:`Union[Station, Tile]`): Location of opportunities.
+            t_start (np.ndarray): Start of each opportunity. Units: [s]
+            t_end (np.ndarray): End of each opportunity. Units: [s]
+            properties (Dict[str, np.ndarray]): Access property columns of
+                each opportunity. Enumerations are given by their members.
+            request (:obj:`Request`): Request. Only required if location is `Tile`
+
+        Returns:
+            OpportunitySet: Opportunities to the location.
+        '''
+
+        records = np.zeros(len(t_start), dtype=OPPORTUNITY_DTYPE)
+
+        records['id'] = _uuid4_bytes(len(records))
+        records['kind'] = OPPORTUNITY_COLLECT if type(location) == Tile else OPPORTUNITY_CONTACT
+        records['spacecraft_id'] = spacecraft_id
+        records['request'] = -1 if request is None else 0
+        records['t_start'] = t_start
+        records['t_end'] = t_end
+
+        for field, values in properties.items():
+            if field == 'ascdsc':
+                values = _enum_codes(values, _ASCDSC)
+            elif field == 'look_direction':
+                values = _enum_codes(values, _LOOK_DIRECTION)
+
+            records[field] = values
+
+        # Only reference the location and request if there are opportunities
+        if len(records) == 0:
+            return cls(epoch, records)
+
+        return cls(epoch, records, [location], [] if request is None else [request])
+
+    @classmethod
+    def concatenate(cls, sets:typing.List['OpportunitySet'], epoch:Epoch=None) -> 'OpportunitySet':
+        '''Join multiple opportunity sets, in order, into one set.
+
+        Args:
+            sets (List[:obj:`OpportunitySet`]): Opportunity sets.
+            epoch (:obj:`Epoch`, optional): Reference epoch of the joined set.
+                Defaults to the epoch of the first set.
+
+        Returns:
+            OpportunitySet: Joined opportunities.
+        '''
+
+        if epoch is None:
+            if len(sets) == 0:
+                raise ValueError('Reference epoch required to join empty list of opportunity sets.')
+            epoch = sets[0].epoch
+
+        records = []
+        locations = []
+        requests = []
+        for s in sets:
+            r = s.records.copy()
+
+            # Shift times and references into the joined set
+            r['t_start'] += s.epoch - epoch
+            r['t_end'] += s.epoch - epoch
+            r['location'] += len(locations)
+            r['request'] = np.where(r['request'] >= 0, r['request'] + len(requests), -1)
+
+            records.append(r)
+            locations.extend(s.locations)
+            requests.extend(s.requests)
+
+        records = np.concatenate(records) if records else np.zeros(0, dtype=OPPORTUNITY_DTYPE)
+
+        return cls(epoch, records, locations, requests)
+
+    def __len__(self):
+        return len(self.records)
+
+    def __iter__(self):
+        for k in range(len(self)):
+            yield self.opportunity(k)
+
+    def __getitem__(self, key):
+        # Columns by name, opportunities by integer, and subsets otherwise
+        if isinstance(key, str):
+            return self.records[key]
+        elif isinstance(key, (int, np.integer)):
+            return self.opportunity(key)
+        else:
+            return OpportunitySet(self.epoch, self.records[key], self.locations, self.requests)
+
+    @property
+    def t_start(self) -> EpochArray:
+        '''Start time of each opportunity'''
+        return EpochArray.from_offsets(self.epoch, self.records['t_start'])
+
+    @property
+    def t_end(self) -> EpochArray:
+        '''End time of each opportunity'''
+        return EpochArray.from_offsets(self.epoch, self.records['t_end'])
+
+    @property
+    def t_duration(self) -> np.ndarray:
+        '''Duration of each opportunity. Units: [s]'''
+        return self.records['t_end'] - self.records['t_start']
+
+    @property
+    def ids(self) -> typing.List[str]:
+        '''Identifier of each opportunity'''
+        return [str(uuid.UUID(bytes=r.tobytes())) for r in self.records['id']]
+
+    def access_properties(self, k:int) -> AccessProperties:
+        '''Create the access properties of an opportunity.
+
+        Args:
+            k (int): Index of opportunity.
+
+        Returns:
+            AccessProperties: Geometric properties of access.
+        '''
+
+        r = self.records[k]
+
+        return AccessProperties(
+            ascdsc=_ASCDSC[r['ascdsc']],
+            look_direction=_LOOK_DIRECTION[r['look_direction']],
+            azimuth_open=float(r['azimuth_open']),
+            azimuth_close=float(r['azimuth_close']),
+            look_angle_min=float(r['look_angle_min']),
+            look_angle_max=float(r['look_angle_max']),
+            elevation_min=float(r['elevation_min']),
+            elevation_max=float(r['elevation_max']),
+            los_start=r['los_start'].tolist(),
+            los_end=r['los_end'].tolist(),
+        )
+
+    def opportunity(self, k:int) -> typing.Union[Collect, Contact]:
+        '''Create an opportunity as a `Collect` or `Contact` model.
+
+        Args:
+            k (int): Index of opportunity.
+
+        Returns:
+            Union[Collect, Contact]: Opportunity.
+        '''
+
+        r = self.records[k]
+        location = self.locations[r['location']]
+
+        values = dict(
+            id=str(uuid.UUID(bytes=r['id'].tobytes())),
+            status=_STATUS[r['status']],
+            center=location.center.tolist(),
+            center_ecef=location.center_ecef.tolist(),
+            t_start=(self.epoch + float(r['t_start'])).to_datetime(tsys='UTC'),
+            t_end=(self.epoch + float(r['t_end'])).to_datetime(tsys='UTC'),
+            spacecraft_id=int(r['spacecraft_id']),
+            access_properties=self.access_properties(k),
+        )
+
+        if r['kind'] == OPPORTUNITY_COLLECT:
+            return Collect(
+                tile_id=location.tile_id,
+                tile_group_id=location.tile_group_id,
+                request_id=self.requests[r['request']].request_id,
+                **values
+            )
+        else:
+            return Contact(
+                station_id=location.station_id,
+                station_name=location.station_name,
+                **values
+            )
+
+    def to_list(self) -> typing.List[typing.Union[Collect, Contact]]:
+        '''Create all opportunities as `Collect` or `Contact` models.
+
+        Returns:
+            List[Union[Collect, Contact]]: Opportunities.
+        '''
+        return list(self)
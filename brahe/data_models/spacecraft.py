@@ -10,7 +10,7 @@ import pydantic
 import numpy as np
 
 from brahe.epoch import Epoch
-from brahe.tle import TLE
+from brahe.tle import intern_tle
 from pydantic import Field
 from typing_extensions import Annotated
 
@@ -45,6 +45,7 @@ class Spacecraft(pydantic.BaseModel):
 
     @property
     def tle(self):
-        '''TLE object for spacecraft
+        '''TLE object for spacecraft. The TLE is parsed once and shared with
+        all other spacecraft with the same lines.
         '''
-        return TLE(self.line1, self.line2)
+        return intern_tle(self.line1, self.line2)
@@ -8,7 +8,7 @@ import typing
 import numpy as np
 
 # Package imports
-from brahe.utils import logger
+from brahe.utils import logger, load_cached_array
 from brahe.constants import DATA_PATH, AS2RAD
 
 # Constants
@@ -25,19 +25,23 @@ DEFAULT_EOP_DATA = IERS_AB_EOP_DATA
 by the Epoch class compute offsets between various time systems.
 """
 
+# Version of parsed EOP array layout stored in binary caches
+_EOP_CACHE_VERSION = 1
+
 #########
 # Utils #
 #########
 
-# Helper to read C04 data file into a dictionary
-def _read_c04_file(filepath:str) -> None:
+# Helper to read C04 data file into an array
+def _read_c04_file(filepath:str) -> np.ndarray:
     """Read IERS C04-formatted Earth Orientation Parameter (EOP) data file.
 
     Args:
         filepath (str): Path to data file
 
     Returns:
-        data (dict): Dictionary of (ut1-utc, xp, yp) keyed to the MJD utc of the data.
+        data (np.ndarray): Array of (mjd_utc, ut1-utc, xp, yp) rows sorted by 
+            the MJD utc of the data.
     """
     data = {}
 
@@ -51,19 +55,20 @@ def _read_c04_file(filepath:str) -> None:
             ut1_utc = float(dat[6])           # UT1-UTC [s]
             xp      = float(dat[4])*AS2RAD   # xp [rad]
             yp      = float(dat[5])*AS2RAD   # yp [rad]
-            data.update({mjd_utc:(ut1_utc, xp, yp)}) 
+            data.update({mjd_utc:(mjd_utc, ut1_utc, xp, yp)}) 
 
-    return data
+    return _eop_array(data.values())
 
-# Helper to read IERS Bulletin A/B data file into a dictionary
-def _read_2000ab_file(filepath:str) -> None:
+# Helper to read IERS Bulletin A/B data file into an array
+def _read_2000ab_file(filepath:str) -> np.ndarray:
     """Read IERS Buelletin A/B-formatted Earth Orientation Parameter (EOP) data file.
 
     Args:
         filepath (str): Path to data file
 
     Returns:
-        data (dict): Dictionary of (ut1-utc, xp, yp) keyed to the MJD utc of the data.
+        data (np.ndarray): Array of (mjd_utc, ut1-utc, xp, yp) rows sorted by 
+            the MJD utc of the data.
     """
     data = {}
 
@@ -74,9 +79,47 @@ def _read_2000ab_file(filepath:str) -> None:
                 ut1_utc = float(line[58:68])          # UT1-UTC [s]
                 xp      = float(line[18:27])*AS2RAD  # xp [rad]
                 yp      = float(line[37:46])*AS2RAD  # yp [rad]
-                data.update({mjd_utc:(ut1_utc, xp, yp)})
+                data.update({mjd_utc:(mjd_utc, ut1_utc, xp, yp)})
+
+    return _eop_array(data.values())
+
+def _read_eop_file(filepath:str) -> np.ndarray:
+    """Read Earth Orientation Parameter (EOP) data file, detecting whether it
+    is in IERS C04 or Bulletin A/B format.
+
+    Args:
+        filepath (str): Path to data file
 
-    return data
+    Returns:
+        data (np.ndarray): Array of (mjd_utc, ut1-utc, xp, yp) rows sorted by 
+            the MJD utc of the data.
+    """
+
+    # Detect input file format type (C04 or A/B Bulletin)
+    is_c04 = False
+
+    # Detect file type
+    with open(filepath) as input_file:
+        # Read to C04 text flag
+        for _ in range(4):
+            input_file.readline().strip() # Advance file read 4 liens
+
+        line = input_file.readline().strip()
+
+        if line[-3:] == 'C04':
+            is_c04 = True
+
+    # Load data file
+    if is_c04:
+        return _read_c04_file(filepath)
+    else:
+        return _read_2000ab_file(filepath)
+
+def _eop_array(rows:typing.Iterable[typing.Tuple[float, float, float, float]]) -> np.ndarray:
+    # Convert EOP rows into a contiguous (N, 4) array sorted by MJD
+    data = np.array(list(rows), dtype=np.float64).reshape(-1, 4)
+
+    return np.ascontiguousarray(data[np.argsort(data[:, 0], kind='stable')])
 
 ################################
 # Earth Orientation Parameters #
@@ -84,40 +127,35 @@ def _read_2000ab_file(filepath:str) -> None:
 
 class EOP():
     """Class to store Earth Orientation parameters and data.
+
+    Data is stored as a contiguous (N, 4) array with rows of (mjd_utc, ut1_utc,
+    xp, yp) sorted by MJD. All accessors accept either a scalar MJD or an array
+    of MJDs.
     """
 
     # Class data memeters
     _initialized = False
-    _data = {}
+    _data = np.zeros((0, 4))
 
     @classmethod
-    def load(cls, filepath:str=DEFAULT_EOP_DATA) -> None:
+    def load(cls, filepath:str=DEFAULT_EOP_DATA, use_cache:bool=True) -> None:
         """Load Earth orientation data into class memory.
 
+        Parsed data is cached in a binary sidecar file next to the data file so
+        that subsequent loads, including those in new processes, memory-map the
+        parsed array instead of parsing the text file.
+
         Args:
             filepath (str): Path to Earth orientation data file to load and use
                 in module.
+            use_cache (bool): Read and write the binary sidecar cache.
         """
 
-        # Detect input file format type (C04 or A/B Bulletin)
-        is_c04 = False
-
-        # Detect file type
-        with open(filepath) as input_file:
-            # Read to C04 text flag
-            for _ in range(4):
-                input_file.readline().strip() # Advance file read 4 liens
-
-            line = input_file.readline().strip()
-
-            if line[-3:] == 'C04':
-                is_c04 = True
-
         # Load data file
-        if is_c04:
-            cls._data = _read_c04_file(filepath)
+        if use_cache:
+            cls._data = load_cached_array(filepath, _read_eop_file, tag='eop', version=_EOP_CACHE_VERSION)
         else:
-            cls._data = _read_2000ab_file(filepath)
+            cls._data = _read_eop_file(filepath)
 
         # Flag initialization
         cls._initialized = True
@@ -127,7 +165,7 @@ class EOP():
         """Clear loaded EOP data
         """
         cls._initialized = False
-        cls._data.clear()
+        cls._data = np.zeros((0, 4))
 
     @classmethod
     def set(cls, mjd_utc:int, ut1_utc:float, xp:float, yp:float) -> None:
@@ -140,8 +178,15 @@ class EOP():
             xp (float): UT1-UTC offset Units: *arcseconds*
         """
 
-        cls._data[int(mjd_utc)] = (ut1_utc, xp*AS2RAD, yp*AS2RAD)
+        row = np.array([int(mjd_utc), ut1_utc, xp*AS2RAD, yp*AS2RAD])
+        idx = np.searchsorted(cls._data[:, 0], row[0])
 
+        if idx < len(cls._data) and cls._data[idx, 0] == row[0]:
+            # Copy data in case it is a read-only view
+            cls._data = np.array(cls._data)
+            cls._data[idx, :] = row
+        else:
+            cls._data = np.insert(cls._data, idx, row, axis=0)
 
     @classmethod
     def initialized(cls) -> None:
@@ -160,162 +205,162 @@ class EOP():
             cls.load(filepath=DEFAULT_EOP_DATA)
 
     @classmethod
-    def eop(cls, mjd_utc:float, interp:bool=False) -> typing.Tuple[float, float, float]:
-        """Return the specified Earth orientation parameters based on.
+    def _lookup(cls, mjd_utc:typing.Union[float, np.ndarray], interp:bool=False) -> np.ndarray:
+        """Look up Earth orientation parameters for one or more dates.
 
         Args:
-            mjd_utc (float): Modified Julian Date in the UTC time system.
+            mjd_utc (Union[float, np.ndarray]): Modified Julian Date(s) in the
+                UTC time system.
+            interp (bool): Linearly interpolate between tabulated values.
 
         Returns:
-            ut1_utc (float): UT1 - UTC time system offset. Units: *seconds*
-            xp (float): x-vector component of polar offset. Units: *radians*
-            yp (float): x-vector component of polar offset. Units: *radians*
+            np.ndarray: Array of (ut1_utc, xp, yp) rows, one per input date.
         """
 
         # Ensure class is initialized
         cls._initialize()
 
+        # Fast path for scalar lookups of daily data which avoids array overhead
+        if not interp and np.ndim(mjd_utc) == 0 and len(cls._data) > 0:
+            day = math.floor(mjd_utc)
+            idx = day - int(cls._data[0, 0])
+
+            if 0 <= idx < len(cls._data) and cls._data[idx, 0] == day:
+                return cls._data[idx:idx+1, 1:]
+
+        if interp and np.ndim(mjd_utc) == 0 and len(cls._data) > 0:
+            day = math.floor(mjd_utc)
+            idx = day - int(cls._data[0, 0])
+
+            if 0 <= idx < len(cls._data) - 1 and cls._data[idx, 0] == day and cls._data[idx+1, 0] == day + 1:
+                f = mjd_utc - day
+                return ((1.0 - f)*cls._data[idx, 1:] + f*cls._data[idx+1, 1:])[np.newaxis, :]
+
+        mjd  = np.atleast_1d(np.asarray(mjd_utc, dtype=np.float64))
+        mjds = cls._data[:, 0]
+
+        # Index of last tabulated value at or before each date
+        idx = np.searchsorted(mjds, mjd, side='right') - 1
+
+        if len(mjds) == 0 or np.any(idx < 0) or np.any(mjd >= mjds[-1] + (0.0 if interp else 1.0)):
+            raise RuntimeError(f'Earth orientation data not available for requested dates. '
+                               f'Loaded data covers MJD {mjds[0] if len(mjds) else math.nan} to '
+                               f'{mjds[-1] if len(mjds) else math.nan}.')
+
         if interp:
             # Linearly interpolate output to time
-            x1 = math.floor(mjd_utc)
-            x2 = math.floor(mjd_utc) + 1
+            x1 = mjds[idx][:, np.newaxis]
+            x2 = mjds[idx + 1][:, np.newaxis]
+            y1 = cls._data[idx, 1:]
+            y2 = cls._data[idx + 1, 1:]
+
+            return (y2 - y1)/(x2 - x1) * (mjd[:, np.newaxis] - x1) + y1
+        else:
+            return cls._data[idx, 1:]
+
+    @classmethod
+    def eop(cls, mjd_utc:typing.Union[float, np.ndarray], interp:bool=False) -> typing.Tuple[float, float, float]:
+        """Return the specified Earth orientation parameters based on.
+
+        Args:
+            mjd_utc (Union[float, np.ndarray]): Modified Julian Date in the UTC 
+                time system. May be a scalar or an array of dates.
+
+        Returns:
+            ut1_utc (float): UT1 - UTC time system offset. Units: *seconds*
+            xp (float): x-vector component of polar offset. Units: *radians*
+            yp (float): x-vector component of polar offset. Units: *radians*
+        """
 
-            # Get values converted to array for interpolation
-            y1 = np.array([v for v in EOP._data[int(math.floor(mjd_utc))]])
-            y2 = np.array([v for v in EOP._data[int(math.floor(mjd_utc)+1)]])
-            x  = (y2 - y1)/(x2 - x1) * (mjd_utc - x1) + y1
+        values = cls._lookup(mjd_utc, interp=interp)
 
-            return x
+        if np.ndim(mjd_utc) > 0:
+            return values[:, 0], values[:, 1], values[:, 2]
+        elif interp:
+            return values[0, :]
         else:
-            # Return Earth Orientation Parameters
-            return cls._data[int(math.floor(mjd_utc))]
+            return tuple(float(v) for v in values[0, :])
 
     @classmethod
-    def pole_locator(cls, mjd_utc:float, interp:bool=False) -> typing.Tuple[float, float]:
+    def pole_locator(cls, mjd_utc:typing.Union[float, np.ndarray], interp:bool=False) -> typing.Tuple[float, float]:
         """Returns the angular location of Earth rotational axis.
 
         Args:
-            mjd_utc (float): Modified Julian Date in the UTC time system.
+            mjd_utc (Union[float, np.ndarray]): Modified Julian Date in the UTC 
+                time system. May be a scalar or an array of dates.
 
         Returns:
             xp (float): x-vector component of polar offset. Units: *radians*
             yp (float): y-vector component of polar offset. Units: *radians*
         """
 
-        # Ensure class is initialized
-        cls._initialize()
-
-        if interp:
-            # Linearly interpolate output to time
-            x1 = math.floor(mjd_utc)
-            x2 = math.floor(mjd_utc) + 1
+        values = cls._lookup(mjd_utc, interp=interp)
 
-            # Get values converted to array for interpolation
-            y1 = np.array(EOP._data[int(math.floor(mjd_utc))][1:3])
-            y2 = np.array(EOP._data[int(math.floor(mjd_utc)+1)][1:3])
-            x  = (y2 - y1)/(x2 - x1) * (mjd_utc - x1) + y1
-
-            return x
+        if np.ndim(mjd_utc) > 0:
+            return values[:, 1], values[:, 2]
+        elif interp:
+            return values[0, 1:3]
         else:
-            # Return Earth Orientation Parameters
-            return cls._data[int(math.floor(mjd_utc))][1], cls._data[int(math.floor(mjd_utc))][2]
+            return float(values[0, 1]), float(values[0, 2])
 
     @classmethod
-    def xp(cls, mjd_utc:float, interp:bool=False) -> float:
+    def xp(cls, mjd_utc:typing.Union[float, np.ndarray], interp:bool=False) -> float:
         """Return the specified x-component of Earth Orientation .
 
         Args:
-            mjd_utc (float): Modified Julian Date in the UTC time system.
+            mjd_utc (Union[float, np.ndarray]): Modified Julian Date in the UTC 
+                time system. May be a scalar or an array of dates.
 
         Returns:
             xp (float): x-vector component of polar offset. Units: *radians*
         """
 
-        # Ensure class is initialized
-        cls._initialize()
+        values = cls._lookup(mjd_utc, interp=interp)[:, 1]
 
-        if interp:
-            # Linearly interpolate output to time
-            x1 = math.floor(mjd_utc)
-            x2 = math.floor(mjd_utc) + 1
-
-            # Get values converted to array for interpolation
-            y1 = EOP._data[int(math.floor(mjd_utc))][1]
-            y2 = EOP._data[int(math.floor(mjd_utc)+1)][1]
-            x  = (y2 - y1)/(x2 - x1) * (mjd_utc - x1) + y1
-
-            return x
-        else:
-            # Return Earth Orientation Parameters
-            return cls._data[int(math.floor(mjd_utc))][1]
+        return values if np.ndim(mjd_utc) > 0 else float(values[0])
 
     @classmethod
-    def yp(cls, mjd_utc:float, interp:bool=False) -> float:
+    def yp(cls, mjd_utc:typing.Union[float, np.ndarray], interp:bool=False) -> float:
         """Return the specified y-component of Earth Orientation.
 
         Args:
-            mjd_utc (float): Modified Julian Date in the UTC time system.
+            mjd_utc (Union[float, np.ndarray]): Modified Julian Date in the UTC 
+                time system. May be a scalar or an array of dates.
 
         Returns:
             yp (float): y-vector component of polar offset. Units: *radians*
         """
 
-        # Ensure class is initialized
-        cls._initialize()
-
-        if interp:
-            # Linearly interpolate output to time
-            x1 = math.floor(mjd_utc)
-            x2 = math.floor(mjd_utc) + 1
-
-            # Get values converted to array for interpolation
-            y1 = EOP._data[int(math.floor(mjd_utc))][2]
-            y2 = EOP._data[int(math.floor(mjd_utc)+1)][2]
-            x  = (y2 - y1)/(x2 - x1) * (mjd_utc - x1) + y1
+        values = cls._lookup(mjd_utc, interp=interp)[:, 2]
 
-            return x
-        else:
-            # Return Earth Orientation Parameters
-            return cls._data[int(math.floor(mjd_utc))][2]
+        return values if np.ndim(mjd_utc) > 0 else float(values[0])
 
     @classmethod
-    def ut1_utc(cls, mjd_utc:float, interp:bool=False) -> float:
+    def ut1_utc(cls, mjd_utc:typing.Union[float, np.ndarray], interp:bool=False) -> float:
         """Return the specified UT1 - UTC offset in seconds.
 
         Args:
-            mjd_utc (float): Modified Julian Date in the UTC time system.
+            mjd_utc (Union[float, np.ndarray]): Modified Julian Date in the UTC 
+                time system. May be a scalar or an array of dates.
 
         Returns:
             ut1_utc (float): UT1 - UTC time system offset. Units: *seconds*
         """
 
-        # Ensure class is initialized
-        cls._initialize()
+        values = cls._lookup(mjd_utc, interp=interp)[:, 0]
 
-        if interp:
-            # Linearly interpolate output to time
-            x1 = math.floor(mjd_utc)
-            x2 = math.floor(mjd_utc) + 1
-
-            # Get values converted to array for interpolation
-            y1 = EOP._data[int(math.floor(mjd_utc))][0]
-            y2 = EOP._data[int(math.floor(mjd_utc)+1)][0]
-            x  = (y2 - y1)/(x2 - x1) * (mjd_utc - x1) + y1
-
-            return x
-        else:
-            # Return Earth Orientation Parameters
-            return cls._data[int(math.floor(mjd_utc))][0]
+        return values if np.ndim(mjd_utc) > 0 else float(values[0])
 
     @classmethod
-    def utc_ut1(cls, mjd_utc:float, interp:bool=False) -> float:
+    def utc_ut1(cls, mjd_utc:typing.Union[float, np.ndarray], interp:bool=False) -> float:
         """Return the specified UT1 - UTC offset in seconds.
 
         Args:
-            mjd_utc (float): Modified Julian Date in the UTC time system.
+            mjd_utc (Union[float, np.ndarray]): Modified Julian Date in the UTC 
+                time system. May be a scalar or an array of dates.
 
         Returns:
             utc_ut1 (float): UT1 - UTC time system offset. Units: *seconds*
         """
 
-        return -cls.ut1_utc(mjd_utc, interp=interp)
\ No newline at end of file
+        return -cls.ut1_utc(mjd_utc, interp=interp)
@@ -0,0 +1,342 @@
+"""The ephemeris module provides a sampled representation of a trajectory which
+serves states at arbitrary times by interpolation instead of repeating the full
+propagation and frame transformation for every query.
+"""
+
+import typing
+import collections
+import functools
+import math
+import numpy as np
+
+from brahe.epoch import Epoch, EpochArray
+
+VALID_INTERPOLATION = ['lagrange', 'hermite']
+
+# Default number of interpolation nodes of each method
+_DEFAULT_ORDER = {'lagrange': 8, 'hermite': 4}
+
+
+@functools.lru_cache(maxsize=16)
+def _basis_denominators(p:int) -> np.ndarray:
+    '''Denominators prod_{k != j} (j - k) of the Lagrange basis polynomials of
+    `p` equally spaced nodes located at 0, 1, ..., p-1.
+
+    Args:
+        p (int): Number of nodes.
+
+    Returns:
+        np.ndarray: Denominator of each basis polynomial.
+    '''
+
+    return np.array([math.factorial(j)*math.factorial(p - 1 - j)*(-1)**(p - 1 - j) for j in range(p)], dtype=float)
+
+
+def _lagrange_basis(s:np.ndarray, p:int, derivative:bool=False) -> typing.Tuple[np.ndarray, np.ndarray]:
+    '''Compute the Lagrange basis polynomials of `p` equally spaced nodes located
+    at 0, 1, ..., p-1 and optionally their derivatives.
+
+    Args:
+        s (np.ndarray): Evaluation points in units of the node spacing.
+        p (int): Number of nodes.
+        derivative (bool): Also compute derivatives of the basis polynomials.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Basis polynomials and their derivatives
+            with shape (M, p). Derivatives are `None` if not computed.
+    '''
+
+    j = np.arange(p)
+    d = s[:, np.newaxis] - j[np.newaxis, :]
+
+    denom = _basis_denominators(p)
+
+    # Products of all factors but one from prefix and suffix products
+    ones = np.ones((len(s), 1))
+    prefix = np.cumprod(np.hstack((ones, d[:, :-1])), axis=1)
+    suffix = np.cumprod(np.hstack((ones, d[:, :0:-1])), axis=1)[:, ::-1]
+
+    L = prefix*suffix/denom
+
+    if not derivative:
+        return L, None
+
+    dL = np.zeros((len(s), p))
+    for k in range(p):
+        for m in range(p):
+            if m != k:
+                dL[:, k] += np.prod(np.delete(d, [k, m], axis=1), axis=1)
+
+    return L, dL/denom
+
+
+class Ephemeris():
+    '''Trajectory sampled once from a source propagator which serves Earth-fixed
+    (ITRF) states at arbitrary times by Hermite or Lagrange interpolation.
+
+    The trajectory is divided into windows of fixed length. A window is sampled
+    the first time a state within it is requested: the sampling step is halved
+    until interpolated positions at the midpoints between samples agree with
+    the source to within `tol`. The most recently used windows are kept in a
+    cache of `cache_size` windows.
+
+    An `Ephemeris` can be used in place of a `TLE` in the functions of
+    `brahe.access`. Other attributes, such as the mean elements and inertial
+    states, are provided directly by the source.
+
+    Args:
+        source (:obj:`TLE`): Source of states. Must provide `epoch` and
+            `states_itrf`.
+        step (float): Initial sampling step. Units: [s]
+        method (str): Interpolation method. One of: `lagrange` (each state
+            component, default), `hermite` (positions with velocities as their
+            derivatives). SGP4 velocities are not exact derivatives of its
+            positions, which limits Hermite interpolation of TLEs to about 0.1 m.
+        order (int): Number of nodes used for each interpolation. Defaults to
+            8 for `lagrange` and 4 for `hermite`.
+        tol (float): Position interpolation error tolerance. Units: [m]
+        window (float): Length of cached windows. Units: [s]
+        cache_size (int): Maximum number of cached windows.
+        min_step (float): Smallest sampling step. Units: [s]
+
+    Attributes:
+        epoch (:obj:`Epoch`): Reference epoch of the source. Times given as
+            numbers are seconds since this epoch.
+    '''
+
+    def __init__(self, source, step:float=60.0, method:str='lagrange', order:int=None,
+                 tol:float=0.1, window:float=3600.0, cache_size:int=64,
+                 min_step:float=1.0):
+
+        if method not in VALID_INTERPOLATION:
+            raise RuntimeError(f'Invalid interpolation method {method}. Must be one of: {", ".join(VALID_INTERPOLATION)}')
+
+        order = _DEFAULT_ORDER[method] if order is None else order
+
+        if order < 2 or order % 2 != 0:
+            raise RuntimeError(f'Invalid interpolation order {order}. Must be an even number of at least 2.')
+
+        if step <= 0 or window <= 0 or min_step <= 0:
+            raise RuntimeError('Sampling step and window lengths must be positive.')
+
+        if cache_size < 1:
+            raise RuntimeError(f'Invalid cache size {cache_size}. Must be at least 1.')
+
+        self._source    = source
+        self.epoch      = source.epoch
+        self.step       = step
+        self.method     = method
+        self.order      = order
+        self.tol        = tol
+        self.window     = window
+        self.cache_size = cache_size
+        self.min_step   = min_step
+
+        self._windows = collections.OrderedDict()
+
+    def __getattr__(self, name:str):
+        # Delegate everything not interpolated to the source propagator
+        if name.startswith('_'):
+            raise AttributeError(name)
+
+        return getattr(self._source, name)
+
+    @property
+    def source(self):
+        '''Source of sampled states'''
+        return self._source
+
+    def clear_cache(self):
+        '''Remove all sampled windows from the cache.'''
+        self._windows.clear()
+
+    def _times(self, t:typing.Union[float, Epoch, np.ndarray, typing.List[Epoch], EpochArray],
+               epoch:typing.Optional[Epoch]=None) -> np.ndarray:
+        # Convert times to seconds since the source epoch
+        if isinstance(t, (Epoch, EpochArray)):
+            return np.atleast_1d(t - self.epoch).astype(float)
+        elif len(np.shape(t)) > 0 and len(t) > 0 and isinstance(t[0], Epoch):
+            return np.array([ti - self.epoch for ti in t], dtype=float)
+        elif epoch is not None:
+            return (epoch - self.epoch) + np.atleast_1d(np.asarray(t, dtype=float))
+        else:
+            return np.atleast_1d(np.asarray(t, dtype=float))
+
+    def _interpolate(self, t0:float, h:float, x:np.ndarray, dt:np.ndarray) -> np.ndarray:
+        '''Interpolate states from equally spaced nodes.
+
+        Args:
+            t0 (float): Time of first node. Units: [s]
+            h (float): Node spacing. Units: [s]
+            x (np.ndarray): States at nodes with shape (N, 6).
+            dt (np.ndarray): Interpolation times. Units: [s]
+
+        Returns:
+            np.ndarray: Interpolated states with shape (M, 6).
+        '''
+
+        p = self.order
+
+        # First node of the stencil centered on the interval containing each time
+        s = (dt - t0)/h
+        first = np.clip(np.floor(s).astype(int) - (p//2 - 1), 0, len(x) - p)
+
+        L, dL = _lagrange_basis(s - first, p, derivative=(self.method == 'hermite'))
+        xs = x[first[:, np.newaxis] + np.arange(p)]
+
+        if self.method == 'lagrange':
+            return np.einsum('mj,mjk->mk', L, xs)
+
+        # Hermite interpolation of positions with velocities as derivatives
+        u = (s - first)[:, np.newaxis] - np.arange(p)
+        c = np.array([sum(1.0/(j - k) for k in range(p) if k != j) for j in range(p)])
+
+        H = (1.0 - 2.0*u*c)*L**2
+        K = u*L**2
+        dH = -2.0*c*L**2 + (1.0 - 2.0*u*c)*2.0*L*dL
+        dK = L**2 + u*2.0*L*dL
+
+        r = np.einsum('mj,mjk->mk', H, xs[:, :, 0:3]) + h*np.einsum('mj,mjk->mk', K, xs[:, :, 3:6])
+        v = np.einsum('mj,mjk->mk', dH, xs[:, :, 0:3])/h + np.einsum('mj,mjk->mk', dK, xs[:, :, 3:6])
+
+        return np.hstack((r, v))
+
+    def _sample(self, w:int) -> typing.Tuple[float, float, np.ndarray]:
+        '''Sample a window of the trajectory to within the error tolerance.
+
+        Args:
+            w (int): Window index.
+
+        Returns:
+            Tuple[float, float, np.ndarray]: Time of first node, node spacing,
+                and states at nodes.
+        '''
+
+        n = max(1, math.ceil(self.window/self.step))
+        h = self.window/n
+        m = self.order//2
+
+        t = w*self.window + h*np.arange(-m, n + m + 1)
+        x = self._source.states_itrf(t)
+
+        while True:
+            # Check interpolation at the midpoints between nodes
+            t_mid = t[:-1] + h/2.0
+            x_mid = self._source.states_itrf(t_mid)
+
+            error = np.max(np.linalg.norm(self._interpolate(t[0], h, x, t_mid)[:, 0:3] - x_mid[:, 0:3], axis=1))
+
+            # Current spacing meets the tolerance
+            if error <= self.tol:
+                break
+
+            # Merge midpoints into nodes
+            t_merged = np.empty(2*len(t) - 1)
+            x_merged = np.empty((2*len(t) - 1, 6))
+            t_merged[0::2], t_merged[1::2] = t, t_mid
+            x_merged[0::2], x_merged[1::2] = x, x_mid
+
+            t, x, h = t_merged, x_merged, h/2.0
+
+            if h < self.min_step:
+                break
+
+        return t[0], h, x
+
+    def _window(self, w:int) -> typing.Tuple[float, float, np.ndarray]:
+        # Return sampled window, updating the least recently used order
+        if w in self._windows:
+            self._windows.move_to_end(w)
+        else:
+            self._windows[w] = self._sample(w)
+
+            if len(self._windows) > self.cache_size:
+                self._windows.popitem(last=False)
+
+        return self._windows[w]
+
+    def states_itrf(self, t:typing.Union[np.ndarray, typing.List[Epoch], EpochArray],
+                    epoch:typing.Optional[Epoch]=None) -> np.ndarray:
+        '''Interpolate the states at the times in the ITRF Earth-Fixed (ECEF) frame.
+
+        Args:
+            t (Union[np.ndarray, List[Epoch], EpochArray]): Times as either
+                epochs or time since `epoch` in seconds.
+            epoch (:obj:`Epoch`, optional): Reference epoch of times. Defaults
+                to the source epoch.
+
+        Returns:
+            np.ndarray: Satellite states (position and velocity) with shape (N, 6). Units: [m ; m/s]
+        '''
+
+        dt = self._times(t, epoch=epoch)
+        x = np.empty((len(dt), 6))
+
+        windows = np.floor(dt/self.window).astype(int)
+
+        for w in np.unique(windows):
+            idx = np.nonzero(windows == w)[0]
+            x[idx] = self._interpolate(*self._window(int(w)), dt[idx])
+
+        return x
+
+    def states_ecef(self, t:typing.Union[np.ndarray, typing.List[Epoch], EpochArray],
+                    epoch:typing.Optional[Epoch]=None) -> np.ndarray:
+        '''Interpolate the states at the times in the Earth-Fixed (ECEF) frame.
+        The ECEF frame used here is the ITRF frame.
+
+        Args:
+            t (Union[np.ndarray, List[Epoch], EpochArray]): Times as either
+                epochs or time since `epoch` in seconds.
+            epoch (:obj:`Epoch`, optional): Reference epoch of times. Defaults
+                to the source epoch.
+
+        Returns:
+            np.ndarray: Satellite states (position and velocity) with shape (N, 6). Units: [m ; m/s]
+        '''
+        return self.states_itrf(t, epoch=epoch)
+
+    def state_itrf(self, t:typing.Union[float, Epoch]) -> np.ndarray:
+        '''Interpolate the state at the time in the ITRF Earth-Fixed (ECEF) frame.
+
+        Args:
+            t (:obj:`Epoch`): Time as either an Epoch or time since epoch in seconds.
+
+        Returns:
+            np.ndarray: Satellite state (position and velocity) at Epoch. Units: [m ; m/s]
+        '''
+
+        dt = t - self.epoch if isinstance(t, Epoch) else float(t)
+
+        t0, h, x = self._window(math.floor(dt/self.window))
+
+        if self.method != 'lagrange':
+            return self._interpolate(t0, h, x, np.array([dt]))[0, :]
+
+        # Evaluate the basis of a single time without array overhead
+        p = self.order
+        s = (dt - t0)/h
+        first = min(max(math.floor(s) - (p//2 - 1), 0), len(x) - p)
+        d = [s - first - j for j in range(p)]
+
+        prefix = [1.0]*p
+        suffix = [1.0]*p
+        for j in range(1, p):
+            prefix[j] = prefix[j - 1]*d[j - 1]
+            suffix[p - 1 - j] = suffix[p - j]*d[p - j]
+
+        L = np.array([a*b for a, b in zip(prefix, suffix)])/_basis_denominators(p)
+
+        return L @ x[first:first + p]
+
+    def state_ecef(self, t:typing.Union[float, Epoch]) -> np.ndarray:
+        '''Interpolate the state at the time in the Earth-Fixed (ECEF) frame.
+        The ECEF frame used here is the ITRF frame.
+
+        Args:
+            t (:obj:`Epoch`): Time as either an Epoch or time since epoch in seconds.
+
+        Returns:
+            np.ndarray: Satellite state (position and velocity) at Epoch. Units: [m ; m/s]
+        '''
+        return self.state_itrf(t)
@@ -16,6 +16,7 @@ import copy     as copy
 import pysofa2  as _sofa
 import math     as math
 import typing   as typing
+import numpy    as np
 
 # Brahe Imports
 from   brahe.utils       import logger
@@ -734,4 +735,389 @@ def epoch_range(epoch_start, epoch_end, step=1.0):
     # as the last step, output one more epoch. This allows for non-integer
     # divisible ranges, while still preventing duplicates of the final step.
     if math.fabs(h) > 1.0e-10:
-        yield Epoch(epc)
\ No newline at end of file
+        yield Epoch(epc)
+
+####################
+# EpochArray Class #
+####################
+
+def _align_epoch_arrays(days:np.ndarray, seconds:np.ndarray, nanoseconds:np.ndarray):
+    # Vectorized equivalent of _align_epoch_data. Inputs may be offset by any
+    # number of whole days or seconds.
+
+    # Align nanoseconds to [0, 1.0e9)
+    dseconds    = np.floor(nanoseconds/1.0e9)
+    nanoseconds = nanoseconds - dseconds*1.0e9
+    seconds     = seconds + dseconds.astype(np.int64)
+
+    # Guard against rounding of values just below 1.0e9
+    wrap = nanoseconds >= 1.0e9
+    nanoseconds = np.where(wrap, nanoseconds - 1.0e9, nanoseconds)
+    seconds     = seconds + wrap
+
+    # Align seconds to [0, 86400)
+    ddays, seconds = np.divmod(seconds, 86400)
+    days = days + ddays
+
+    return days.astype(np.int64), seconds.astype(np.int64), nanoseconds.astype(np.float64)
+
+def _epoch_array_offsets(days:np.ndarray, seconds:np.ndarray, nanoseconds:np.ndarray, tsys_src:str, tsys_dest:str) -> np.ndarray:
+    '''Compute time system offsets for arrays of TAI epoch data.
+
+    Offsets between time systems are piecewise constant within a day, changing
+    at most once in any TAI day (at the start of the UTC day). Offsets are
+    therefore evaluated by the scalar ``time_system_offset`` at the first and
+    last epoch of each unique day, with the change point located by bisection
+    if they differ. Results are identical to evaluating every epoch individually.
+
+    Args:
+        days (np.ndarray): Days component of epochs
+        seconds (np.ndarray): Seconds component of epochs
+        nanoseconds (np.ndarray): Nanoseconds component of epochs
+        tsys_src (str): Base time system
+        tsys_dest (str): Destination time system
+
+    Returns:
+        np.ndarray: Offset between source and destination time systems. Units: [s]
+    '''
+
+    offsets = np.zeros(len(days))
+
+    if tsys_src == tsys_dest or len(days) == 0:
+        return offsets
+
+    fd = (seconds + nanoseconds/1.0e9)/86400.0
+
+    def offset(k):
+        return _bhtime.time_system_offset(days[k], fd[k], tsys_src, tsys_dest)
+
+    # Sort epochs by time so each day forms a contiguous, ordered block
+    order = np.lexsort((fd, days))
+    sdays = days[order]
+    bounds = np.flatnonzero(np.diff(sdays)) + 1
+    starts = np.concatenate(([0], bounds))
+    ends   = np.concatenate((bounds, [len(order)]))
+
+    for start, end in zip(starts, ends):
+        o_first = offset(order[start])
+        o_last  = offset(order[end - 1])
+
+        if o_first == o_last:
+            offsets[order[start:end]] = o_first
+            continue
+
+        # Bisect for the first epoch taking the final offset
+        lo, hi = start, end - 1
+        while hi - lo > 1:
+            mid = (lo + hi)//2
+            if offset(order[mid]) == o_last:
+                hi = mid
+            else:
+                lo = mid
+
+        offsets[order[start:hi]] = o_first
+        offsets[order[hi:end]]   = o_last
+
+    return offsets
+
+def _era00(d1:np.ndarray, d2:np.ndarray) -> np.ndarray:
+    """Earth rotation angle (IAU 2000 model) of two-part UT1 Julian dates.
+    Vectorized equivalent of SOFA `Era00`.
+
+    Args:
+        d1 (np.ndarray): First part of two-part UT1 Julian dates.
+        d2 (np.ndarray): Second part of two-part UT1 Julian dates.
+
+    Returns:
+        era (np.ndarray): Earth rotation angle. Units: *rad*
+    """
+
+    # Days since J2000.0 and fractional part of the date
+    t = d1 + (d2 - 2451545.0)
+    f = np.fmod(d1, 1.0) + np.fmod(d2, 1.0)
+
+    return np.mod(2.0*np.pi*(f + 0.7790572732640 + 0.00273781191135448*t), 2.0*np.pi)
+
+def _gmst06(uta:np.ndarray, utb:np.ndarray, tta:np.ndarray, ttb:np.ndarray) -> np.ndarray:
+    # Vectorized implementation of the SOFA Gmst06 function
+    t = ((tta - 2451545.0) + ttb)/36525.0
+
+    gmst = _era00(uta, utb) + (0.014506 + (4612.156534 + (1.3915817 + (-0.00000044 + 
+           (-0.000029956 + (-0.0000000368)*t)*t)*t)*t)*t)*_constants.AS2RAD
+
+    return np.mod(gmst, 2.0*math.pi)
+
+class EpochArray():
+    """The `EpochArray` type represents an ordered collection of instants in time.
+    It stores the same internal representation as ``Epoch`` in contiguous NumPy
+    arrays, allowing arithmetic, comparisons, and time system conversions to be
+    applied to all epochs at once while retaining nanosecond precision.
+
+    Attributes:
+        tsys (str): Default time system for outputs.
+        days (np.ndarray): Elapsed days since 0 JD TAI
+        seconds (np.ndarray): Total seconds into day
+        nanoseconds (np.ndarray): Nanoseconds
+
+    Note:
+        days, seconds, and nanoseconds is stored internally in the TAI reference
+        systems. These values should not be accessed directly, but instead accessed
+        through ``EpochArray`` class methods.
+    """
+
+    def __init__(self, epochs:typing.Iterable[Epoch]=(), tsys:typing.Optional[str]=None):
+        """Initialize EpochArray from a sequence of epochs.
+
+        Constructors:
+            EpochArray([Epoch(2018, 1, 1), Epoch(2018, 1, 2)])
+            EpochArray(EpochArray([Epoch(2018, 1, 1)]))
+
+        Args:
+            epochs (Iterable[Epoch]): Epochs to store.
+            tsys (str, optional): Default time system for outputs. Defaults to
+                the time system of the first epoch, or UTC if empty.
+        """
+
+        epochs = list(epochs)
+
+        if not tsys:
+            tsys = epochs[0].tsys if len(epochs) > 0 else 'UTC'
+
+        # Validate time system input
+        if not valid_time_system(tsys):
+            raise RuntimeError('Invalid time system %s' % tsys)
+
+        self.tsys        = tsys
+        self.days        = np.array([epc.days for epc in epochs], dtype=np.int64)
+        self.seconds     = np.array([epc.seconds for epc in epochs], dtype=np.int64)
+        self.nanoseconds = np.array([epc.nanoseconds for epc in epochs], dtype=np.float64)
+
+    @classmethod
+    def _from_data(cls, days:np.ndarray, seconds:np.ndarray, nanoseconds:np.ndarray, tsys:str='UTC'):
+        epcs = cls(tsys=tsys)
+        epcs.days, epcs.seconds, epcs.nanoseconds = _align_epoch_arrays(
+            np.asarray(days, dtype=np.int64), 
+            np.asarray(seconds, dtype=np.int64), 
+            np.asarray(nanoseconds, dtype=np.float64)
+        )
+
+        return epcs
+
+    @classmethod
+    def from_offsets(cls, epoch:Epoch, offsets:typing.Union[np.ndarray, typing.List[float]]):
+        """Create EpochArray from a reference epoch and time offsets.
+
+        Args:
+            epoch (:obj:`Epoch`): Reference epoch
+            offsets (np.ndarray): Time offsets from reference epoch. Units: [s]
+
+        Returns:
+            :obj:`EpochArray`: Epochs at each offset from the reference epoch.
+        """
+
+        offsets = np.asarray(offsets, dtype=np.float64).reshape(-1)
+
+        return cls._from_data(np.full(len(offsets), epoch.days), 
+                              np.full(len(offsets), epoch.seconds), 
+                              np.full(len(offsets), epoch.nanoseconds), 
+                              tsys=epoch.tsys) + offsets
+
+    @classmethod
+    def range(cls, epoch_start:Epoch, epoch_end:Epoch, step:float=1.0):
+        """Create EpochArray of evenly spaced epochs between the start (inclusive)
+        and stop (inclusive) times. Equivalent to ``epoch_range``.
+
+        Args:
+            epoch_start (:obj:`Epoch`): Start epoch of range
+            epoch_end (:obj:`Epoch`): End epoch of range
+            step (float): Time increment in seconds.
+
+        Returns:
+            :obj:`EpochArray`: Sequential epochs in range from epoch_start to
+                epoch_end, inclusive.
+        """
+
+        # Make sure step size is non-zero
+        if math.fabs(step) == 0:
+            raise ValueError('A positve step size is required.')
+
+        duration = epoch_end - epoch_start
+        step     = math.copysign(math.fabs(step), duration)
+
+        # Number of full steps strictly before the end epoch
+        n = max(int(math.ceil(duration/step - 1.0e-10/math.fabs(step))), 0) if duration != 0 else 0
+
+        offsets = np.arange(n)*step
+        if duration != 0:
+            offsets = np.append(offsets, duration)
+
+        return cls.from_offsets(epoch_start, offsets)
+
+    def to_epochs(self) -> typing.List[Epoch]:
+        """Convert EpochArray into a list of ``Epoch`` objects.
+
+        Returns:
+            List[Epoch]: Epochs
+        """
+
+        return [self[k] for k in range(len(self))]
+
+    def __len__(self):
+        return len(self.days)
+
+    def __iter__(self):
+        for k in range(len(self)):
+            yield self[k]
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            epc = Epoch.__new__(Epoch)
+            epc.tsys        = self.tsys
+            epc.days        = int(self.days[index])
+            epc.seconds     = int(self.seconds[index])
+            epc.nanoseconds = float(self.nanoseconds[index])
+
+            return epc
+        else:
+            epcs = EpochArray(tsys=self.tsys)
+            epcs.days        = self.days[index]
+            epcs.seconds     = self.seconds[index]
+            epcs.nanoseconds = self.nanoseconds[index]
+
+            return epcs
+
+    # Artithmetic
+    def __add__(self, other):
+        other = np.asarray(other, dtype=np.float64)
+
+        # Immidiately separate seconds and fractional seconds
+        seconds, fseconds = np.divmod(other, 1.0)
+
+        return EpochArray._from_data(self.days, 
+                                     self.seconds + seconds.astype(np.int64), 
+                                     self.nanoseconds + fseconds*1.0e9, 
+                                     tsys=self.tsys)
+
+    def __radd__(self, other):
+        return self.__add__(other)
+
+    def __sub__(self, other):
+        if isinstance(other, (Epoch, EpochArray)):
+            # Difference between epochs
+            return (self.days - other.days)*86400.0 + \
+                   (self.seconds - other.seconds) + \
+                   (self.nanoseconds - other.nanoseconds)/1e9
+        else:
+            # Subtract seconds from epochs
+            return self + -np.asarray(other, dtype=np.float64)
+
+    # Logical Operators
+    def _compare(self, other):
+        # Return integer second and nanosecond differences to other epochs
+        return ((self.days - other.days)*86400 + (self.seconds - other.seconds), 
+                self.nanoseconds - other.nanoseconds)
+
+    def __eq__(self, other):
+        ds, dns = self._compare(other)
+        return (ds == 0) & (np.abs(dns) < 10**-3)
+
+    def __ne__(self, other):
+        return ~self.__eq__(other)
+
+    def __lt__(self, other):
+        ds, dns = self._compare(other)
+        return (ds < 0) | ((ds == 0) & (dns < 0))
+
+    def __le__(self, other):
+        ds, dns = self._compare(other)
+        return (ds < 0) | ((ds == 0) & (dns <= 0))
+
+    def __gt__(self, other):
+        ds, dns = self._compare(other)
+        return (ds > 0) | ((ds == 0) & (dns > 0))
+
+    def __ge__(self, other):
+        ds, dns = self._compare(other)
+        return (ds > 0) | ((ds == 0) & (dns >= 0))
+
+    def _jdfd(self, tsys:str='UTC'):
+        """Compute the two-part dates of all epochs in a given time system.
+
+        Args:
+            tsys (str): Time system for output
+
+        Returns:
+            d1 (np.ndarray): First part of two part date. Units: *days*
+            d2 (np.ndarray): Second part of two part date. Units: *days*
+        """
+
+        offsets = _epoch_array_offsets(self.days, self.seconds, self.nanoseconds, "TAI", tsys)
+
+        return self.days.astype(np.float64), (self.seconds + offsets + self.nanoseconds/1.0e9)/86400.0
+
+    def mjd(self, tsys:typing.Optional[str]=None) -> np.ndarray:
+        """Return epochs as modified Julian dates
+
+        Args:
+            tsys (str): time system to provide output in.
+
+        Returns:
+            mjd (np.ndarray): Modified Julian dates of the epochs in the requested time system
+        """
+
+        # Use time system from initialization if none is provided
+        if not tsys:
+            tsys=self.tsys
+
+        # Validate time system input
+        if not valid_time_system(tsys):
+            raise RuntimeError('Invalid time system %s' % tsys)
+
+        jd, fd = self._jdfd(tsys=tsys)
+
+        return (jd - _constants.MJD_ZERO) + fd
+
+    def jd(self, tsys:typing.Optional[str]=None) -> np.ndarray:
+        """Compute the Julian Dates of the epochs
+
+        Args:
+            tsys (str): time system to provide output in.
+
+        Returns:
+            jd (np.ndarray): Julian dates of the epochs in the requested time system
+        """
+
+        # Use time system from initialization if none is provided
+        if not tsys:
+            tsys=self.tsys
+
+        # Validate time system input
+        if not valid_time_system(tsys):
+            raise RuntimeError('Invalid time system %s' % tsys)
+
+        jd, fd = self._jdfd(tsys=tsys)
+
+        return jd + fd
+
+    def gmst(self, use_degrees:bool=False) -> np.ndarray:
+        """Compute the Greenwich Mean Sidereal Time of the epochs.
+
+        Args:
+            use_degrees (bool): Return output in degrees (Default: false)
+
+        Returns:
+            gmst (np.ndarray): Greenwich Mean Sidereal Time [rad/deg]
+        """
+
+        uta, utb = self._jdfd(tsys="UT1")
+        tta, ttb = self._jdfd(tsys="TT")
+
+        gmst = _gmst06(uta, utb, tta, ttb)
+
+        return gmst*180.0/math.pi if use_degrees else gmst
+
+    def __str__(self):
+        return f'EpochArray({len(self)} epochs, {self.tsys})'
+
+    def __repr__(self):
+        return f'<EpochArray {hex(id(self))}: {len(self)} epochs>'
@@ -9,6 +9,9 @@ Note:
 """
 
 # Imports
+import typing
+import functools
+import math
 import numpy   as np
 import pysofa2 as _sofa
 
@@ -16,7 +19,131 @@ import pysofa2 as _sofa
 from   brahe.utils import logger, AbstractArray, fcross
 import brahe.constants as _constants
 from   brahe.eop import EOP as _EOP
-from   brahe.epoch import Epoch
+from   brahe.epoch import Epoch, EpochArray, _era00
+
+###################
+# Frame Precision #
+###################
+
+VALID_FRAME_PRECISION = ['fast', 'full']
+
+# Precision of Inertial <-> Earth-Fixed transformations
+_FRAME_PRECISION = 'fast'
+
+def set_frame_precision(precision:str) -> None:
+    """Set the precision of transformations between the inertial and Earth-fixed
+    frames.
+
+    In `fast` mode (default) bias-precession-nutation and polar motion are
+    neglected and only Earth rotation is applied. In `full` mode the IAU
+    2006/2000A CIO-based transformation is applied in full. The CIP coordinates
+    X, Y, and s are tabulated hourly from the IAU 2000B series and
+    interpolated, which is accurate to well within a microarcsecond of
+    evaluating the series at every epoch, and pole coordinates are
+    interpolated from the Earth orientation data.
+
+    Args:
+        precision (str): Transformation precision. One of: `fast`, `full`
+    """
+
+    global _FRAME_PRECISION
+
+    if precision not in VALID_FRAME_PRECISION:
+        raise RuntimeError(f"Invalid frame precision {precision}. Must be one of: {', '.join(VALID_FRAME_PRECISION)}")
+
+    _FRAME_PRECISION = precision
+
+def frame_precision() -> str:
+    """Return the precision of transformations between the inertial and
+    Earth-fixed frames.
+
+    Returns:
+        precision (str): Transformation precision. One of: `fast`, `full`
+    """
+
+    return _FRAME_PRECISION
+
+#############################
+# Tabulated CIP Coordinates #
+#############################
+
+# Spacing of tabulated CIP coordinates. Units: *days*
+_CIP_STEP = 1.0/24.0
+
+# Offsets of IAU 2006A CIP coordinates from IAU 2000B. Units: *rad*
+_DX06 =  0.0001750*_constants.AS2RAD/1.0e3
+_DY06 = -0.0002259*_constants.AS2RAD/1.0e3
+
+@functools.lru_cache(maxsize=4096)
+def _cip_nodes(day:int) -> np.ndarray:
+    """Tabulate the CIP coordinates X, Y and the CIO locator s hourly over one
+    TT day, including one node before and two after the day for interpolation.
+
+    Args:
+        day (int): Modified Julian Date of day in the TT time system.
+
+    Returns:
+        xys (np.ndarray): X, Y, s of each node with shape (27, 3). Units: *rad*
+    """
+
+    mjd = day + _CIP_STEP*np.arange(-1, 26)
+
+    xys = np.array([_sofa.Xys00b(_constants.MJD_ZERO, m) for m in mjd])
+
+    # Apply IAU2006 Offsets
+    xys[:, 0] += _DX06
+    xys[:, 1] += _DY06
+
+    xys.flags.writeable = False
+
+    return xys
+
+def _cip_coordinates(mjd_tt:typing.Union[float, np.ndarray]) -> np.ndarray:
+    """Interpolate the CIP coordinates X, Y and the CIO locator s from their
+    hourly tabulation by cubic Lagrange interpolation.
+
+    Args:
+        mjd_tt (Union[float, np.ndarray]): Modified Julian Dates in the TT time system.
+
+    Returns:
+        xys (np.ndarray): X, Y, s of each date with shape (N, 3). Units: *rad*
+    """
+
+    # Fast path for a single date which avoids array overhead
+    if np.ndim(mjd_tt) == 0:
+        day = math.floor(mjd_tt)
+        u   = (mjd_tt - day)/_CIP_STEP
+        k   = min(math.floor(u), 23)
+        t   = u - k
+
+        w = np.array([-t*(t - 1.0)*(t - 2.0)/6.0, (t + 1.0)*(t - 1.0)*(t - 2.0)/2.0,
+                      -(t + 1.0)*t*(t - 2.0)/2.0, (t + 1.0)*t*(t - 1.0)/6.0])
+
+        return (w @ _cip_nodes(day)[k:k + 4])[np.newaxis, :]
+
+    mjd = np.atleast_1d(np.asarray(mjd_tt, dtype=np.float64))
+
+    day = np.floor(mjd)
+    u   = (mjd - day)/_CIP_STEP
+    k   = np.minimum(np.floor(u), 23).astype(int)
+    t   = (u - k)[:, np.newaxis]
+
+    # Cubic Lagrange weights of the nodes before, at the start, end, and after
+    # the interval containing each date
+    w = np.hstack((-t*(t - 1.0)*(t - 2.0)/6.0, (t + 1.0)*(t - 1.0)*(t - 2.0)/2.0,
+                   -(t + 1.0)*t*(t - 2.0)/2.0, (t + 1.0)*t*(t - 1.0)/6.0))
+
+    xys = np.empty((len(mjd), 3))
+    for d in np.unique(day):
+        idx   = np.nonzero(day == d)[0]
+        nodes = _cip_nodes(int(d))[k[idx, np.newaxis] + np.arange(4)]
+        xys[idx] = np.einsum('nj,njk->nk', w[idx], nodes)
+
+    return xys
+
+def _sp00(mjd_tt:typing.Union[float, np.ndarray]) -> typing.Union[float, np.ndarray]:
+    # TIO locator s'. Vectorized equivalent of SOFA `Sp00`
+    return -47.0e-6*_constants.AS2RAD*(mjd_tt - _constants.MJD2000)/36525.0
 
 #######################################
 # IAU 2010 | Inertial <-> Earth-Fixed #
@@ -36,6 +163,12 @@ def bias_precession_nutation(epc:Epoch) -> np.ndarray:
         rc2i (np.ndarray): 3x3 Rotation matrix transforming GCRS -> CIRS
     """
 
+    if _FRAME_PRECISION == 'full':
+        # Interpolate tabulated X, Y, s terms
+        x, y, s = _cip_coordinates(epc.mjd(tsys="TT"))[0]
+
+        return _sofa.C2ixys(x, y, s)
+
     # Commenting out for speed
     # # Constants of IAU 2006A transofrmation
     # DMAS2R =  4.848136811095359935899141e-6 / 1.0e3
@@ -85,6 +218,12 @@ def polar_motion(epc:Epoch) -> np.ndarray:
     Returns:
         rpm (np.ndarray): 3x3 Rotation matrix transforming TIRS -> ITRF
     """
+
+    if _FRAME_PRECISION == 'full':
+        xp, yp = _EOP.pole_locator(epc.mjd(tsys="UTC"), interp=True)
+
+        return _sofa.Pom00(xp, yp, _sp00(epc.mjd(tsys="TT")))
+
     # Commenting out for speed
     # xp, yp = _EOP.pole_locator(epc.mjd(tsys="UTC"))
 
@@ -243,4 +382,232 @@ def sECEFtoECI(epc:Epoch, x:AbstractArray) -> np.ndarray:
                                  + 2 * fcross(omega_vec, pm.T @ x_eci[6:9])) 
 
 
-    return x_eci
\ No newline at end of file
+    return x_eci
+
+###############################
+# Batch Frame Transformations #
+###############################
+
+def _epoch_array(epcs:typing.Union[EpochArray, Epoch, typing.List[Epoch]]) -> EpochArray:
+    # Accept a single Epoch or any sequence of Epochs
+    if isinstance(epcs, EpochArray):
+        return epcs
+    elif isinstance(epcs, Epoch):
+        return EpochArray([epcs])
+    else:
+        return EpochArray(epcs)
+
+def _rotation_batch(axis:int, angle:np.ndarray) -> np.ndarray:
+    """Rotation matrices about a coordinate axis following the SOFA `Rx`,
+    `Ry`, `Rz` conventions.
+
+    Args:
+        axis (int): Index of rotation axis.
+        angle (np.ndarray): Rotation angles. Units: *rad*
+
+    Returns:
+        r (np.ndarray): Rotation matrices. Shape (N, 3, 3)
+    """
+
+    i, j = [(1, 2), (2, 0), (0, 1)][axis]
+    c, s = np.cos(angle), np.sin(angle)
+
+    r = np.zeros((len(angle), 3, 3))
+    r[:, axis, axis] = 1.0
+    r[:, i, i] = c
+    r[:, i, j] = s
+    r[:, j, i] = -s
+    r[:, j, j] = c
+
+    return r
+
+def bias_precession_nutation_batch(epcs:typing.Union[EpochArray, typing.List[Epoch]]) -> np.ndarray:
+    """Computes the Bias-Precession-Nutation matrices of multiple epochs.
+    Equivalent to applying `bias_precession_nutation` to each epoch.
+
+    Args:
+        epcs (EpochArray): Epochs of transformation
+
+    Returns:
+        rc2i (np.ndarray): Rotation matrices transforming GCRS -> CIRS. Shape (N, 3, 3)
+    """
+
+    epcs = _epoch_array(epcs)
+
+    if _FRAME_PRECISION == 'full':
+        x, y, s = _cip_coordinates(epcs.mjd(tsys="TT")).T
+
+        # Vectorized equivalent of SOFA C2ixys
+        r2 = x*x + y*y
+        e  = np.where(r2 > 0.0, np.arctan2(y, x), 0.0)
+        d  = np.arctan(np.sqrt(r2/(1.0 - r2)))
+
+        return _rotation_batch(2, -(e + s)) @ _rotation_batch(1, d) @ _rotation_batch(2, e)
+
+    # Matches the identity shortcut of bias_precession_nutation
+    return np.broadcast_to(np.eye(3), (len(epcs), 3, 3)).copy()
+
+def earth_rotation_batch(epcs:typing.Union[EpochArray, typing.List[Epoch]]) -> np.ndarray:
+    """Computes the Earth rotation matrices of multiple epochs. Equivalent to
+    applying `earth_rotation` to each epoch.
+
+    Args:
+        epcs (EpochArray): Epochs of transformation
+
+    Returns:
+        r (np.ndarray): Rotation matrices transforming CIRS -> TIRS. Shape (N, 3, 3)
+    """
+
+    epcs = _epoch_array(epcs)
+
+    # Earth rotation angle is linear in UT1
+    era = _era00(*epcs._jdfd(tsys="UT1"))
+
+    return _rotation_batch(2, era)
+
+def polar_motion_batch(epcs:typing.Union[EpochArray, typing.List[Epoch]]) -> np.ndarray:
+    """Computes the polar motion matrices of multiple epochs. Equivalent to
+    applying `polar_motion` to each epoch.
+
+    Args:
+        epcs (EpochArray): Epochs of transformation
+
+    Returns:
+        rpm (np.ndarray): Rotation matrices transforming TIRS -> ITRF. Shape (N, 3, 3)
+    """
+
+    epcs = _epoch_array(epcs)
+
+    if _FRAME_PRECISION == 'full':
+        xp, yp = _EOP.pole_locator(epcs.mjd(tsys="UTC"), interp=True)
+
+        # Vectorized equivalent of SOFA Pom00
+        return _rotation_batch(0, -yp) @ _rotation_batch(1, -xp) @ _rotation_batch(2, _sp00(epcs.mjd(tsys="TT")))
+
+    # Matches the identity shortcut of polar_motion
+    return np.broadcast_to(np.eye(3), (len(epcs), 3, 3)).copy()
+
+def rECItoECEF_batch(epcs:typing.Union[EpochArray, typing.List[Epoch]]) -> np.ndarray:
+    """Computes the combined rotation matrices from the inertial to the
+    Earth-fixed reference frame of multiple epochs. Equivalent to applying
+    `rECItoECEF` to each epoch.
+
+    Args:
+        epcs (EpochArray): Epochs of transformation
+
+    Returns:
+        r (np.ndarray): Rotation matrices transforming GCRF -> ITRF. Shape (N, 3, 3)
+    """
+
+    epcs = _epoch_array(epcs)
+
+    rc2i = bias_precession_nutation_batch(epcs)
+    r    = earth_rotation_batch(epcs)
+    rpm  = polar_motion_batch(epcs)
+
+    return rpm @ r @ rc2i
+
+def rECEFtoECI_batch(epcs:typing.Union[EpochArray, typing.List[Epoch]]) -> np.ndarray:
+    """Computes the combined rotation matrices from the Earth-fixed to the
+    inertial reference frame of multiple epochs. Equivalent to applying
+    `rECEFtoECI` to each epoch.
+
+    Args:
+        epcs (EpochArray): Epochs of transformation
+
+    Returns:
+        r (np.ndarray): Rotation matrices transforming ITRF -> GCRF. Shape (N, 3, 3)
+    """
+
+    return np.swapaxes(rECItoECEF_batch(epcs), 1, 2)
+
+def _check_batch_states(epcs:EpochArray, x:np.ndarray):
+    # States must have position or position and velocity for every epoch
+    if x.ndim < 2 or x.shape[-1] not in (3, 6) or x.shape[-2] != len(epcs):
+        raise RuntimeError(f"Input states must have shape (..., {len(epcs)}, 3) or (..., {len(epcs)}, 6). Found {x.shape}.")
+
+def sECItoECEF_batch(epcs:typing.Union[EpochArray, typing.List[Epoch]], x:AbstractArray) -> np.ndarray:
+    """Transforms Earth inertial states into Earth fixed states at multiple
+    epochs. Equivalent to applying `sECItoECEF` to each state.
+
+    Args:
+        epcs (EpochArray): Epochs of transformation
+        x (np.ndarray): Inertial states (position, velocity) with shape
+            (..., N, 6), or positions with shape (..., N, 3). Units: [*m*; *m/s*]
+
+    Returns:
+        x_ecef (np.ndarray): Earth-fixed states (position, velocity)
+    """
+
+    epcs = _epoch_array(epcs)
+    x    = np.asarray(x, dtype=float)
+
+    _check_batch_states(epcs, x)
+
+    # Compute Sequential Transformation Matrices
+    rc2i = bias_precession_nutation_batch(epcs)
+    r    = earth_rotation_batch(epcs)
+    pm   = polar_motion_batch(epcs)
+
+    # Rotations are applied to the states one at a time since that is cheaper
+    # than composing the matrices of every epoch
+    def _tirs(v):
+        return np.einsum('nij,...nj->...ni', r, np.einsum('nij,...nj->...ni', rc2i, v))
+
+    x_ecef = np.empty_like(x)
+
+    # Rotate into the terrestrial intermediate frame
+    r_tirs = _tirs(x[..., 0:3])
+    x_ecef[..., 0:3] = np.einsum('nij,...nj->...ni', pm, r_tirs)
+
+    if x.shape[-1] == 6:
+        # Remove Earth rotation rate. Neglect LOD effect
+        v_tirs = _tirs(x[..., 3:6])
+        v_tirs[..., 0] += _constants.OMEGA_EARTH*r_tirs[..., 1]
+        v_tirs[..., 1] -= _constants.OMEGA_EARTH*r_tirs[..., 0]
+
+        x_ecef[..., 3:6] = np.einsum('nij,...nj->...ni', pm, v_tirs)
+
+    return x_ecef
+
+def sECEFtoECI_batch(epcs:typing.Union[EpochArray, typing.List[Epoch]], x:AbstractArray) -> np.ndarray:
+    """Transforms Earth fixed states into inertial states at multiple epochs.
+    Equivalent to applying `sECEFtoECI` to each state.
+
+    Args:
+        epcs (EpochArray): Epochs of transformation
+        x (np.ndarray): Earth-fixed states (position, velocity) with shape
+            (..., N, 6), or positions with shape (..., N, 3). Units: [*m*; *m/s*]
+
+    Returns:
+        x_eci (np.ndarray): Inertial states (position, velocity)
+    """
+
+    epcs = _epoch_array(epcs)
+    x    = np.asarray(x, dtype=float)
+
+    _check_batch_states(epcs, x)
+
+    # Compute Sequential Transformation Matrices
+    bpn = bias_precession_nutation_batch(epcs)
+    rot = earth_rotation_batch(epcs)
+    pm  = polar_motion_batch(epcs)
+
+    def _gcrf(v):
+        return np.einsum('nji,...nj->...ni', bpn, np.einsum('nji,...nj->...ni', rot, v))
+
+    x_eci = np.empty_like(x)
+
+    # Remove polar motion
+    r_tirs = np.einsum('nji,...nj->...ni', pm, x[..., 0:3])
+    x_eci[..., 0:3] = _gcrf(r_tirs)
+
+    if x.shape[-1] == 6:
+        # Add Earth rotation rate. Neglect LOD effect
+        v_tirs = np.einsum('nji,...nj->...ni', pm, x[..., 3:6])
+        v_tirs[..., 0] -= _constants.OMEGA_EARTH*r_tirs[..., 1]
+        v_tirs[..., 1] += _constants.OMEGA_EARTH*r_tirs[..., 0]
+
+        x_eci[..., 3:6] = _gcrf(v_tirs)
+
+    return x_eci
@@ -1,5 +1,12 @@
 from .gravity import (
     accel_point_mass,
+    accel_gravity_batch,
+)
+
+from .propagator import (
+    ForceModel,
+    NumericalPropagator,
+    Trajectory,
 )
 
 # from .drag import ()
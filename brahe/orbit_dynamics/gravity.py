@@ -11,7 +11,7 @@ import numpy   as np
 import numba   as numba
 
 # Internal Imports
-from   brahe.utils import kron_delta, AbstractArray
+from   brahe.utils import kron_delta, AbstractArray, load_cached_array
 import brahe.constants   as _constants
 from   brahe.epoch       import Epoch
 import brahe.ephemerides as _ephem
@@ -23,6 +23,94 @@ logger = logging.getLogger(__name__)
 GRAV_MODEL_EGM2008_90 = _constants.DATA_PATH / 'EGM2008_90.gfc'
 GRAV_MODEL_GGM05C     = _constants.DATA_PATH / 'GGM05C.gfc'
 
+# Version of parsed coefficient matrix layout stored in binary caches
+_GRAVITY_CACHE_VERSION = 1
+
+##########################
+# Gravity Model File I/O #
+##########################
+
+def _read_gfc_header(filepath:str) -> dict:
+    '''Read the header of an ICGEM gravity field (.gfc) file.
+
+    Args:
+        filepath (str): Path to gravity model file
+
+    Returns:
+        dict: Header values keyed by GravityModel attribute name.
+    '''
+
+    header = {}
+
+    with open(filepath) as fp:
+        # Read first line
+        line = fp.readline()
+        
+        # Read header
+        while line[0:11] != 'end_of_head':
+            line = fp.readline()
+
+            if line[0:9] == 'modelname':
+                header['modelname'] = line.split()[1]
+            elif line[0:22] == 'earth_gravity_constant':
+                header['gm'] = float(line.split()[1])
+            elif line[0:6] == 'radius':
+                header['radius'] = float(line.split()[1])
+            elif line[0:10] == 'max_degree':
+                header['n_max'] = int(line.split()[1])
+                header['m_max'] = header['n_max']
+            elif line[0:6] == 'errors':
+                header['errors'] = line.split()[1]
+            elif line[0:4] == 'norm':
+                header['normalization'] = line.split()[1]
+            elif line[0:11] == 'tide_system':
+                header['tides'] = line.split()[1]
+
+    return header
+
+def _read_gfc_coefficients(filepath:str) -> np.ndarray:
+    '''Read the coefficients of an ICGEM gravity field (.gfc) file.
+
+    Args:
+        filepath (str): Path to gravity model file
+
+    Returns:
+        np.ndarray: Coefficient matrix. C coeffients are store in the lower 
+            triangular corner and diagonal S coeffients in the upper triangular
+            corner excluding the diagonal.
+    '''
+
+    header = _read_gfc_header(filepath)
+
+    # Initialize CS
+    data = np.zeros((header['n_max'] + 1, header['m_max'] + 1))
+
+    with open(filepath) as fp:
+        # Skip header
+        for line in fp:
+            if line[0:11] == 'end_of_head':
+                break
+
+        # Read in gravity model data:
+        for line in fp:
+            # Reformat possible scietific notation characters to e
+            line = line.replace('d', 'e').replace('D', 'e')
+
+            # Expand line into values
+            _, n, m, C, S, sig_c, sig_s = line.replace('d','e').split()
+
+            # Convert values from string to numeric types
+            n     = int(n)
+            m     = int(m)
+            C     = float(C)
+            S     = float(S)
+
+            # Store coefficients in matrix
+            data[n, m]     = C
+            data[m - 1, n] = S  
+
+    return data
+
 #######################
 # Gravity Model Class #
 #######################
@@ -45,6 +133,7 @@ class GravityModel():
 
     # Initialize class variables
     _data        = np.array((1, 1))
+    _denormalized = {}
     _initialized = False
     n_max        = 0
     m_max        = 0
@@ -83,12 +172,38 @@ class GravityModel():
         return cls.normalization == 'fully_normalized'
 
     @classmethod
-    def load(cls, filepath=GRAV_MODEL_EGM2008_90):
+    def denormalized_coefficients(cls, n_max:int, m_max:int) -> np.ndarray:
+        '''Return unnormalized gravity model coefficients truncated to the
+        requested degree and order. Coefficients are denormalized once per 
+        model, degree, and order and cached for subsequent calls.
+
+        Args:
+            n_max (int): Maximum gravity model degree
+            m_max (int): Maximum gravity model order
+
+        Returns:
+            np.ndarray: Read-only unnormalized coefficient matrix in the same
+                layout as the model data matrix.
+        '''
+
+        key = (cls.modelname, n_max, m_max)
+
+        if key not in cls._denormalized:
+            CS = _denormalize_coefficients(np.ascontiguousarray(cls._data), n_max, m_max, cls.is_normalized())
+            CS.flags.writeable = False
+            cls._denormalized[key] = CS
+
+        return cls._denormalized[key]
+
+    @classmethod
+    def load(cls, filepath=GRAV_MODEL_EGM2008_90, use_cache=True):
         '''Loads spherical harmonic gravity model file into memory.
 
         Arguments:
             filepath - String path to gravity field model to load.
                         (Default: EGM2008_90)
+            use_cache - Read and write a binary coefficient cache stored next
+                        to the model file. (Default: True)
 
         Notes:
             1) Will convert normalized coefficients into unnormalized values for
@@ -97,7 +212,11 @@ class GravityModel():
             2) Will convert correct C2,0 term so the gravity model is a 
                'zero-tide' gravity model.
 
-            3) Claification on the terminology of tides:
+            3) Coefficients are parsed once and stored in a binary sidecar
+               file. Subsequent loads memory-map the coefficient matrix 
+               read-only, allowing processes to share one physical copy.
+
+            4) Claification on the terminology of tides:
                 'tide-free' - the gravity field of the Earth assuming that the
                               moon and sun do not exist.
 
@@ -115,54 +234,19 @@ class GravityModel():
         '''
 
         logger.debug(f'GravityModel loading from file: {filepath}')
-        
-        # Open file
-        with open(filepath) as fp:
-            # Read first line
-            line = fp.readline()
-            
-            # Read header
-            while line[0:11] != 'end_of_head':
-                line = fp.readline()
-
-                if line[0:9] == 'modelname':
-                    cls.modelname = line.split()[1]
-                elif line[0:22] == 'earth_gravity_constant':
-                    cls.gm = float(line.split()[1])
-                elif line[0:6] == 'radius':
-                    cls.radius = float(line.split()[1])
-                elif line[0:10] == 'max_degree':
-                    cls.n_max = int(line.split()[1])
-                    cls.m_max = cls.n_max
-                elif line[0:6] == 'errors':
-                    cls.errors = line.split()[1]
-                elif line[0:4] == 'norm':
-                    cls.normalization = line.split()[1]
-                elif line[0:11] == 'tide_system':
-                    cls.tides = line.split()[1]
-
-            # Initialize CS
-            cls._data = np.zeros((cls.n_max + 1, cls.m_max + 1))
-
-            # Read in gravity model data:
-            for line in fp:
-                # Reformat possible scietific notation characters to e
-                line = line.replace('d', 'e').replace('D', 'e')
-
-                # Expand line into values
-                _, n, m, C, S, sig_c, sig_s = line.replace('d','e').split()
-
-                # Convert values from string to numeric types
-                n     = int(n)
-                m     = int(m)
-                C     = float(C)
-                S     = float(S)
-                sig_c = float(sig_c)
-                sig_s = float(sig_s)
-
-                # Store coefficients in matrix
-                cls._data[n, m]     = C
-                cls._data[m - 1, n] = S  
+
+        # Read model parameters
+        for name, value in _read_gfc_header(filepath).items():
+            setattr(cls, name, value)
+
+        # Read coefficients
+        if use_cache:
+            cls._data = load_cached_array(filepath, _read_gfc_coefficients, tag='gravity', version=_GRAVITY_CACHE_VERSION)
+        else:
+            cls._data = _read_gfc_coefficients(filepath)
+
+        # Clear denormalized coefficients of previous model
+        cls._denormalized = {}
 
         cls._initialized = True
 
@@ -234,28 +318,70 @@ def _facprod(n:int, m:int) -> float:
     return p
 
 @numba.jit(nopython=True, cache=True)
-def _compute_spherical_harmonics(r_bf: np.ndarray, CS: np.ndarray, n_max: int, 
-                                   m_max: int, r_ref: float, GM: float,
-                                   is_normalized: bool) -> np.ndarray:
-    '''Compute spherical harmonic expansion for gravity field. Internal helper
-    method used by accel_gravity. To enable JIT compiling of the primary computational
-    worload of the 
+def _denormalize_coefficients(CS: np.ndarray, n_max: int, m_max: int, 
+                              is_normalized: bool) -> np.ndarray:
+    '''Compute unnormalized gravity field coefficients truncated to the given
+    degree and order. Internal helper method used by GravityModel.
+
+    Args:
+        CS (:obj:`np.ndarray`): Gravity model coefficient matrix
+        n_max (int): Maximum gravity model degree
+        m_max (int): Maximum gravity model order
+        is_normalized (bool): Whether input coefficients are fully normalized
+
+    Returns:
+        np.ndarray: Unnormalized coefficients in the same layout as the input 
+            matrix.
+    '''
+
+    size = max(n_max, m_max) + 1
+    CSu  = np.zeros((size, size))
+
+    for m in range(m_max+1):
+        for n in range(m, n_max+1):
+            if m == 0:
+                # Denormalize coefficients, if required
+                if is_normalized:
+                    N = math.sqrt(2*n + 1)
+                    CSu[n, 0] = N * CS[n, 0]
+                else:
+                    CSu[n, 0] = CS[n, 0]
+            else:
+                # Denormalize coefficients, if required
+                if is_normalized:
+                    N = math.sqrt((2 - kron_delta(0,m)) * (2*n + 1) * _facprod(n, m))
+                    CSu[n, m]     = N * CS[n, m]
+                    CSu[m - 1, n] = N * CS[m -1, n]
+                else:
+                    CSu[n, m]     = CS[n, m]
+                    CSu[m - 1, n] = CS[m -1, n]
+
+    return CSu
+
+@numba.jit(nopython=True, cache=True)
+def _spherical_harmonics_kernel(r_bf: np.ndarray, CS: np.ndarray, n_max: int, 
+                                m_max: int, r_ref: float, GM: float,
+                                V: np.ndarray, W: np.ndarray, a_bf: np.ndarray) -> None:
+    '''Compute spherical harmonic expansion for gravity field using provided
+    scratch matrices. Internal helper method shared by the single-point and 
+    batch gravity computations.
 
     Args:
         r_bf (:obj:`np.ndarray`): Position in body-fixed frame
-        CS (:obj:`np.ndarray)
+        CS (:obj:`np.ndarray): Unnormalized gravity model coefficients
+        V (:obj:`np.ndarray`): Scratch matrix of at least (n_max+2, n_max+2).
+            Contents are overwritten.
+        W (:obj:`np.ndarray`): Scratch matrix of at least (n_max+2, n_max+2).
+            Contents are overwritten.
+        a_bf (:obj:`np.ndarray`): Output body-fixed acceleration
     '''
 
     # Auxiliary quantities
-    r_sqr = np.dot(r_bf, r_bf) # Square of distance
+    r_sqr = r_bf[0]*r_bf[0] + r_bf[1]*r_bf[1] + r_bf[2]*r_bf[2] # Square of distance
     rho   = r_ref * r_ref / r_sqr
     x0    = r_ref * r_bf[0] / r_sqr # Normalized
     y0    = r_ref * r_bf[1] / r_sqr # coordinates
     z0    = r_ref * r_bf[2] / r_sqr
-
-    # Initialize V and W intemetidary matrices
-    V = np.zeros((n_max+2, n_max+2))
-    W = np.zeros((n_max+2, n_max+2))
     
     # Calculate zonal terms V(n,0); set W(n,0)=0.0
     V[0, 0] = r_ref / math.sqrt(r_sqr)
@@ -288,25 +414,14 @@ def _compute_spherical_harmonics(r_bf: np.ndarray, CS: np.ndarray, n_max: int,
     for m in range(m_max+1):
         for n in range(m, n_max+1):
             if m == 0:
-                # Denormalize coefficients, if required
-                if is_normalized:
-                    N = math.sqrt(2*n + 1)
-                    C = N * CS[n, 0]
-                else:
-                    C = CS[n, 0]
+                C = CS[n, 0]
 
                 ax -= C * V[n + 1, 1]
                 ay -= C * W[n + 1, 1]
                 az -= (n + 1) * C * V[n + 1, 0]
             else:
-                # Denormalize coefficients, if required
-                if is_normalized:
-                    N = math.sqrt((2 - kron_delta(0,m)) * (2*n + 1) * _facprod(n, m))
-                    C = N * CS[n, m]
-                    S = N * CS[m -1, n]
-                else:
-                    C = CS[n, m]
-                    S = CS[m -1, n]
+                C = CS[n, m]
+                S = CS[m -1, n]
 
                 Fac  = 0.5 * (n - m + 1) * (n - m + 2)
                 ax  += + 0.5 * (-C * V[n + 1, m + 1] - S * W[n + 1, m + 1]) \
@@ -316,7 +431,59 @@ def _compute_spherical_harmonics(r_bf: np.ndarray, CS: np.ndarray, n_max: int,
                 az  += (n - m + 1) * (-C * V[n + 1, m] - S * W[n + 1, m])
 
     # Body-fixed acceleration
-    a_bf = (GM / (r_ref * r_ref)) * np.array([ax, ay, az])
+    a_bf[0] = (GM / (r_ref * r_ref)) * ax
+    a_bf[1] = (GM / (r_ref * r_ref)) * ay
+    a_bf[2] = (GM / (r_ref * r_ref)) * az
+
+@numba.jit(nopython=True, cache=True)
+def _compute_spherical_harmonics(r_bf: np.ndarray, CS: np.ndarray, n_max: int, 
+                                   m_max: int, r_ref: float, GM: float) -> np.ndarray:
+    '''Compute spherical harmonic expansion for gravity field. Internal helper
+    method used by accel_gravity. To enable JIT compiling of the primary computational
+    worload of the 
+
+    Args:
+        r_bf (:obj:`np.ndarray`): Position in body-fixed frame
+        CS (:obj:`np.ndarray): Unnormalized gravity model coefficients
+    '''
+
+    # Initialize V and W intemetidary matrices
+    size = max(n_max, m_max) + 2
+    V = np.zeros((size, size))
+    W = np.zeros((size, size))
+
+    a_bf = np.zeros(3)
+    _spherical_harmonics_kernel(r_bf, CS, n_max, m_max, r_ref, GM, V, W, a_bf)
+
+    return a_bf
+
+@numba.jit(nopython=True, parallel=True, cache=True)
+def _compute_spherical_harmonics_batch(r_bf: np.ndarray, CS: np.ndarray, n_max: int, 
+                                       m_max: int, r_ref: float, GM: float,
+                                       n_chunks: int) -> np.ndarray:
+    '''Compute spherical harmonic expansion for gravity field at many points.
+    Internal helper method used by accel_gravity_batch. Points are split into
+    one contiguous chunk per thread so V and W scratch matrices are allocated
+    once per thread and reused across all points of the chunk.
+
+    Args:
+        r_bf (:obj:`np.ndarray`): Positions in body-fixed frame. Shape (N, 3)
+        CS (:obj:`np.ndarray): Unnormalized gravity model coefficients
+        n_chunks (int): Number of chunks to split points into. Should be equal
+            to the number of threads.
+    '''
+
+    N    = r_bf.shape[0]
+    a_bf = np.empty((N, 3))
+    size = max(n_max, m_max) + 2
+
+    for k in numba.prange(n_chunks):
+        # Per-thread scratch matrices
+        V = np.zeros((size, size))
+        W = np.zeros((size, size))
+
+        for i in range(k*N//n_chunks, (k + 1)*N//n_chunks):
+            _spherical_harmonics_kernel(r_bf[i, :], CS, n_max, m_max, r_ref, GM, V, W, a_bf[i, :])
 
     return a_bf
 
@@ -354,8 +521,11 @@ def accel_gravity(x:np.ndarray, R_i2b:np.ndarray, n_max:int=20, m_max:int=20) ->
     # Body-fixed position
     r_bf = R_i2b @ x[0:3]
 
+    # Unnormalized coefficients
+    CS = GravityModel.denormalized_coefficients(n_max, m_max)
+
     # Compute spherical harmonic acceleration
-    a_ecef = _compute_spherical_harmonics(r_bf, GravityModel._data, n_max, m_max, R_ref, GM, is_normalized=GravityModel.is_normalized())
+    a_ecef = _compute_spherical_harmonics(r_bf, CS, n_max, m_max, R_ref, GM)
 
     # # Inertial acceleration
     a_eci = np.transpose(R_i2b) @ a_ecef
@@ -363,6 +533,47 @@ def accel_gravity(x:np.ndarray, R_i2b:np.ndarray, n_max:int=20, m_max:int=20) ->
     # # Finished
     return a_eci
 
+def accel_gravity_batch(r_bf:np.ndarray, n_max:int=20, m_max:int=20) -> np.ndarray:
+    '''Compute the accceleration due to gravity at many body-fixed positions.
+    Points are evaluated in parallel.
+
+    Args:
+        r_bf (:obj:`np.ndarray`): Object positions in the body-fixed frame. Shape (N, 3). Units: [m]
+        n_max (int) Maximum gravity model degree
+        m_max (int) Maximum gravity model order
+
+    Returns:
+        np.ndarray: Accelerations in the body-fixed frame. Shape (N, 3). Units: [m/s^2]
+
+    References:
+        1. O. Montenbruck, and E. Gill, _Satellite Orbits: Models, Methods and Applications_, 2012, p.56-68.
+    '''
+
+    # Ensure Gravity Model Initialized
+    if not GravityModel.is_initialized():
+        GravityModel.initialize()
+
+    # Check Limits of Gravity Field
+    if n_max > GravityModel.n_max:
+        raise RuntimeError(f"Requested gravity model order {n_max} is larger than the maximum order of the model maximum {GravityModel.n_max}.")
+
+    if m_max > GravityModel.m_max:
+        raise RuntimeError(f"Requested gravity model order {m_max} is larger than the maximum order of the model maximum {GravityModel.m_max}.")
+
+    # Ensure input is contiguous array of positions
+    r_bf = np.ascontiguousarray(np.asarray(r_bf, dtype=np.float64).reshape(-1, 3))
+
+    if r_bf.shape[0] == 0:
+        return np.zeros((0, 3))
+
+    # Unnormalized coefficients
+    CS = GravityModel.denormalized_coefficients(n_max, m_max)
+
+    # Split work into one chunk per thread
+    n_chunks = min(numba.get_num_threads(), r_bf.shape[0])
+
+    return _compute_spherical_harmonics_batch(r_bf, CS, n_max, m_max, GravityModel.radius, GravityModel.gm, n_chunks)
+
 ######################
 # Third-Body Gravity #
 ######################
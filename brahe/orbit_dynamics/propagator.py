@@ -0,0 +1,494 @@
+"""This orbit dynamics submodule provides a numerical orbit propagator which
+integrates the force models of the orbit_dynamics module.
+
+The equations of motion and integrators are compiled with numba so that
+integration proceeds without re-entering the Python interpreter. Quantities
+which require Python calls, such as the Earth orientation and the Sun and Moon
+positions, are tabulated on a regular time grid before integration and
+interpolated inside the equations of motion.
+"""
+
+# Imports
+import logging
+import math        as math
+import typing      as typing
+import collections as collections
+import numpy       as np
+import numba       as numba
+
+# Internal Imports
+import brahe.constants   as _constants
+import brahe.frames      as _frames
+import brahe.ephemerides as _ephem
+from   brahe.epoch       import Epoch, EpochArray, _era00
+from   brahe.orbit_dynamics.gravity    import GravityModel, accel_point_mass, _spherical_harmonics_kernel
+from   brahe.orbit_dynamics.srp        import accel_srp, eclipse_cylindrical
+from   brahe.orbit_dynamics.relativity import accel_relativity
+
+# Get Logger
+logger = logging.getLogger(__name__)
+
+VALID_INTEGRATORS = ['rk4', 'dp54']
+
+###############
+# Force Model #
+###############
+
+class ForceModel():
+    '''Configuration of the forces included in numerical propagation.
+
+    Args:
+        n_max (int): Maximum degree of spherical harmonic gravity field. A
+            degree and order of zero is point-mass gravity.
+        m_max (int): Maximum order of spherical harmonic gravity field.
+        sun (bool): Include third-body gravity of the Sun.
+        moon (bool): Include third-body gravity of the Moon.
+        srp (bool): Include solar radiation pressure.
+        relativity (bool): Include relativistic effects.
+        eclipse (bool): Apply cylindrical Earth shadow model to solar
+            radiation pressure.
+        mass (float): Spacecraft mass. Units: [kg]
+        area_srp (float): Spacecraft area normal to the Sun. Units: [m^2]
+        CR (float): Coefficient of reflectivity. Units: [dimensionless]
+
+    Note:
+        Atmospheric drag is not currently modeled.
+    '''
+
+    def __init__(self, n_max:int=20, m_max:int=20, sun:bool=True, moon:bool=True,
+                 srp:bool=False, relativity:bool=False, eclipse:bool=True,
+                 mass:float=100.0, area_srp:float=1.0, CR:float=1.8):
+        self.n_max      = n_max
+        self.m_max      = m_max
+        self.sun        = sun
+        self.moon       = moon
+        self.srp        = srp
+        self.relativity = relativity
+        self.eclipse    = eclipse
+        self.mass       = mass
+        self.area_srp   = area_srp
+        self.CR         = CR
+
+    def _params(self):
+        # Pack force model into numba-compatible tuple
+        return _ForceParams(int(self.n_max), int(self.m_max),
+                            float(GravityModel.gm), float(GravityModel.radius),
+                            bool(self.sun), bool(self.moon), bool(self.srp),
+                            bool(self.relativity), bool(self.eclipse),
+                            float(self.mass), float(self.area_srp), float(self.CR))
+
+_ForceParams = collections.namedtuple('_ForceParams', ['n_max', 'm_max', 'gm',
+    'radius', 'sun', 'moon', 'srp', 'relativity', 'eclipse', 'mass', 'area_srp', 'CR'])
+
+_Environment = collections.namedtuple('_Environment', ['t0', 'dt', 'era', 'bpn',
+    'pm', 'r_sun', 'r_moon'])
+
+def _environment(epoch:Epoch, t_start:float, t_end:float, step:float) -> _Environment:
+    '''Tabulate Earth orientation and Sun and Moon positions on a regular grid
+    covering the integration interval.
+
+    Args:
+        epoch (:obj:`Epoch`): Reference epoch of integration
+        t_start (float): Start of interval relative to epoch. Units: [s]
+        t_end (float): End of interval relative to epoch. Units: [s]
+        step (float): Grid spacing. Units: [s]
+
+    Returns:
+        _Environment: Tabulated environment
+    '''
+
+    t_lo = min(t_start, t_end) - step
+    t_hi = max(t_start, t_end) + step
+    t    = t_lo + step*np.arange(int(math.ceil((t_hi - t_lo)/step)) + 1)
+
+    epcs = EpochArray.from_offsets(epoch, t)
+
+    # Earth rotation angle is continuous across grid points so it can be
+    # linearly interpolated
+    era = np.unwrap(_era00(np.full(len(t), _constants.MJD_ZERO), epcs.mjd(tsys='UT1')))
+
+    bpn    = np.empty((len(t), 3, 3))
+    pm     = np.empty((len(t), 3, 3))
+    r_sun  = np.empty((len(t), 3))
+    r_moon = np.empty((len(t), 3))
+
+    for k, epc in enumerate(epcs):
+        bpn[k]    = _frames.bias_precession_nutation(epc)
+        pm[k]     = _frames.polar_motion(epc)
+        r_sun[k]  = _ephem.sun_position(epc)
+        r_moon[k] = _ephem.moon_position(epc)
+
+    return _Environment(float(t_lo), float(step), era, bpn, pm, r_sun, r_moon)
+
+#######################
+# Equations of Motion #
+#######################
+
+@numba.jit(nopython=True, cache=True)
+def _interpolate_environment(env, t:float, R:np.ndarray, r_sun:np.ndarray, r_moon:np.ndarray) -> None:
+    # Interpolate environment to time t writing the inertial to body-fixed
+    # rotation, Sun position, and Moon position into the output arrays.
+    s = (t - env.t0)/env.dt
+    k = min(max(int(math.floor(s)), 0), len(env.era) - 2)
+    w = s - k
+
+    era = env.era[k] + w*(env.era[k+1] - env.era[k])
+    c   = math.cos(era)
+    sn  = math.sin(era)
+
+    Rz = np.array([[c, sn, 0.0], [-sn, c, 0.0], [0.0, 0.0, 1.0]])
+    bpn = env.bpn[k] + w*(env.bpn[k+1] - env.bpn[k])
+    pm  = env.pm[k] + w*(env.pm[k+1] - env.pm[k])
+
+    R[:, :] = pm @ (Rz @ bpn)
+
+    for i in range(3):
+        r_sun[i]  = env.r_sun[k, i] + w*(env.r_sun[k+1, i] - env.r_sun[k, i])
+        r_moon[i] = env.r_moon[k, i] + w*(env.r_moon[k+1, i] - env.r_moon[k, i])
+
+@numba.jit(nopython=True, cache=True)
+def _derivative(t:float, x:np.ndarray, fp, env, CS:np.ndarray,
+                V:np.ndarray, W:np.ndarray) -> np.ndarray:
+    # Equations of motion in the inertial (GCRF) frame
+    R      = np.empty((3, 3))
+    r_sun  = np.empty(3)
+    r_moon = np.empty(3)
+    a_bf   = np.empty(3)
+
+    _interpolate_environment(env, t, R, r_sun, r_moon)
+
+    r = x[0:3]
+
+    # Spherical harmonic gravity
+    _spherical_harmonics_kernel(R @ r, CS, fp.n_max, fp.m_max, fp.radius, fp.gm, V, W, a_bf)
+    a = R.T @ a_bf
+
+    # Third-body gravity
+    if fp.sun:
+        a += accel_point_mass(r, r_sun, _constants.GM_SUN)
+
+    if fp.moon:
+        a += accel_point_mass(r, r_moon, _constants.GM_MOON)
+
+    # Solar radiation pressure
+    if fp.srp:
+        nu = eclipse_cylindrical(x, r_sun) if fp.eclipse else 1.0
+        a += nu*accel_srp(x, r_sun, fp.mass, fp.area_srp, fp.CR, _constants.P_SUN, _constants.AU)
+
+    # Relativity
+    if fp.relativity:
+        a += accel_relativity(x)
+
+    dx = np.empty(6)
+    dx[0:3] = x[3:6]
+    dx[3:6] = a
+
+    return dx
+
+###############
+# Integrators #
+###############
+
+@numba.jit(nopython=True, cache=True)
+def _integrate_rk4(x0:np.ndarray, t0:float, t1:float, h:float, fp, env,
+                   CS:np.ndarray) -> typing.Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # Fixed-step 4th-order Runge-Kutta integration. Dense output is provided
+    # by cubic Hermite interpolation between steps.
+    size = max(fp.n_max, fp.m_max) + 2
+    V    = np.zeros((size, size))
+    W    = np.zeros((size, size))
+
+    direction = 1.0 if t1 >= t0 else -1.0
+    h         = direction*abs(h)
+    n_steps   = max(int(math.ceil(abs(t1 - t0)/abs(h) - 1.0e-12)), 0)
+
+    t     = np.empty(n_steps + 1)
+    x     = np.empty((n_steps + 1, 6))
+    rcont = np.zeros((n_steps, 5, 6))
+
+    t[0]    = t0
+    x[0, :] = x0
+    k1      = _derivative(t0, x0, fp, env, CS, V, W)
+
+    for i in range(n_steps):
+        hi = h if i < n_steps - 1 else (t1 - t[i])
+        ti = t[i]
+        xi = x[i, :]
+
+        k2 = _derivative(ti + 0.5*hi, xi + 0.5*hi*k1, fp, env, CS, V, W)
+        k3 = _derivative(ti + 0.5*hi, xi + 0.5*hi*k2, fp, env, CS, V, W)
+        k4 = _derivative(ti + hi, xi + hi*k3, fp, env, CS, V, W)
+
+        t[i+1]    = ti + hi
+        x[i+1, :] = xi + hi*(k1 + 2.0*k2 + 2.0*k3 + k4)/6.0
+
+        k1_next = _derivative(t[i+1], x[i+1, :], fp, env, CS, V, W)
+
+        rcont[i, 0, :] = xi
+        rcont[i, 1, :] = x[i+1, :] - xi
+        rcont[i, 2, :] = hi*k1 - rcont[i, 1, :]
+        rcont[i, 3, :] = rcont[i, 1, :] - hi*k1_next - rcont[i, 2, :]
+
+        k1 = k1_next
+
+    return t, x, rcont
+
+@numba.jit(nopython=True, cache=True)
+def _integrate_dp54(x0:np.ndarray, t0:float, t1:float, h:float, atol:float,
+                    rtol:float, max_steps:int, fp, env,
+                    CS:np.ndarray) -> typing.Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # Adaptive Dormand-Prince 5(4) integration with 4th-order continuous
+    # extension for dense output.
+    #
+    # Reference: E. Hairer, S. Norsett, and G. Wanner, _Solving Ordinary
+    # Differential Equations I_, 1993, DOPRI5
+    c2, c3, c4, c5 = 1.0/5.0, 3.0/10.0, 4.0/5.0, 8.0/9.0
+    a21 = 1.0/5.0
+    a31, a32 = 3.0/40.0, 9.0/40.0
+    a41, a42, a43 = 44.0/45.0, -56.0/15.0, 32.0/9.0
+    a51, a52, a53, a54 = 19372.0/6561.0, -25360.0/2187.0, 64448.0/6561.0, -212.0/729.0
+    a61, a62, a63, a64, a65 = 9017.0/3168.0, -355.0/33.0, 46732.0/5247.0, 49.0/176.0, -5103.0/18656.0
+    a71, a73, a74, a75, a76 = 35.0/384.0, 500.0/1113.0, 125.0/192.0, -2187.0/6784.0, 11.0/84.0
+    e1, e3, e4, e5, e6, e7 = 71.0/57600.0, -71.0/16695.0, 71.0/1920.0, -17253.0/339200.0, 22.0/525.0, -1.0/40.0
+    d1, d3, d4 = -12715105075.0/11282082432.0, 87487479700.0/32700410799.0, -10690763975.0/1880347072.0
+    d5, d6, d7 = 701980252875.0/199316789632.0, -1453857185.0/822651844.0, 69997945.0/29380423.0
+
+    size = max(fp.n_max, fp.m_max) + 2
+    V    = np.zeros((size, size))
+    W    = np.zeros((size, size))
+
+    direction = 1.0 if t1 >= t0 else -1.0
+    h         = direction*min(abs(h), abs(t1 - t0)) if t1 != t0 else 0.0
+
+    capacity = 256
+    t     = np.empty(capacity + 1)
+    x     = np.empty((capacity + 1, 6))
+    rcont = np.zeros((capacity, 5, 6))
+
+    t[0]    = t0
+    x[0, :] = x0
+    n       = 0
+    k1      = _derivative(t0, x0, fp, env, CS, V, W)
+
+    while direction*(t1 - t[n]) > 0.0:
+        if n >= max_steps:
+            raise RuntimeError('Maximum number of integration steps exceeded.')
+
+        ti = t[n]
+        xi = x[n, :]
+
+        # Do not step past final time
+        if direction*(ti + h - t1) > 0.0:
+            h = t1 - ti
+
+        k2 = _derivative(ti + c2*h, xi + h*a21*k1, fp, env, CS, V, W)
+        k3 = _derivative(ti + c3*h, xi + h*(a31*k1 + a32*k2), fp, env, CS, V, W)
+        k4 = _derivative(ti + c4*h, xi + h*(a41*k1 + a42*k2 + a43*k3), fp, env, CS, V, W)
+        k5 = _derivative(ti + c5*h, xi + h*(a51*k1 + a52*k2 + a53*k3 + a54*k4), fp, env, CS, V, W)
+        k6 = _derivative(ti + h, xi + h*(a61*k1 + a62*k2 + a63*k3 + a64*k4 + a65*k5), fp, env, CS, V, W)
+        xn = xi + h*(a71*k1 + a73*k3 + a74*k4 + a75*k5 + a76*k6)
+        k7 = _derivative(ti + h, xn, fp, env, CS, V, W)
+
+        # Error estimate
+        err_vec = h*(e1*k1 + e3*k3 + e4*k4 + e5*k5 + e6*k6 + e7*k7)
+        sk      = atol + rtol*np.maximum(np.abs(xi), np.abs(xn))
+        err     = math.sqrt(np.sum((err_vec/sk)**2)/6.0)
+
+        if err <= 1.0:
+            # Grow storage if required
+            if n + 1 > capacity:
+                capacity *= 2
+                t_new = np.empty(capacity + 1)
+                x_new = np.empty((capacity + 1, 6))
+                r_new = np.zeros((capacity, 5, 6))
+                t_new[:n+1]  = t[:n+1]
+                x_new[:n+1]  = x[:n+1]
+                r_new[:n]    = rcont[:n]
+                t, x, rcont = t_new, x_new, r_new
+
+            # Dense output coefficients
+            rcont[n, 0, :] = xi
+            rcont[n, 1, :] = xn - xi
+            rcont[n, 2, :] = h*k1 - rcont[n, 1, :]
+            rcont[n, 3, :] = rcont[n, 1, :] - h*k7 - rcont[n, 2, :]
+            rcont[n, 4, :] = h*(d1*k1 + d3*k3 + d4*k4 + d5*k5 + d6*k6 + d7*k7)
+
+            t[n+1]    = ti + h
+            x[n+1, :] = xn
+            n        += 1
+            k1        = k7
+
+        # Step size control
+        fac = 0.9*err**(-0.2) if err > 0.0 else 10.0
+        h   = h*min(10.0, max(0.2, fac))
+
+    return t[:n+1].copy(), x[:n+1].copy(), rcont[:n].copy()
+
+##############
+# Trajectory #
+##############
+
+class Trajectory():
+    '''Numerically integrated trajectory with dense output. States may be
+    evaluated at any time within the integration interval without
+    re-integrating.
+
+    Attributes:
+        epoch (:obj:`Epoch`): Reference epoch of trajectory
+        t (np.ndarray): Integration step times relative to epoch. Units: [s]
+        x (np.ndarray): Inertial (GCRF) states at integration steps. Shape
+            (N, 6). Units: [m; m/s]
+    '''
+
+    def __init__(self, epoch:Epoch, t:np.ndarray, x:np.ndarray, rcont:np.ndarray):
+        self.epoch  = Epoch(epoch)
+        self.t      = t
+        self.x      = x
+        self._rcont = rcont
+
+        # Sort key for step lookup which is increasing for either direction
+        self._direction = 1.0 if len(t) < 2 or t[-1] >= t[0] else -1.0
+
+    @property
+    def epoch_start(self) -> Epoch:
+        '''Epoch of the start of the trajectory'''
+        return self.epoch + float(self.t[0])
+
+    @property
+    def epoch_end(self) -> Epoch:
+        '''Epoch of the end of the trajectory'''
+        return self.epoch + float(self.t[-1])
+
+    def _times(self, t:typing.Union[Epoch, float, np.ndarray, typing.List[Epoch], EpochArray]) -> np.ndarray:
+        # Convert times to seconds since trajectory epoch
+        if isinstance(t, (Epoch, EpochArray)):
+            return np.atleast_1d(t - self.epoch)
+        elif len(np.shape(t)) > 0 and len(t) > 0 and isinstance(t[0], Epoch):
+            return np.array([ti - self.epoch for ti in t], dtype=float)
+        else:
+            return np.atleast_1d(np.asarray(t, dtype=float))
+
+    def states(self, t:typing.Union[np.ndarray, typing.List[Epoch], EpochArray]) -> np.ndarray:
+        '''Interpolate trajectory states at the requested times.
+
+        Args:
+            t (Union[np.ndarray, List[Epoch], EpochArray]): Times as epochs or
+                as seconds since the trajectory epoch.
+
+        Returns:
+            np.ndarray: Inertial (GCRF) states. Shape (N, 6). Units: [m; m/s]
+        '''
+
+        dt = self._times(t)
+
+        # Ensure times are within the integrated interval
+        d  = self._direction
+        lo = min(self.t[0], self.t[-1])
+        hi = max(self.t[0], self.t[-1])
+
+        if np.any(dt < lo - 1.0e-9) or np.any(dt > hi + 1.0e-9):
+            raise RuntimeError('Requested time is outside of the propagated trajectory.')
+
+        if len(self.t) < 2:
+            return np.repeat(self.x[0:1, :], len(dt), axis=0)
+
+        # Locate integration step containing each time
+        idx = np.clip(np.searchsorted(d*self.t, d*dt, side='right') - 1, 0, len(self.t) - 2)
+
+        h     = self.t[idx + 1] - self.t[idx]
+        theta = ((dt - self.t[idx])/h)[:, np.newaxis]
+        r     = self._rcont[idx]
+
+        # Evaluate continuous extension of integration step
+        return r[:, 0, :] + theta*(r[:, 1, :] + (1.0 - theta)*(r[:, 2, :] + theta*(r[:, 3, :] + (1.0 - theta)*r[:, 4, :])))
+
+    def state(self, t:typing.Union[Epoch, float]) -> np.ndarray:
+        '''Interpolate trajectory state at the requested time.
+
+        Args:
+            t (Union[Epoch, float]): Time as an epoch or as seconds since the
+                trajectory epoch.
+
+        Returns:
+            np.ndarray: Inertial (GCRF) state. Units: [m; m/s]
+        '''
+
+        return self.states(self._times(t))[0, :]
+
+########################
+# Numerical Propagator #
+########################
+
+class NumericalPropagator():
+    '''Numerical orbit propagator integrating the orbit_dynamics force models
+    in the inertial (GCRF) frame.
+
+    Args:
+        epoch (:obj:`Epoch`): Epoch of initial state
+        x0 (np.ndarray): Initial inertial (GCRF) state. Units: [m; m/s]
+        force_model (:obj:`ForceModel`): Forces to include in propagation.
+            Defaults to 20x20 gravity with Sun and Moon third-body gravity.
+        integrator (str): Integration method. One of: `rk4` (fixed-step),
+            `dp54` (adaptive Dormand-Prince, default).
+        step (float): Integration step size for fixed-step integration, and
+            initial step size for adaptive integration. Units: [s]
+        atol (float): Absolute error tolerance of adaptive integration.
+        rtol (float): Relative error tolerance of adaptive integration.
+        max_steps (int): Maximum number of steps of adaptive integration.
+        grid_step (float): Spacing of grid Earth orientation and Sun and Moon
+            positions are tabulated on. Units: [s]
+    '''
+
+    def __init__(self, epoch:Epoch, x0:np.ndarray, force_model:typing.Optional[ForceModel]=None,
+                 integrator:str='dp54', step:float=60.0, atol:float=1.0e-6,
+                 rtol:float=1.0e-10, max_steps:int=1000000, grid_step:float=300.0):
+
+        if integrator not in VALID_INTEGRATORS:
+            raise RuntimeError(f'Invalid integrator {integrator}. Must be one of: {", ".join(VALID_INTEGRATORS)}')
+
+        if step <= 0 or grid_step <= 0:
+            raise RuntimeError('Integration and grid step sizes must be positive.')
+
+        self.epoch       = Epoch(epoch)
+        self.x0          = np.asarray(x0, dtype=np.float64)[0:6].copy()
+        self.force_model = force_model if force_model else ForceModel()
+        self.integrator  = integrator
+        self.step        = step
+        self.atol        = atol
+        self.rtol        = rtol
+        self.max_steps   = max_steps
+        self.grid_step   = grid_step
+
+    def propagate(self, t:typing.Union[Epoch, float]) -> Trajectory:
+        '''Propagate initial state to the requested time.
+
+        Args:
+            t (Union[Epoch, float]): Final time as an epoch or as seconds since
+                the initial epoch.
+
+        Returns:
+            :obj:`Trajectory`: Integrated trajectory with dense output.
+        '''
+
+        t_end = (t - self.epoch) if isinstance(t, Epoch) else float(t)
+
+        # Ensure Gravity Model Initialized
+        if not GravityModel.is_initialized():
+            GravityModel.initialize()
+
+        fm = self.force_model
+
+        if fm.n_max > GravityModel.n_max or fm.m_max > GravityModel.m_max:
+            raise RuntimeError(f"Requested gravity model degree and order {fm.n_max}x{fm.m_max} is larger than the model maximum {GravityModel.n_max}x{GravityModel.m_max}.")
+
+        CS  = GravityModel.denormalized_coefficients(fm.n_max, fm.m_max)
+        fp  = fm._params()
+        env = _environment(self.epoch, 0.0, t_end, self.grid_step)
+
+        if self.integrator == 'rk4':
+            tn, xn, rcont = _integrate_rk4(self.x0, 0.0, t_end, self.step, fp, env, CS)
+        else:
+            tn, xn, rcont = _integrate_dp54(self.x0, 0.0, t_end, self.step, self.atol,
+                                            self.rtol, self.max_steps, fp, env, CS)
+
+        return Trajectory(self.epoch, tn, xn, rcont)
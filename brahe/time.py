@@ -9,7 +9,10 @@ Note:
 """
 
 # Imports
+import re
+import bisect
 import typing
+import functools
 import pysofa2 as _sofa
 
 # Brahe Imports
@@ -17,6 +20,108 @@ from   brahe.utils import logger
 import brahe.constants as _constants
 from   brahe.eop import EOP as _EOP
 
+# Constants
+DEFAULT_TAI_UTC_DATA = _constants.DATA_PATH / 'tai_utc.txt'
+"""Path of default leap second (TAI-UTC) data file used by the module.
+"""
+
+#####################
+# Leap Second Table #
+#####################
+
+class _TAIUTCTable():
+    '''Piecewise TAI-UTC table parsed from a USNO ``tai-utc.dat`` file. Each
+    entry is valid from its start date until the start of the next entry and
+    is given by:
+
+        TAI-UTC = offset + (MJD_UTC - mjd_ref) * rate
+
+    Attributes:
+        mjd_utc (List[float]): UTC Modified Julian Date each entry starts
+        mjd_tai (List[float]): TAI Modified Julian Date each entry starts
+        offset (List[float]): Constant offset of each entry. Units: [s]
+        mjd_ref (List[float]): Reference date of drift term
+        rate (List[float]): Drift rate of entry. Units: [s/day]
+    '''
+
+    _LINE_REGEX = re.compile(r'=JD\s+([\d.]+)\s+TAI-UTC=\s+([\d.]+)\s*S\s*\+\s*\(MJD\s*-\s*([\d.]+)\)\s*X\s*([\d.]+)\s*S')
+
+    def __init__(self, filepath:str):
+        self.mjd_utc = []
+        self.mjd_tai = []
+        self.offset  = []
+        self.mjd_ref = []
+        self.rate    = []
+
+        with open(filepath, 'r') as fp:
+            for line in fp:
+                match = self._LINE_REGEX.search(line)
+
+                if not match:
+                    continue
+
+                jd, offset, mjd_ref, rate = (float(v) for v in match.groups())
+                mjd = jd - _constants.MJD_ZERO
+
+                self.mjd_utc.append(mjd)
+                self.offset.append(offset)
+                self.mjd_ref.append(mjd_ref)
+                self.rate.append(rate)
+                self.mjd_tai.append(mjd + (offset + (mjd - mjd_ref)*rate)/86400.0)
+
+        if len(self.mjd_utc) == 0:
+            raise RuntimeError(f'No TAI-UTC entries found in {filepath}')
+
+    def __call__(self, mjd_utc:float) -> float:
+        idx = _tai_utc_entry(int(mjd_utc // 1))
+
+        if idx < 0:
+            return 0.0
+
+        return self.offset[idx] + (mjd_utc - self.mjd_ref[idx])*self.rate[idx]
+
+    def from_tai(self, mjd_tai:float) -> float:
+        idx = bisect.bisect_right(self.mjd_tai, mjd_tai) - 1
+
+        if idx < 0:
+            return 0.0
+
+        # Solve TAI-UTC = offset + (MJD_TAI - (TAI-UTC)/86400 - mjd_ref)*rate
+        rate = self.rate[idx]
+        return (self.offset[idx] + (mjd_tai - self.mjd_ref[idx])*rate)/(1.0 + rate/86400.0)
+
+_TAI_UTC = _TAIUTCTable(DEFAULT_TAI_UTC_DATA)
+
+@functools.lru_cache(maxsize=8192)
+def _tai_utc_entry(mjd_day:int) -> int:
+    # Index of the table entry in effect for a UTC day. Entries always begin at
+    # the start of a UTC day so the index is constant over the day.
+    return bisect.bisect_right(_TAI_UTC.mjd_utc, mjd_day) - 1
+
+def load_tai_utc(filepath:str=DEFAULT_TAI_UTC_DATA) -> None:
+    '''Load leap second (TAI-UTC) table used for time system conversions.
+
+    Args:
+        filepath (str): Path of ``tai-utc.dat`` formatted file to load. Defaults
+            to the file provided with the module.
+    '''
+    global _TAI_UTC
+
+    _TAI_UTC = _TAIUTCTable(filepath)
+    _tai_utc_entry.cache_clear()
+
+def tai_utc(mjd_utc:float) -> float:
+    '''Return the TAI-UTC offset at a given UTC instant from the leap second table.
+
+    Args:
+        mjd_utc (float): Modified Julian Date in UTC time system
+
+    Returns:
+        float: TAI-UTC offset. Units: [s]
+    '''
+
+    return _TAI_UTC(mjd_utc)
+
 ################
 # Time Methods #
 ################
@@ -120,7 +225,8 @@ def time_system_offset(jd:float, fd:float, tsys_src:str, tsys_dest:str) -> float
     The value returned is the number of seconds that musted be added to the 
     source time system given the input epoch, to get the equivalent epoch.
 
-    Conversions are accomplished using SOFA C library calls.
+    Leap seconds are taken from the TAI-UTC table loaded by ``load_tai_utc``
+    and UT1-UTC from the loaded Earth orientation data.
 
     Args:
         jd (float): Part 1 of two-part date (Julian days)
@@ -138,6 +244,7 @@ def time_system_offset(jd:float, fd:float, tsys_src:str, tsys_dest:str) -> float
         return 0.0
     
     offset = 0.0
+    mjd    = (jd - _constants.MJD_ZERO) + fd
 
     # Convert To TAI 
     if tsys_src == "GPS":
@@ -145,17 +252,13 @@ def time_system_offset(jd:float, fd:float, tsys_src:str, tsys_dest:str) -> float
     elif tsys_src == "TT":
         offset += _constants.TAI_TT
     elif tsys_src == "UTC":
-        iy, im, id, ihmsf = _sofa.D2dtf("UTC", 6, jd, fd) # Returns TAI-UTC
-        dutc = _sofa.Dat(iy, im, id, (ihmsf[0]*3600 + ihmsf[1]*60 + ihmsf[2] + ihmsf[3]/1e6)/86400.0)
-        offset += dutc
+        offset += _TAI_UTC(mjd) # Returns TAI-UTC
     elif tsys_src == "UT1":
         # Convert UT1 -> UTC
-        offset -= _EOP.ut1_utc((jd - _constants.MJD_ZERO) + fd)
+        offset -= _EOP.ut1_utc(mjd)
 
         # Convert UTC -> TAI
-        iy, im, id, ihmsf = _sofa.D2dtf("UTC", 6, jd, fd + offset) # Returns TAI-UTC
-        dutc = _sofa.Dat(iy, im, id, (ihmsf[0]*3600 + ihmsf[1]*60 + ihmsf[2] + ihmsf[3]/1e6)/86400.0)
-        offset += dutc
+        offset += _TAI_UTC(mjd + offset/86400.0) # Returns TAI-UTC
     elif tsys_src == "TAI":
         # Do nothing in this case
         pass
@@ -166,44 +269,16 @@ def time_system_offset(jd:float, fd:float, tsys_src:str, tsys_dest:str) -> float
     elif tsys_dest == "TT":
         offset += _constants.TT_TAI
     elif tsys_dest == "UTC":
-        # Initial UTC guess
-        u1, u2 = jd, fd + offset/86400.0
-
-        # Iterate to get the UTC time
-        for i in range(0, 3):
-            d1, d2 = _sofa.Utctai(u1, u2)
-
-            # Adjust UTC guess
-            u1 += jd - d1
-            u2 += fd + offset/86400.0 - d2
-
-        # Compute Caldate from two-part date
-        iy, im, id, ihmsf = _sofa.D2dtf("UTC", 6, u1, u2)
-
-        dutc = _sofa.Dat(iy, im, id, (ihmsf[0]*3600 + ihmsf[1]*60 + ihmsf[2] + ihmsf[3]/1e6)/86400.0)
-        offset -= dutc
+        offset -= _TAI_UTC.from_tai(mjd + offset/86400.0)
     elif tsys_dest == "UT1":
-        # Initial UTC guess
-        u1, u2 = jd, fd + offset/86400.0
-
-        # Iterate to get the UTC time
-        for i in range(0, 3):
-            d1, d2 = _sofa.Utctai(u1, u2)
-
-            # Adjust UTC guess
-            u1 += jd - d1
-            u2 += fd + offset/86400.0 - d2
-
-        # Compute Caldate from two-part date
-        iy, im, id, ihmsf = _sofa.D2dtf("UTC", 6, u1, u2)
-
-        dutc = _sofa.Dat(iy, im, id, (ihmsf[0]*3600 + ihmsf[1]*60 + ihmsf[2] + ihmsf[3]/1e6)/86400.0)
-        offset -= dutc
+        # Convert TAI to UTC
+        offset -= _TAI_UTC.from_tai(mjd + offset/86400.0)
+        mjd_utc = mjd + offset/86400.0
 
         # Convert UTC to UT1
-        offset += _EOP.ut1_utc(u1 + u2 + offset/86400.0 - _constants.MJD_ZERO)
+        offset += _EOP.ut1_utc(mjd_utc)
     elif tsys_dest == "TAI":
         # Do nothing in this case
         pass
 
-    return offset
\ No newline at end of file
+    return offset
@@ -12,21 +12,26 @@ Note:
 """
 
 # Imports
+import io
+import os
+import gzip
 import math
 import typing
+import functools
+import contextlib
+import collections
 import numpy as np
-import sgp4.io
-import sgp4.earth_gravity
-import sgp4.propagation
+import sgp4.api
 import pysofa2 as _sofa
 
 # Brahe Imports
-from   brahe.utils import logger, fcross
+from   brahe.utils import logger
 import brahe.constants as _constants
-import brahe.attitude as _att
 import brahe.astro as _astro
 import brahe.frames as _frames
-from brahe.epoch import Epoch
+from brahe.eop import EOP as _EOP
+from brahe.epoch import Epoch, EpochArray, _epoch_to_jdfd, _era00
+from brahe.time import time_system_offset
 
 #############
 # TLE Class #
@@ -57,6 +62,12 @@ def tle_format_exp(num:float) -> str:
 
     return num_str
 
+# Characters which do not contribute to TLE checksums
+_CHECKSUM_DELETE = bytes(c for c in range(256) if not (48 <= c <= 57 or c == 45))
+
+# Minus signs count as one
+_CHECKSUM_TABLE = bytes.maketrans(b'-', b'1')
+
 def tle_checksum(line:str) -> int:
     '''Compute checksum value for two-line element set line.
 
@@ -66,17 +77,46 @@ def tle_checksum(line:str) -> int:
     Returns:
         int: Checksum value.
     '''
-        
-    checksum = 0
-    for c in line[0:68]:
-        if c.isdigit():
-            checksum += int(c)
-        elif c == '-':
-            checksum += 1
 
-    checksum = checksum % 10
+    digits = line[0:68].encode('ascii', errors='replace').translate(_CHECKSUM_TABLE, _CHECKSUM_DELETE)
+
+    return (sum(digits) - 48*len(digits)) % 10
+
+def tle_checksums(lines:typing.Sequence[str]) -> np.ndarray:
+    '''Compute checksum values of many two-line element set lines at once.
+
+    Args:
+        lines (Sequence[str]): Input two line element lines
+
+    Returns:
+        np.ndarray: Checksum value of each line.
+    '''
+
+    # Fixed-width byte array of the first 68 characters of each line
+    chars = np.array([line[0:68].encode('ascii', errors='replace') for line in lines], dtype='S68')
+    chars = chars.view(np.uint8).reshape(len(lines), 68)
+
+    digits = (chars >= 48) & (chars <= 57)
+
+    return (np.sum(np.where(digits, chars - 48, 0), axis=1) + np.sum(chars == 45, axis=1)) % 10
 
-    return checksum
+def _valid_tle_lines(lines:typing.Sequence[str]) -> np.ndarray:
+    '''Vectorized equivalent of `validate_tle_line`.
+
+    Args:
+        lines (Sequence[str]): Input two line element lines
+
+    Returns:
+        np.ndarray: True for each valid TLE line.
+    '''
+
+    if len(lines) == 0:
+        return np.zeros(0, dtype=bool)
+
+    length = np.fromiter((len(line) for line in lines), dtype=int, count=len(lines))
+    last = np.fromiter((ord(line[68]) - 48 if len(line) == 69 else -1 for line in lines), dtype=int, count=len(lines))
+
+    return (length == 69) & (last == tle_checksums(lines))
 
 def validate_tle_line(line:str) -> bool:
     '''Validate if line is a valid TLE line.
@@ -110,11 +150,27 @@ def tle_gmst82(epoch:Epoch, use_degrees:bool=False):
         float: Rate of change of Greenwich mean sidereal time as angle. Units: Radians/second [0, 2pi)
     '''
 
-    # Compute UT1 time
-    jd_ut1 = epoch.jd(tsys='UT1')
+    # Compute UT1 time as a two-part date to retain sub-millisecond resolution
+    jd_ut1, fd_ut1 = _epoch_to_jdfd(epoch, tsys='UT1')
+
+    return _gmst82(jd_ut1, use_degrees=use_degrees, fd_ut1=fd_ut1)
+
+def _gmst82(jd_ut1:typing.Union[float, np.ndarray], use_degrees:bool=False,
+            fd_ut1:typing.Union[float, np.ndarray]=0.0):
+    '''Compute Greenwich Mean Sidereal Time 1982 Model from the UT1 Julian
+    date. Accepts either a scalar or an array of Julian dates.
+
+    Args:
+        jd_ut1 (Union[float, np.ndarray]): Julian date(s) in the UT1 time system.
+        fd_ut1 (Union[float, np.ndarray]): Second part of two-part Julian
+            date(s). A single double Julian date only resolves about 40 us.
+
+    Returns:
+        Union[float, np.ndarray]: Greenwich mean sidereal time as angle. Units: Radians [0, 2pi)
+    '''
 
     # jd_ut1 is days elapsed since January 1, 2000 12h UT1
-    t = (jd_ut1 - 2451545.0) / 36525.0
+    t = ((jd_ut1 - 2451545.0) + fd_ut1) / 36525.0
 
     # Apply Formula C-1
     # NOTE: This is the equation directly from AIAA 2006-6753 Appendix C.
@@ -128,7 +184,7 @@ def tle_gmst82(epoch:Epoch, use_degrees:bool=False):
 
 
     # Compute GMST as angle
-    theta  = ((jd_ut1 % 1.0) + (g / 86400.0 % 1.0)) * 2*math.pi
+    theta  = (((jd_ut1 % 1.0) + (fd_ut1 % 1.0) + (g / 86400.0 % 1.0)) % 1.0) * 2*math.pi
 
     if use_degrees == True:
         theta *= 180.0/math.pi
@@ -211,6 +267,243 @@ def tle_string_from_elements(epc:Epoch, oe:np.ndarray, norad_id:int=None,
 
     return line1, line2
 
+def tle_epoch(line1:str) -> Epoch:
+    '''Parse the epoch of a two-line element set.
+
+    Args:
+        line1 (str): First line of Two-Line-Element set.
+
+    Returns:
+        :obj:`Epoch`: Epoch of the element set.
+    '''
+
+    # Set TLE Epoch
+    epoch_year = int(line1[18:20])
+
+    # Apply correction for TLEs only using 2-digit year
+    if epoch_year < 57:
+        epoch_year += 2000
+    else:
+        epoch_year += 1900
+        
+    doy = float(line1[20:32])
+
+    return Epoch(epoch_year, 1, 1, 0, 0, 0, tsys='UTC') + (doy-1)*86400.0
+
+def tle_elements_from_lines(line1:str, line2:str) -> np.ndarray:
+    '''Parse the orbital elements of a two-line element set.
+
+    Args:
+        line1 (str): First line of Two-Line-Element set.
+        line2 (str): Second line of Two-Line-Element set.
+
+    Returns:
+        np.ndarray: Orbital elements. Output is of the same form as the
+            input of `tle_string_from_elements`:
+            - n - Mean motion [rev/day]
+            - e - Eccentricity [dimensionless]
+            - i - Inclination [deg]
+            - O - Right ascension [deg]
+            - w - Argument of perigee [deg]
+            - M - Mean anomaly [deg]
+            - ndt2 - First derivative of mean motion divided by 2
+            - nddt6 - Second derivative of mean motion divided by 6
+            - bstar - B-star drag term
+    '''
+
+    return np.array([
+        float(line2[52:63]),
+        float(f'0.{line2[26:33]}'),
+        float(line2[8:16]),
+        float(line2[17:25]),
+        float(line2[34:41]),
+        float(line2[43:51]),
+        float(f'{line1[33]}0.{line1[35:43]}'),
+        float(f'{line1[44]}0.{line1[45:50]}e{line1[50:52]}'),
+        float(f'{line1[53]}0.{line1[54:59]}e{line1[59:61]}'),
+    ])
+
+def _sgp_earth_model(wgs:str):
+    '''Get SGP4 Earth gravity model constants by name.
+
+    Args:
+        wgs (str): Earth gravity model. Must be one of: wgs72, wgs84
+
+    Returns:
+        int: SGP4 gravity model identifier
+    '''
+
+    if wgs == 'wgs84':
+        return sgp4.api.WGS84
+    elif wgs == 'wgs72':
+        return sgp4.api.WGS72
+    else:
+        raise RuntimeError(f'Unknown SGP Earth Gravity Model "{wgs:s}". Must be one of: wgs72,wgs84 (default).')
+
+###############################
+# Batch Frame Transformations #
+###############################
+
+def _teme_to_pef(x_teme:np.ndarray, c:np.ndarray, s:np.ndarray) -> np.ndarray:
+    '''Rotate TEME states into the pseudo-Earth-fixed frame.
+
+    Args:
+        x_teme (np.ndarray): TEME states with shape (..., N, 6) or (6,). Units: [m ; m/s]
+        c (np.ndarray): Cosine of the GMST of each of the N times.
+        s (np.ndarray): Sine of the GMST of each of the N times.
+
+    Returns:
+        np.ndarray: PEF states with the shape of `x_teme`. Units: [m ; m/s]
+    '''
+
+    x, y, z    = x_teme[..., 0], x_teme[..., 1], x_teme[..., 2]
+    vx, vy, vz = x_teme[..., 3], x_teme[..., 4], x_teme[..., 5]
+
+    # Apply Earth rotation. Precession and Nutation Corrections are NOT 
+    # applied since they are already accounted for in the TEME frame
+    x_pef = np.empty_like(x_teme)
+    x_pef[..., 0] = c*x + s*y
+    x_pef[..., 1] = -s*x + c*y
+    x_pef[..., 2] = z
+    x_pef[..., 3] = c*vx + s*vy + _constants.OMEGA_EARTH*x_pef[..., 1]
+    x_pef[..., 4] = -s*vx + c*vy - _constants.OMEGA_EARTH*x_pef[..., 0]
+    x_pef[..., 5] = vz
+
+    return x_pef
+
+def _rotate_z(x:np.ndarray, c:np.ndarray, s:np.ndarray) -> np.ndarray:
+    # Rotate positions and velocities about the z-axis by the angle with
+    # cosine `c` and sine `s`
+    x_rot = np.empty_like(x)
+    for k in (0, 3):
+        x_rot[..., k]     = c*x[..., k] + s*x[..., k + 1]
+        x_rot[..., k + 1] = -s*x[..., k] + c*x[..., k + 1]
+        x_rot[..., k + 2] = x[..., k + 2]
+
+    return x_rot
+
+class _TEMEGrid():
+    '''Rotations from the TEME frame to the PEF, ITRF, and GCRF frames on a
+    grid of times. GMST is computed once on construction and the remaining
+    rotations on first use, so the grid can be applied to the states of any
+    number of satellites.
+
+    TEME states are taken to GCRF directly. The PEF and TIRS frames differ
+    only by the rotation of GMST to the Earth rotation angle about the pole,
+    so polar motion and the Earth rotation rate terms cancel.
+
+    Args:
+        epoch (:obj:`Epoch`): Reference epoch of times
+        dt (np.ndarray): Elapsed time since reference epoch in seconds.
+    '''
+
+    def __init__(self, epoch:Epoch, dt:np.ndarray):
+        self.epochs = EpochArray.from_offsets(epoch, dt)
+
+        self._jd_ut1, self._fd_ut1 = self.epochs._jdfd(tsys='UT1')
+
+        theta = _gmst82(self._jd_ut1, fd_ut1=self._fd_ut1)
+        self._cos, self._sin = np.cos(theta), np.sin(theta)
+        self._theta = theta
+
+        # Earth orientation data and frame precision the rotations depend on
+        self._eop_data = _EOP._data
+        self.precision = _frames.frame_precision()
+
+        self._rpm = None
+        self._c2t = None
+
+    def current(self) -> bool:
+        '''Whether the rotations are valid for the current Earth orientation
+        data and frame precision.
+        '''
+        return self._eop_data is _EOP._data and self.precision == _frames.frame_precision()
+
+    def pef(self, x_teme:np.ndarray) -> np.ndarray:
+        '''Transform TEME states with shape (..., N, 6) to the PEF frame.'''
+        return _teme_to_pef(x_teme, self._cos, self._sin)
+
+    def itrf(self, x_teme:np.ndarray) -> np.ndarray:
+        '''Transform TEME states with shape (..., N, 6) to the ITRF frame.'''
+
+        x_pef = self.pef(x_teme)
+
+        # Polar motion is neglected in fast frame precision
+        if self.precision == 'fast':
+            return x_pef
+
+        if self._rpm is None:
+            self._rpm = _frames.polar_motion_batch(self.epochs)
+
+        x_itrf = np.empty_like(x_pef)
+        x_itrf[..., 0:3] = np.einsum('nij,...nj->...ni', self._rpm, x_pef[..., 0:3])
+        x_itrf[..., 3:6] = np.einsum('nij,...nj->...ni', self._rpm, x_pef[..., 3:6])
+
+        return x_itrf
+
+    def gcrf(self, x_teme:np.ndarray) -> np.ndarray:
+        '''Transform TEME states with shape (..., N, 6) to the GCRF frame.'''
+
+        if self._c2t is None:
+            angle = self._theta - _era00(self._jd_ut1, self._fd_ut1)
+            self._c2t = (np.cos(angle), np.sin(angle))
+
+        # TEME -> CIRS
+        x_cirs = _rotate_z(x_teme, *self._c2t)
+
+        # Bias, precession, and nutation are neglected in fast frame precision
+        if self.precision == 'fast':
+            return x_cirs
+
+        rc2i = _frames.bias_precession_nutation_batch(self.epochs)
+
+        x_gcrf = np.empty_like(x_cirs)
+        x_gcrf[..., 0:3] = np.einsum('nji,...nj->...ni', rc2i, x_cirs[..., 0:3])
+        x_gcrf[..., 3:6] = np.einsum('nji,...nj->...ni', rc2i, x_cirs[..., 3:6])
+
+        return x_gcrf
+
+# Recently used time grids. Short grids, such as those of root finding
+# iterations, are rarely shared and not cached so they do not evict search
+# grids.
+_TEME_GRIDS = collections.OrderedDict()
+_TEME_GRID_CACHE_SIZE = 16
+_TEME_GRID_CACHE_MIN = 64
+
+def _teme_grid(epoch:Epoch, dt:np.ndarray) -> _TEMEGrid:
+    '''Return the TEME rotations of a time grid, reusing the rotations of
+    recently used grids. Satellites propagated over the same grid relative to
+    the same reference epoch share their rotations.
+
+    Args:
+        epoch (:obj:`Epoch`): Reference epoch of times
+        dt (np.ndarray): Elapsed time since reference epoch in seconds.
+
+    Returns:
+        _TEMEGrid: Rotations of the time grid.
+    '''
+
+    dt = np.ascontiguousarray(dt, dtype=float)
+
+    if len(dt) < _TEME_GRID_CACHE_MIN:
+        return _TEMEGrid(epoch, dt)
+
+    key = (epoch.days, epoch.seconds, epoch.nanoseconds, epoch.tsys, dt.tobytes())
+
+    grid = _TEME_GRIDS.get(key, None)
+
+    if grid is not None and grid.current():
+        _TEME_GRIDS.move_to_end(key)
+        return grid
+
+    grid = _TEMEGrid(epoch, dt)
+    _TEME_GRIDS[key] = grid
+
+    if len(_TEME_GRIDS) > _TEME_GRID_CACHE_SIZE:
+        _TEME_GRIDS.popitem(last=False)
+
+    return grid
+
 class TLE():
     '''Two line telement
 
@@ -219,10 +512,20 @@ class TLE():
         line2 (str): Second line of Two-Line-Element set.
 
     Attributes:
-        line1 (str): Human readable string describing the exception.
-        line2 (str): Exception error code.
+        line1 (str): First line of Two-Line-Element set.
+        line2 (str): Second line of Two-Line-Element set.
+        epoch (:obj:`Epoch`): Epoch of element set.
+
+    TLE objects are shared between callers by `intern_tle` and are read-only
+    once constructed.
     '''
 
+    # Fields are parsed once on construction and stored in slots to keep
+    # large numbers of TLEs compact
+    __slots__ = ('_line1', '_line2', '_epoch', '_wgs', '_sgp', '_n', '_e', '_i',
+                 '_RAAN', '_w', '_M', '_ndt2', '_nddt6', '_bstar', '_a',
+                 '_tle_elements', '_elements')
+
     def __init__(self, line1:str=None, line2:str=None, wgs:str='wgs84'):
 
         # Validate Input Lines
@@ -230,31 +533,38 @@ class TLE():
         self._validate_tle_input(line2, 2)
 
         # Set values for line
-        self.line1 = line1
-        self.line2 = line2
+        self._line1 = line1
+        self._line2 = line2
 
         # Set TLE Epoch
-        epoch_year = int(line1[18:20])
+        self._epoch = tle_epoch(line1)
 
-        # Apply correction for TLEs only using 2-digit year
-        if epoch_year < 57:
-            epoch_year += 2000
-        else:
-            epoch_year += 1900
-            
-        doy = float(line1[20:32])
-        self.epoch = Epoch(epoch_year, 1, 1, 0, 0, 0, tsys='UTC') + (doy-1)*86400.0
-
-        # Create Internal SGP Propgator
-        earth_model = None
-        if wgs == 'wgs84':
-            earth_model = sgp4.earth_gravity.wgs84
-        elif wgs == 'wgs72':
-            earth_model = sgp4.earth_gravity.wgs72
-        else:
-            raise RuntimeError(f'Unknown SGP Earth Gravity Model "{wgs:s}". Must be one of: wgs72,wgs84 (default).')
+        self._wgs = wgs
+
+        # Parse elements
+        self._n, self._e, self._i, self._RAAN, self._w, self._M, \
+            self._ndt2, self._nddt6, self._bstar = tle_elements_from_lines(line1, line2).tolist()
+
+        self._a = _astro.semimajor_axis(self._n * 2.0 * math.pi / 86400.0)
 
-        self._sgp = sgp4.io.twoline2rv(self.line1, self.line2, earth_model)
+        # Element arrays are only built if requested
+        self._tle_elements = None
+        self._elements = None
+
+        # Create Internal SGP Propgator. Set last as it marks the TLE as
+        # initialized.
+        self._sgp = sgp4.api.Satrec.twoline2rv(line1, line2, _sgp_earth_model(wgs))
+
+    def __setattr__(self, name:str, value):
+        # Shared TLEs cannot be modified once initialized
+        if hasattr(self, '_sgp'):
+            raise AttributeError(f'Cannot set attribute "{name}" of read-only TLE object.')
+
+        object.__setattr__(self, name, value)
+
+    def __reduce__(self):
+        # The SGP4 propagator cannot be pickled so it is rebuilt from the lines
+        return (TLE, (self.line1, self.line2, self._wgs))
 
     def _validate_tle_input(self, line:str, line_number:int):
         '''Internal validation method 
@@ -287,7 +597,55 @@ class TLE():
         elif type(t) == Epoch:
             return (t - self.epoch)/60.0
 
+    def _times_since_epoch(self, t:typing.Union[np.ndarray, typing.List[Epoch], EpochArray]) -> np.ndarray:
+        '''Compute elapsed time since TLE epoch for an array of times.
+
+        Args:
+            t (Union[np.ndarray, List[Epoch], EpochArray]): Times as either Epochs
+                or an array of time since epoch in seconds.
+
+        Returns:
+            np.ndarray: Elapsed time since epoch in seconds.
+        '''
+
+        if isinstance(t, EpochArray):
+            return np.asarray(t - self.epoch, dtype=float)
+        elif len(t) > 0 and isinstance(t[0], Epoch):
+            return np.array([ti - self.epoch for ti in t], dtype=float)
+        else:
+            return np.asarray(t, dtype=float).reshape(-1)
+
     # TLE Properties
+    @property
+    def line1(self):
+        '''First line of Two-Line-Element set.
+
+        Returns:
+            str: First line of TLE.
+        '''
+
+        return self._line1
+
+    @property
+    def line2(self):
+        '''Second line of Two-Line-Element set.
+
+        Returns:
+            str: Second line of TLE.
+        '''
+
+        return self._line2
+
+    @property
+    def epoch(self):
+        '''Epoch of TLE object.
+
+        Returns:
+            :obj:`Epoch`: Epoch of element set.
+        '''
+
+        return self._epoch
+
     @property
     def n(self):
         '''Mean motion of TLE object.
@@ -296,7 +654,7 @@ class TLE():
             float: Mean motion of TLE object. Units: [rev/day]
         '''
 
-        return float(self.line2[52:63])
+        return self._n
 
     @property
     def a(self):
@@ -306,13 +664,7 @@ class TLE():
             float: Semi-major axis of TLE object. Units: [m]
         '''
 
-        # Mean Motion [rev/day]
-        n = self.n
-
-        # Mean Motion [rad/s]
-        n = n * 2.0 * math.pi / 86400.0
-
-        return _astro.semimajor_axis(n)
+        return self._a
 
     @property
     def e(self):
@@ -322,7 +674,7 @@ class TLE():
             float: Eccentricity of TLE object. Units: [rev/day]
         '''
 
-        return float(f'0.{self.line2[26:33]}')
+        return self._e
 
     @property
     def i(self):
@@ -332,7 +684,7 @@ class TLE():
             float: Inclination of TLE object. Units: [deg]
         '''
 
-        return float(self.line2[8:16])
+        return self._i
 
     @property
     def RAAN(self):
@@ -342,7 +694,7 @@ class TLE():
             float: Right ascension of ascending node of TLE object. Units: [deg]
         '''
 
-        return float(self.line2[17:25])
+        return self._RAAN
 
     @property
     def w(self):
@@ -352,7 +704,7 @@ class TLE():
             float: Argument of Perigee of TLE object. Units: [deg]
         '''
 
-        return float(self.line2[34:41])
+        return self._w
 
     @property
     def M(self):
@@ -362,7 +714,7 @@ class TLE():
             float: Mean anomaly of TLE object. Units: [deg]
         '''
 
-        return float(self.line2[43:51])
+        return self._M
 
     @property
     def ndt2(self):
@@ -372,7 +724,7 @@ class TLE():
             float: Second derivative of mean motion divided by 2 of TLE object. Units: [deg]
         '''
 
-        return float(f'{self.line1[33]}0.{self.line1[35:43]}')
+        return self._ndt2
 
     @property
     def nddt6(self):
@@ -382,7 +734,7 @@ class TLE():
             float: Second derivative of mean motion divided by 2 of TLE object. Units: [deg]
         '''
 
-        return float(f'{self.line1[44]}0.{self.line1[45:50]}e{self.line1[50:52]}')
+        return self._nddt6
 
     @property
     def bstar(self):
@@ -392,21 +744,36 @@ class TLE():
             float: B-star term of TLE object. Units: [deg]
         '''
 
-        return float(f'{self.line1[53]}0.{self.line1[54:59]}e{self.line1[59:61]}')
+        return self._bstar
     
     @property
     def tle_elements(self):
-        '''Orbital elements comprising TLE
+        '''Orbital elements comprising TLE. The returned array is read-only.
         '''
 
-        return np.array([self.n, self.e, self.i, self.RAAN, self.w, self.M, self.ndt2, self.nddt6, self.bstar])
+        if self._tle_elements is None:
+            tle_elements = np.array([self._n, self._e, self._i, self._RAAN, self._w, self._M,
+                                     self._ndt2, self._nddt6, self._bstar])
+            tle_elements.flags.writeable = False
+
+            # Cached without passing the read-only check
+            object.__setattr__(self, '_tle_elements', tle_elements)
+
+        return self._tle_elements
 
     @property
     def elements(self):
-        '''Orbital elements comprising TLE
+        '''Orbital elements comprising TLE. The returned array is read-only.
         '''
 
-        return np.array([self.a, self.e, self.i, self.RAAN, self.w, self.M])
+        if self._elements is None:
+            elements = np.array([self._a, self._e, self._i, self._RAAN, self._w, self._M])
+            elements.flags.writeable = False
+
+            # Cached without passing the read-only check
+            object.__setattr__(self, '_elements', elements)
+
+        return self._elements
         
     # TLE State Propagation
     def state(self, t:typing.Union[float,Epoch]) -> np.ndarray:
@@ -424,7 +791,10 @@ class TLE():
         dt = self._time_since_epoch(t)
 
         # Propagate state to time since epoch
-        r, v, = sgp4.propagation.sgp4(self._sgp, dt)
+        err, r, v = self._sgp.sgp4_tsince(dt)
+
+        if err != 0:
+            raise RuntimeError(f'SGP4 propagation failed: {sgp4.api.SGP4_ERRORS[err]}')
         
         return np.hstack((r,v))*1.0e3
 
@@ -454,29 +824,17 @@ class TLE():
         # Get state in ECI frame
         x_teme = self.state(t)
 
-        # Extract components
-        r_eci = x_teme[0:3]
-        v_eci = x_teme[3:6]
-
         # Compute TEME -> ECEF transformation
         if type(t) == float or type(t) == int:
             epc = self.epoch + t
         else:
             epc = t
-        
 
-        R = _att.Rz(tle_gmst82(epc))
-        omega_earth = np.array([0, 0, _constants.OMEGA_EARTH])
-
-        # Compute ECEF state
-        # Apply Polar Motion and Earth Rotation corrections.
-        # Precession and Nutation Corrections are NOT applied since they are
-        # already accounted for in the TEME frame
-        r_pef = R @ r_eci
-        v_pef = R @ v_eci - fcross(omega_earth, R @ r_eci)
-
-        return np.hstack((r_pef, v_pef))
+        theta = tle_gmst82(epc)
 
+        # Apply Earth rotation. Precession and Nutation Corrections are NOT
+        # applied since they are already accounted for in the TEME frame
+        return _teme_to_pef(x_teme, math.cos(theta), math.sin(theta))
 
     def state_itrf(self, t:typing.Union[float,Epoch]) -> np.ndarray:
         '''Compute the satellite state at the time in the ITRF Earth-Fixed (ECEF) frame.
@@ -491,26 +849,16 @@ class TLE():
         # Get state in ECI frame
         x_pef = self.state_pef(t)
 
-        # Extract components
-        r_pef = x_pef[0:3]
-        v_pef = x_pef[3:6]
-
         # Compute TEME -> ECEF transformation
         if type(t) == float or type(t) == int:
             epc = self.epoch + t
         else:
             epc = t
-        
-        PM = _frames.polar_motion(epc)
 
-        # Compute ECEF state
-        # Apply Polar Motion and Earth Rotation corrections.
-        # Precession and Nutation Corrections are NOT applied since they are
-        # already accounted for in the TEME frame
-        r_ecef = PM @ r_pef
-        v_ecef = PM @ v_pef
+        PM = _frames.polar_motion(epc)
 
-        return np.hstack((r_ecef, v_ecef))
+        # Apply Polar Motion
+        return np.hstack((PM @ x_pef[0:3], PM @ x_pef[3:6]))
 
     def state_ecef(self, t:typing.Union[float,Epoch]) -> np.ndarray:
         '''Compute the satellite state at the time in the Earth-Fixed (ECEF) frame.
@@ -534,19 +882,25 @@ class TLE():
             np.ndarray: Satellite state (position and velocity) at Epoch. Units: [m ; m/s]
         '''
 
-        # Transform TEME -> ITRF
-        x_itrf = self.state_itrf(t)
+        x_teme = self.state(t)
 
         if type(t) == float or type(t) == int:
             epc = self.epoch + t
         else:
             epc = t
 
-        # Transform ITRF -> GCRF
-        x_gcrf = _frames.sECEFtoECI(epc, x_itrf)
+        # Transform TEME -> CIRS. Polar motion and the Earth rotation rate
+        # cancel between the PEF and ITRF frames, leaving the rotation from
+        # GMST to the Earth rotation angle.
+        jd_ut1, fd_ut1 = _epoch_to_jdfd(epc, tsys='UT1')
+        angle = _gmst82(jd_ut1, fd_ut1=fd_ut1) - _era00(jd_ut1, fd_ut1)
 
-        # Return Transformation
-        return x_gcrf
+        x_cirs = _rotate_z(x_teme, math.cos(angle), math.sin(angle))
+
+        # Transform CIRS -> GCRF
+        rc2i = _frames.bias_precession_nutation(epc)
+
+        return np.hstack((rc2i.T @ x_cirs[0:3], rc2i.T @ x_cirs[3:6]))
 
     def state_eci(self, t:typing.Union[float,Epoch]) -> np.ndarray:
         '''Compute the satellite state at the time in the inertial (GCRF) frame.
@@ -559,4 +913,661 @@ class TLE():
         '''
 
         # Pass through call which is inertial
-        return self.state_gcrf(t)
\ No newline at end of file
+        return self.state_gcrf(t)
+
+    # TLE Batch State Propagation
+    def _grid(self, t:typing.Union[np.ndarray, typing.List[Epoch], EpochArray], epoch:typing.Optional[Epoch]=None):
+        '''Resolve time grid input into a reference epoch and elapsed seconds.
+
+        Args:
+            t (Union[np.ndarray, List[Epoch], EpochArray]): Times as either Epochs
+                or an array of time since `epoch` in seconds.
+            epoch (:obj:`Epoch`, optional): Reference epoch of times. Defaults
+                to the TLE epoch.
+
+        Returns:
+            :obj:`Epoch`: Reference epoch of the grid
+            np.ndarray: Elapsed time since reference epoch in seconds.
+        '''
+
+        if epoch is None:
+            return self.epoch, self._times_since_epoch(t)
+        elif isinstance(t, EpochArray):
+            return epoch, np.asarray(t - epoch, dtype=float)
+        elif len(t) > 0 and isinstance(t[0], Epoch):
+            return epoch, np.array([ti - epoch for ti in t], dtype=float)
+        else:
+            return epoch, np.asarray(t, dtype=float).reshape(-1)
+
+    def states(self, t:typing.Union[np.ndarray, typing.List[Epoch], EpochArray], epoch:typing.Optional[Epoch]=None) -> np.ndarray:
+        '''Return satellite states in default TLE output frame using the SGP4
+        propagator for multiple times in a single call.
+
+        Args:
+            t (Union[np.ndarray, List[Epoch], EpochArray]): Times as either Epochs
+                or an array of time since `epoch` in seconds.
+            epoch (:obj:`Epoch`, optional): Reference epoch of times. Defaults
+                to the TLE epoch.
+
+        Returns:
+            np.ndarray: Satellite states (position and velocity) with shape (N, 6). Units: [m ; m/s]
+        '''
+
+        epoch, dt = self._grid(t, epoch)
+
+        # Get elapsed time since TLE epoch in days
+        if epoch is not self.epoch:
+            dt = (epoch - self.epoch) + dt
+
+        dt = dt/86400.0
+
+        # Propagate all times in a single call
+        jd = np.full(len(dt), self._sgp.jdsatepoch)
+        fr = self._sgp.jdsatepochF + dt
+
+        err, r, v = self._sgp.sgp4_array(jd, fr)
+
+        if np.any(err != 0):
+            code = err[np.nonzero(err)[0][0]]
+            raise RuntimeError(f'SGP4 propagation failed: {sgp4.api.SGP4_ERRORS[code]}')
+
+        return np.hstack((r, v))*1.0e3
+
+    def states_teme(self, t:typing.Union[np.ndarray, typing.List[Epoch], EpochArray], epoch:typing.Optional[Epoch]=None) -> np.ndarray:
+        '''Compute the satellite states at the times in the inertial (TEME) frame.
+
+        Args:
+            t (Union[np.ndarray, List[Epoch], EpochArray]): Times as either Epochs
+                or an array of time since `epoch` in seconds.
+            epoch (:obj:`Epoch`, optional): Reference epoch of times. Defaults
+                to the TLE epoch.
+
+        Returns:
+            np.ndarray: Satellite states (position and velocity) with shape (N, 6). Units: [m ; m/s]
+        '''
+
+        # Pass through call which is inertial
+        return self.states(t, epoch=epoch)
+
+    def states_pef(self, t:typing.Union[np.ndarray, typing.List[Epoch], EpochArray], epoch:typing.Optional[Epoch]=None) -> np.ndarray:
+        '''Compute the satellite states at the times in the pseudo-Earth-fixed (PEF) frame.
+
+        Args:
+            t (Union[np.ndarray, List[Epoch], EpochArray]): Times as either Epochs
+                or an array of time since `epoch` in seconds.
+            epoch (:obj:`Epoch`, optional): Reference epoch of times. Defaults
+                to the TLE epoch.
+
+        Returns:
+            np.ndarray: Satellite states (position and velocity) with shape (N, 6). Units: [m ; m/s]
+        '''
+
+        epoch, dt = self._grid(t, epoch)
+
+        return _teme_grid(epoch, dt).pef(self.states(dt, epoch=epoch))
+
+    def states_itrf(self, t:typing.Union[np.ndarray, typing.List[Epoch], EpochArray], epoch:typing.Optional[Epoch]=None) -> np.ndarray:
+        '''Compute the satellite states at the times in the ITRF Earth-Fixed (ECEF) frame.
+
+        Satellites propagated over the same times relative to the same
+        `epoch` share the frame rotations of the time grid.
+
+        Args:
+            t (Union[np.ndarray, List[Epoch], EpochArray]): Times as either Epochs
+                or an array of time since `epoch` in seconds.
+            epoch (:obj:`Epoch`, optional): Reference epoch of times. Defaults
+                to the TLE epoch.
+
+        Returns:
+            np.ndarray: Satellite states (position and velocity) with shape (N, 6). Units: [m ; m/s]
+        '''
+
+        epoch, dt = self._grid(t, epoch)
+
+        return _teme_grid(epoch, dt).itrf(self.states(dt, epoch=epoch))
+
+    def states_ecef(self, t:typing.Union[np.ndarray, typing.List[Epoch], EpochArray], epoch:typing.Optional[Epoch]=None) -> np.ndarray:
+        '''Compute the satellite states at the times in the Earth-Fixed (ECEF) frame.
+        The ECEF frame used here is the ITRF frame.
+
+        Args:
+            t (Union[np.ndarray, List[Epoch], EpochArray]): Times as either Epochs
+                or an array of time since `epoch` in seconds.
+            epoch (:obj:`Epoch`, optional): Reference epoch of times. Defaults
+                to the TLE epoch.
+
+        Returns:
+            np.ndarray: Satellite states (position and velocity) with shape (N, 6). Units: [m ; m/s]
+        '''
+        return self.states_itrf(t, epoch=epoch)
+
+    def states_gcrf(self, t:typing.Union[np.ndarray, typing.List[Epoch], EpochArray], epoch:typing.Optional[Epoch]=None) -> np.ndarray:
+        '''Compute the satellite states at the times in the inertial (GCRF) frame.
+
+        Args:
+            t (Union[np.ndarray, List[Epoch], EpochArray]): Times as either Epochs
+                or an array of time since `epoch` in seconds.
+            epoch (:obj:`Epoch`, optional): Reference epoch of times. Defaults
+                to the TLE epoch.
+
+        Returns:
+            np.ndarray: Satellite states (position and velocity) with shape (N, 6). Units: [m ; m/s]
+        '''
+
+        epoch, dt = self._grid(t, epoch)
+
+        return _teme_grid(epoch, dt).gcrf(self.states(dt, epoch=epoch))
+
+    def states_eci(self, t:typing.Union[np.ndarray, typing.List[Epoch], EpochArray], epoch:typing.Optional[Epoch]=None) -> np.ndarray:
+        '''Compute the satellite states at the times in the inertial (GCRF) frame.
+
+        Args:
+            t (Union[np.ndarray, List[Epoch], EpochArray]): Times as either Epochs
+                or an array of time since `epoch` in seconds.
+            epoch (:obj:`Epoch`, optional): Reference epoch of times. Defaults
+                to the TLE epoch.
+
+        Returns:
+            np.ndarray: Satellite states (position and velocity) with shape (N, 6). Units: [m ; m/s]
+        '''
+
+        # Pass through call which is inertial
+        return self.states_gcrf(t, epoch=epoch)
+
+###############
+# TLE Catalog #
+###############
+
+@functools.lru_cache(maxsize=16384)
+def intern_tle(line1:str, line2:str, wgs:str='wgs84') -> TLE:
+    '''Return the TLE object of a line pair from a process-wide cache. All
+    callers requesting the same lines share one parsed and initialized TLE,
+    which is read-only.
+
+    The cache can be emptied with `intern_tle.cache_clear()`.
+
+    Args:
+        line1 (str): First line of Two-Line-Element set.
+        line2 (str): Second line of Two-Line-Element set.
+        wgs (str): Earth model used by the SGP4 propagator.
+
+    Returns:
+        TLE: Shared TLE object of the lines.
+    '''
+
+    return TLE(line1, line2, wgs=wgs)
+
+class TLECatalog():
+    '''Catalog of Two-Line Element sets stored as contiguous arrays of
+    elements. All element sets are parsed once on construction and the entire
+    catalog can be propagated to a common time grid in a single call.
+
+    Args:
+        tles (List[Union[TLE, Tuple[str, str]]]): Element sets to add to the
+            catalog. Either `TLE` objects or pairs of TLE lines.
+        wgs (str): SGP4 Earth gravity model. Must be one of: wgs72, wgs84 (default).
+
+    Attributes:
+        line1 (List[str]): First lines of element sets
+        line2 (List[str]): Second lines of element sets
+        norad_id (np.ndarray): NORAD Catalog IDs
+        epoch_jd (np.ndarray): Epoch of each element set as Julian date. Time system: UTC
+        n (np.ndarray): Mean motion. Units: [rev/day]
+        e (np.ndarray): Eccentricity. Units: [dimensionless]
+        i (np.ndarray): Inclination. Units: [deg]
+        RAAN (np.ndarray): Right ascension of ascending node. Units: [deg]
+        w (np.ndarray): Argument of perigee. Units: [deg]
+        M (np.ndarray): Mean anomaly. Units: [deg]
+        ndt2 (np.ndarray): First derivative of mean motion divided by 2
+        nddt6 (np.ndarray): Second derivative of mean motion divided by 6
+        bstar (np.ndarray): B-star drag term
+    '''
+
+    def __init__(self, tles:typing.List[typing.Union[TLE, typing.Tuple[str, str]]], wgs:str='wgs84'):
+
+        self.line1 = []
+        self.line2 = []
+
+        for tle in tles:
+            if isinstance(tle, TLE):
+                line1, line2 = tle.line1, tle.line2
+            else:
+                line1, line2 = tle
+
+            self.line1.append(line1)
+            self.line2.append(line2)
+
+        # Validate Input Lines
+        for line_number, lines in ((1, self.line1), (2, self.line2)):
+            invalid = np.nonzero(~_valid_tle_lines(lines))[0]
+            if len(invalid) > 0:
+                raise RuntimeError(f'Invalid input TLE on line {line_number:1d} of catalog entry {invalid[0]:d}.')
+
+        self._wgs = wgs
+
+        # Parse elements into contiguous arrays
+        elements = np.array([tle_elements_from_lines(l1, l2) for l1, l2 in zip(self.line1, self.line2)]).reshape(-1, 9)
+
+        self.norad_id = np.array([int(l1[2:7]) for l1 in self.line1], dtype=int)
+        self.n        = np.ascontiguousarray(elements[:, 0])
+        self.e        = np.ascontiguousarray(elements[:, 1])
+        self.i        = np.ascontiguousarray(elements[:, 2])
+        self.RAAN     = np.ascontiguousarray(elements[:, 3])
+        self.w        = np.ascontiguousarray(elements[:, 4])
+        self.M        = np.ascontiguousarray(elements[:, 5])
+        self.ndt2     = np.ascontiguousarray(elements[:, 6])
+        self.nddt6    = np.ascontiguousarray(elements[:, 7])
+        self.bstar    = np.ascontiguousarray(elements[:, 8])
+
+        # Create Internal SGP Propagators
+        earth_model = _sgp_earth_model(wgs)
+        satrecs = [sgp4.api.Satrec.twoline2rv(l1, l2, earth_model) for l1, l2 in zip(self.line1, self.line2)]
+
+        self.epoch_jd = np.array([sat.jdsatepoch + sat.jdsatepochF for sat in satrecs])
+
+        # Element set epochs are in UTC. Satellites are grouped by the TAI-UTC
+        # offset at their epoch so that elapsed time since epoch includes the
+        # leap seconds in between, as in `TLE.states`.
+        leap = np.array([time_system_offset(jd, 0.0, 'UTC', 'TAI') for jd in self.epoch_jd])
+
+        self._sgp = []
+        for offset in np.unique(leap):
+            idx = np.nonzero(leap == offset)[0]
+            self._sgp.append((idx, offset, sgp4.api.SatrecArray([satrecs[k] for k in idx])))
+
+    @classmethod
+    def from_file(cls, source:typing.Union[str, os.PathLike, typing.IO], wgs:str='wgs84',
+                  deduplicate:bool=False, strict:bool=True) -> 'TLECatalog':
+        '''Create a catalog from a 2LE or 3LE file. See `read_tle_lines`.
+
+        Args:
+            source (Union[str, os.PathLike, IO]): Path or file-like object of
+                the element sets. May be gzip-compressed.
+            wgs (str): SGP4 Earth gravity model. Must be one of: wgs72, wgs84 (default).
+            deduplicate (bool): Keep only the newest element set of each NORAD ID.
+            strict (bool): Raise an error for invalid element sets instead of
+                skipping them.
+
+        Returns:
+            TLECatalog: Catalog of element sets in the file.
+        '''
+
+        entries = read_tle_lines(source, deduplicate=deduplicate, strict=strict)
+
+        return cls([(line1, line2) for _, line1, line2 in entries], wgs=wgs)
+
+    def __len__(self):
+        return len(self.line1)
+
+    def __getitem__(self, index:int) -> TLE:
+        # Element sets are only parsed once per process
+        return intern_tle(self.line1[index], self.line2[index], wgs=self._wgs)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    @property
+    def tle_elements(self) -> np.ndarray:
+        '''Orbital elements comprising each TLE in the catalog
+
+        Returns:
+            np.ndarray: Elements with shape (n_sats, 9). Rows follow the same
+                layout as `TLE.tle_elements`.
+        '''
+
+        return np.column_stack((self.n, self.e, self.i, self.RAAN, self.w, self.M, self.ndt2, self.nddt6, self.bstar))
+
+    def _grid(self, t:typing.Union[np.ndarray, typing.List[Epoch], EpochArray], epoch:typing.Optional[Epoch]=None):
+        '''Resolve time grid input into a reference epoch and elapsed seconds.
+
+        Args:
+            t (Union[np.ndarray, List[Epoch], EpochArray]): Times as either Epochs
+                or an array of time since `epoch` in seconds.
+            epoch (:obj:`Epoch`, optional): Reference epoch of times. Required
+                if times are given in seconds.
+
+        Returns:
+            :obj:`Epoch`: Reference epoch of the grid
+            np.ndarray: Elapsed time since reference epoch in seconds.
+        '''
+
+        if isinstance(t, EpochArray) and len(t) > 0:
+            epoch = t[0] if epoch is None else epoch
+            return epoch, np.asarray(t - epoch, dtype=float)
+        elif len(t) > 0 and isinstance(t[0], Epoch):
+            epoch = t[0] if epoch is None else epoch
+            return epoch, np.array([ti - epoch for ti in t], dtype=float)
+        elif epoch is None:
+            raise RuntimeError('Reference epoch required for time grids given in seconds.')
+        else:
+            return epoch, np.asarray(t, dtype=float).reshape(-1)
+
+    # Catalog State Propagation
+    def states(self, t:typing.Union[np.ndarray, typing.List[Epoch], EpochArray], epoch:typing.Optional[Epoch]=None) -> np.ndarray:
+        '''Propagate all element sets in the catalog to a common time grid in
+        the default TLE output frame (TEME).
+
+        States of satellites which cannot be propagated to a given time, for 
+        example because they have decayed, are set to NaN.
+
+        Args:
+            t (Union[np.ndarray, List[Epoch], EpochArray]): Times as either Epochs
+                or an array of time since `epoch` in seconds.
+            epoch (:obj:`Epoch`, optional): Reference epoch of times. Required
+                if times are given in seconds.
+
+        Returns:
+            np.ndarray: Satellite states with shape (n_sats, n_times, 6). Units: [m ; m/s]
+        '''
+
+        epoch, dt = self._grid(t, epoch)
+
+        if len(self) == 0:
+            return np.zeros((0, len(dt), 6))
+
+        # Compute two-part TAI Julian date of each time
+        jd, fr = EpochArray.from_offsets(epoch, dt)._jdfd(tsys='TAI')
+
+        # Propagate each group of the catalog in a single call. Shifting the
+        # TAI date by the TAI-UTC offset at the epochs of the group gives the
+        # continuous elapsed time since the UTC epochs.
+        states = np.empty((len(self), len(dt), 6))
+        for idx, offset, satrecs in self._sgp:
+            err, r, v = satrecs.sgp4(jd, fr - offset/86400.0)
+
+            if np.any(err != 0):
+                logger.debug(f'SGP4 propagation failed for {np.count_nonzero(np.any(err != 0, axis=1)):d} catalog entries.')
+
+            states[idx] = np.concatenate((r, v), axis=2)*1.0e3
+
+        return states
+
+    def states_teme(self, t:typing.Union[np.ndarray, typing.List[Epoch], EpochArray], epoch:typing.Optional[Epoch]=None) -> np.ndarray:
+        '''Propagate all element sets in the catalog to a common time grid in
+        the inertial (TEME) frame.
+
+        Args:
+            t (Union[np.ndarray, List[Epoch], EpochArray]): Times as either Epochs
+                or an array of time since `epoch` in seconds.
+            epoch (:obj:`Epoch`, optional): Reference epoch of times. Required
+                if times are given in seconds.
+
+        Returns:
+            np.ndarray: Satellite states with shape (n_sats, n_times, 6). Units: [m ; m/s]
+        '''
+
+        # Pass through call which is inertial
+        return self.states(t, epoch=epoch)
+
+    def states_pef(self, t:typing.Union[np.ndarray, typing.List[Epoch], EpochArray], epoch:typing.Optional[Epoch]=None) -> np.ndarray:
+        '''Propagate all element sets in the catalog to a common time grid in
+        the pseudo-Earth-fixed (PEF) frame.
+
+        Args:
+            t (Union[np.ndarray, List[Epoch], EpochArray]): Times as either Epochs
+                or an array of time since `epoch` in seconds.
+            epoch (:obj:`Epoch`, optional): Reference epoch of times. Required
+                if times are given in seconds.
+
+        Returns:
+            np.ndarray: Satellite states with shape (n_sats, n_times, 6). Units: [m ; m/s]
+        '''
+
+        epoch, dt = self._grid(t, epoch)
+
+        # Get states in ECI frame
+        x_teme = self.states(dt, epoch=epoch)
+
+        # Compute TEME -> PEF transformation once for the shared grid
+        return _teme_grid(epoch, dt).pef(x_teme)
+
+    def states_itrf(self, t:typing.Union[np.ndarray, typing.List[Epoch], EpochArray], epoch:typing.Optional[Epoch]=None) -> np.ndarray:
+        '''Propagate all element sets in the catalog to a common time grid in
+        the ITRF Earth-Fixed (ECEF) frame.
+
+        Args:
+            t (Union[np.ndarray, List[Epoch], EpochArray]): Times as either Epochs
+                or an array of time since `epoch` in seconds.
+            epoch (:obj:`Epoch`, optional): Reference epoch of times. Required
+                if times are given in seconds.
+
+        Returns:
+            np.ndarray: Satellite states with shape (n_sats, n_times, 6). Units: [m ; m/s]
+        '''
+
+        epoch, dt = self._grid(t, epoch)
+
+        # Compute TEME -> ITRF transformation once for the shared grid
+        return _teme_grid(epoch, dt).itrf(self.states(dt, epoch=epoch))
+
+    def states_ecef(self, t:typing.Union[np.ndarray, typing.List[Epoch], EpochArray], epoch:typing.Optional[Epoch]=None) -> np.ndarray:
+        '''Propagate all element sets in the catalog to a common time grid in
+        the Earth-Fixed (ECEF) frame. The ECEF frame used here is the ITRF frame.
+
+        Args:
+            t (Union[np.ndarray, List[Epoch], EpochArray]): Times as either Epochs
+                or an array of time since `epoch` in seconds.
+            epoch (:obj:`Epoch`, optional): Reference epoch of times. Required
+                if times are given in seconds.
+
+        Returns:
+            np.ndarray: Satellite states with shape (n_sats, n_times, 6). Units: [m ; m/s]
+        '''
+
+        return self.states_itrf(t, epoch=epoch)
+
+    def states_gcrf(self, t:typing.Union[np.ndarray, typing.List[Epoch], EpochArray], epoch:typing.Optional[Epoch]=None) -> np.ndarray:
+        '''Propagate all element sets in the catalog to a common time grid in
+        the inertial (GCRF) frame.
+
+        Args:
+            t (Union[np.ndarray, List[Epoch], EpochArray]): Times as either Epochs
+                or an array of time since `epoch` in seconds.
+            epoch (:obj:`Epoch`, optional): Reference epoch of times. Required
+                if times are given in seconds.
+
+        Returns:
+            np.ndarray: Satellite states with shape (n_sats, n_times, 6). Units: [m ; m/s]
+        '''
+
+        epoch, dt = self._grid(t, epoch)
+
+        # Transform TEME -> GCRF. Rotations are computed once per time and
+        # applied to all satellites.
+        return _teme_grid(epoch, dt).gcrf(self.states(dt, epoch=epoch))
+
+    def states_eci(self, t:typing.Union[np.ndarray, typing.List[Epoch], EpochArray], epoch:typing.Optional[Epoch]=None) -> np.ndarray:
+        '''Propagate all element sets in the catalog to a common time grid in
+        the inertial (GCRF) frame.
+
+        Args:
+            t (Union[np.ndarray, List[Epoch], EpochArray]): Times as either Epochs
+                or an array of time since `epoch` in seconds.
+            epoch (:obj:`Epoch`, optional): Reference epoch of times. Required
+                if times are given in seconds.
+
+        Returns:
+            np.ndarray: Satellite states with shape (n_sats, n_times, 6). Units: [m ; m/s]
+        '''
+
+        # Pass through call which is inertial
+        return self.states_gcrf(t, epoch=epoch)
+
+#############
+# TLE Files #
+#############
+
+@contextlib.contextmanager
+def _tle_text_lines(source:typing.Union[str, os.PathLike, typing.IO, typing.Iterable[str]]):
+    '''Open a source of TLE text as an iterator of lines. Compressed input is
+    decompressed as it is read. File-like objects are left open.
+
+    Args:
+        source (Union[str, os.PathLike, IO, Iterable[str]]): Path, binary or
+            text file-like object, or iterable of lines.
+
+    Yields:
+        Iterator[str]: Lines of text.
+    '''
+
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as fp:
+            with _tle_text_lines(fp) as lines:
+                yield lines
+        return
+
+    # Text streams and other iterables of lines are used directly
+    if isinstance(source, io.TextIOBase) or not hasattr(source, 'read'):
+        yield iter(source)
+        return
+
+    # Binary streams are buffered to detect gzip compression
+    stream = source if hasattr(source, 'peek') else io.BufferedReader(source)
+    compressed = stream.peek(2)[0:2] == b'\x1f\x8b'
+
+    text = io.TextIOWrapper(gzip.GzipFile(fileobj=stream) if compressed else stream,
+                            encoding='ascii', errors='replace')
+
+    try:
+        yield text
+    finally:
+        # Release wrappers without closing the caller's stream
+        inner = text.detach()
+        if compressed:
+            inner.close()
+        if stream is not source:
+            stream.detach()
+
+def _tle_epoch_key(line1:str) -> float:
+    # Sortable epoch of an element set as year and fractional day of year
+    year = int(line1[18:20])
+    year += 2000 if year < 57 else 1900
+
+    return year*1000.0 + float(line1[20:32])
+
+def _iter_tle_entries(source, strict:bool, chunk_size:int):
+    '''Split a source of TLE text into validated element sets.
+
+    Args:
+        source (Union[str, os.PathLike, IO, Iterable[str]]): Source of element sets.
+        strict (bool): Raise an error for invalid element sets instead of
+            skipping them.
+        chunk_size (int): Number of element sets validated together.
+
+    Yields:
+        Tuple[str, str, str]: Name (`None` for 2LE), first line, and second
+            line of each element set.
+    '''
+
+    def _validate(chunk):
+        valid = _valid_tle_lines([e[1] for e in chunk]) & _valid_tle_lines([e[2] for e in chunk])
+
+        for entry, ok in zip(chunk, valid):
+            if ok:
+                yield entry[0:3]
+            elif strict:
+                raise RuntimeError(f'Invalid TLE at line {entry[3]:d}.')
+            else:
+                logger.warning(f'Skipping invalid TLE at line {entry[3]:d}.')
+
+    def _invalid(line_number):
+        if strict:
+            raise RuntimeError(f'Incomplete TLE at line {line_number:d}.')
+        logger.warning(f'Skipping incomplete TLE at line {line_number:d}.')
+
+    chunk = []
+    name, line1 = None, None
+
+    with _tle_text_lines(source) as lines:
+        for line_number, line in enumerate(lines, start=1):
+            line = line.rstrip()
+
+            if not line:
+                continue
+
+            if line1 is not None:
+                if len(line) == 69 and line[0] == '2':
+                    chunk.append((name, line1, line, line_number - 1))
+                    name, line1 = None, None
+
+                    if len(chunk) >= chunk_size:
+                        yield from _validate(chunk)
+                        chunk = []
+
+                    continue
+
+                _invalid(line_number - 1)
+                name, line1 = None, None
+
+            if len(line) == 69 and line[0] == '1':
+                line1 = line
+            else:
+                # Names of 3LE files may carry a leading zero line number
+                name = line[2:].strip() if line.startswith('0 ') else line.strip()
+
+        if line1 is not None:
+            _invalid(line_number)
+
+    yield from _validate(chunk)
+
+def read_tle_lines(source:typing.Union[str, os.PathLike, typing.IO, typing.Iterable[str]],
+                   deduplicate:bool=False, strict:bool=True,
+                   chunk_size:int=4096) -> typing.Iterator[typing.Tuple[typing.Optional[str], str, str]]:
+    '''Read the element sets of a 2LE or 3LE file lazily. Checksums are
+    validated in chunks of element sets at a time.
+
+    Args:
+        source (Union[str, os.PathLike, IO, Iterable[str]]): Path, binary or
+            text file-like object, or iterable of lines. Paths and binary
+            objects may be gzip-compressed.
+        deduplicate (bool): Keep only the newest element set of each NORAD
+            ID. Element sets are then returned once the whole source is read,
+            ordered by first appearance of each NORAD ID.
+        strict (bool): Raise an error for invalid element sets instead of
+            skipping them.
+        chunk_size (int): Number of element sets validated together.
+
+    Returns:
+        Iterator[Tuple[Optional[str], str, str]]: Name (`None` for 2LE),
+            first line, and second line of each element set.
+    '''
+
+    if chunk_size < 1:
+        raise RuntimeError(f'Invalid chunk size {chunk_size}. Must be at least 1.')
+
+    entries = _iter_tle_entries(source, strict, chunk_size)
+
+    if not deduplicate:
+        return entries
+
+    def _newest():
+        newest = {}
+        for entry in entries:
+            norad_id = entry[1][2:7]
+            if norad_id not in newest or _tle_epoch_key(entry[1]) >= _tle_epoch_key(newest[norad_id][1]):
+                newest[norad_id] = entry
+
+        yield from newest.values()
+
+    return _newest()
+
+def read_tles(source:typing.Union[str, os.PathLike, typing.IO, typing.Iterable[str]],
+              wgs:str='wgs84', deduplicate:bool=False, strict:bool=True) -> typing.Iterator[TLE]:
+    '''Read the element sets of a 2LE or 3LE file lazily as `TLE` objects.
+    See `read_tle_lines`.
+
+    Args:
+        source (Union[str, os.PathLike, IO, Iterable[str]]): Path, binary or
+            text file-like object, or iterable of lines.
+        wgs (str): SGP4 Earth gravity model. Must be one of: wgs72, wgs84 (default).
+        deduplicate (bool): Keep only the newest element set of each NORAD ID.
+        strict (bool): Raise an error for invalid element sets instead of
+            skipping them.
+
+    Returns:
+        Iterator[TLE]: Element sets in the file.
+    '''
+
+    for _, line1, line2 in read_tle_lines(source, deduplicate=deduplicate, strict=strict):
+        yield TLE(line1, line2, wgs=wgs)
@@ -1,3 +1,6 @@
+import os
+import json
+import hashlib
 import logging
 import requests
 import urllib
@@ -56,6 +59,111 @@ def fcross(a, b):
 
     return [c1, c2, c3]
 
+################
+# Data Caching #
+################
+
+def _file_sha256(filepath:pathlib.Path) -> str:
+    # Compute SHA-256 digest of file contents
+    digest = hashlib.sha256()
+
+    with open(filepath, 'rb') as fp:
+        for block in iter(lambda: fp.read(1 << 20), b''):
+            digest.update(block)
+
+    return digest.hexdigest()
+
+def _write_atomic(filepath:pathlib.Path, write:typing.Callable[[typing.BinaryIO], None]) -> None:
+    # Write to a temporary file in the destination directory and move it into
+    # place so concurrent readers never observe a partially written file.
+    with tempfile.NamedTemporaryFile(dir=filepath.parent, prefix=f'.{filepath.name}.', delete=False) as fp:
+        try:
+            write(fp)
+            fp.flush()
+        except BaseException:
+            os.unlink(fp.name)
+            raise
+
+    os.replace(fp.name, filepath)
+
+def cached_array_paths(filepath:str, tag:str) -> typing.Tuple[pathlib.Path, pathlib.Path]:
+    """Return the paths of the binary sidecar cache of a data file.
+
+    Args:
+        filepath (str): Path to source data file
+        tag (str): Name identifying the parsed representation
+
+    Returns:
+        pathlib.Path: Path of cached array data (``.npy``)
+        pathlib.Path: Path of cache metadata (``.json``)
+    """
+
+    filepath = pathlib.Path(filepath)
+
+    return (filepath.with_name(f'{filepath.name}.{tag}.cache.npy'),
+            filepath.with_name(f'{filepath.name}.{tag}.cache.json'))
+
+def load_cached_array(filepath:str, parser:typing.Callable[[str], np.ndarray], tag:str, version:int=1) -> np.ndarray:
+    """Load an array parsed from a text data file using a binary sidecar cache.
+
+    On the first load the file is parsed with ``parser`` and the result is 
+    written next to the source file as a ``.npy`` file along with metadata 
+    identifying the source file by its modification time, size, and SHA-256 
+    hash. Later loads memory-map the cached array instead of parsing the file.
+    The cache is rebuilt if the source contents or parser version change.
+
+    If the cache cannot be written, for example because the data directory is
+    read-only, the parsed array is returned without caching.
+
+    Args:
+        filepath (str): Path to source data file
+        parser (Callable[[str], np.ndarray]): Function parsing source file into
+            an array
+        tag (str): Name identifying the parsed representation
+        version (int): Version of parser output. Increment to invalidate 
+            existing caches when the parser changes.
+
+    Returns:
+        np.ndarray: Parsed array. Read-only memory-mapped if loaded from cache.
+    """
+
+    filepath = pathlib.Path(filepath)
+    npy_path, meta_path = cached_array_paths(filepath, tag)
+
+    stat = filepath.stat()
+    meta = {'version': version, 'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size}
+
+    # Attempt to use existing cache
+    try:
+        with open(meta_path, 'r') as fp:
+            cached_meta = json.load(fp)
+
+        valid = cached_meta.get('version') == version and cached_meta.get('size') == stat.st_size
+
+        if valid and cached_meta.get('mtime_ns') != stat.st_mtime_ns:
+            # Modification time changed. Only reuse cache if contents are unchanged.
+            valid = cached_meta.get('sha256') == _file_sha256(filepath)
+
+        if valid:
+            # Return plain array view of memory map to avoid np.memmap overhead
+            return np.load(npy_path, mmap_mode='r').view(np.ndarray)
+    except (OSError, ValueError, KeyError):
+        pass
+
+    # Parse source file
+    data = np.ascontiguousarray(parser(str(filepath)))
+
+    # Write new cache
+    meta['sha256'] = _file_sha256(filepath)
+
+    try:
+        _write_atomic(npy_path, lambda fp: np.save(fp, data))
+        _write_atomic(meta_path, lambda fp: fp.write(json.dumps(meta).encode()))
+    except OSError as e:
+        logger.debug(f'Unable to write data cache for {filepath}: {e}')
+
+    return data
+
 ################
 # Data Sources #
 ################
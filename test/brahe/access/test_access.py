@@ -3,6 +3,8 @@ from pytest import approx
 import uuid
 
 from brahe.epoch import Epoch
+from brahe.tle import TLE, tle_string_from_elements
+from brahe.coordinates import sECEFtoGEOD, sGEODtoECEF
 
 import brahe.data_models as bdm
 from brahe.access.tessellation import tessellate
@@ -159,4 +161,103 @@ def test_access_svalbard_stk(spacecraft_polar, request_sf_point):
 
     collects = find_location_accesses(spacecraft_polar, tiles[0], t_start, t_end, request=request_sf_point)
 
-    assert len(collects) == 4
\ No newline at end of file
+    assert len(collects) == 4
+
+
+def test_find_access_windows(spacecraft_polar, station_svalbard):
+    t_start = Epoch(2020, 1, 1, time_system='UTC')
+    t_end = Epoch(2020, 1, 2, time_system='UTC')
+
+    constraints = station_svalbard.properties.constraints
+    constraints.elevation_min = 0.0
+
+    windows = find_access_windows(spacecraft_polar.tle, station_svalbard.center_ecef,
+                                  constraints, ['elevation'], t_start, t_end)
+
+    assert len(windows) == 15
+
+    # Check against STK access times:
+    for idx, (wo, wc) in enumerate(windows):
+        assert (wo - STK_SVALBARD_ACCESS[idx][0]) == approx(0, abs=0.05)
+        assert (wc - STK_SVALBARD_ACCESS[idx][1]) == approx(0, abs=0.05)
+
+
+def test_find_access_windows_geo():
+    t_start = Epoch(2020, 1, 1, time_system='UTC')
+    t_end = t_start + 3600.0
+
+    # Geostationary spacecraft continuously visible from the location
+    line1, line2 = tle_string_from_elements(t_start, np.array([1.00273791, 0.0001, 0.05, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]), norad_id=99999)
+    tle = TLE(line1, line2)
+
+    lon, lat, _ = sECEFtoGEOD(tle.state_itrf(t_start)[0:3], use_degrees=True)
+    loc_ecef = sGEODtoECEF([lon, lat + 10.0, 0.0], use_degrees=True)
+
+    constraints = bdm.AccessConstraints(elevation_min=0.0)
+
+    windows = find_access_windows(tle, loc_ecef, constraints, ['elevation'], t_start, t_end)
+
+    # Open window is clipped to the search period
+    assert len(windows) == 1
+    assert (windows[0][0] - t_start) == approx(0, abs=1e-6)
+    assert (windows[0][1] - t_end) == approx(0, abs=1e-6)
+
+def test_access_constraint_pipeline(access_geometry_left, access_geometry_right):
+    epc, sat_left, loc_ecef = access_geometry_left
+    _, sat_right, _ = access_geometry_right
+
+    sat_ecef = np.vstack((sat_left, sat_right))
+
+    constraint_list = [
+        'look_direction', 'ascdsc', 'look_angle', 'elevation'
+    ]
+
+    constraints = bdm.AccessConstraints()
+    constraints.look_direction = bdm.LookDirection.left
+    constraints.ascdsc = bdm.AscendingDescending.ascending
+
+    # Batch constraints match single-state constraints
+    for field in constraint_list:
+        mask = globals()[f'{field}_constraint_batch'](sat_ecef, loc_ecef, constraints)
+        expected = [globals()[f'{field}_constraint'](epc, x, loc_ecef, constraints) for x in sat_ecef]
+        assert list(mask) == expected
+
+    pipeline = AccessConstraintPipeline(loc_ecef, constraints, constraint_list)
+    assert list(pipeline(sat_ecef)) == [True, False]
+
+    with pytest.raises(RuntimeError):
+        AccessConstraintPipeline(loc_ecef, constraints, ['unknown'])
+
+def test_find_accesses(spacecraft_polar, stations, request_sf_point):
+    t_start = Epoch(2020, 1, 1, time_system='UTC')
+    t_end = Epoch(2020, 1, 3, time_system='UTC')
+
+    tiles = tessellate(spacecraft_polar, request_sf_point)
+    locations = stations + tiles
+
+    opportunities = find_accesses([spacecraft_polar], locations, t_start, t_end,
+                                  requests=[request_sf_point])
+
+    # Bulk computation matches computing each location separately
+    expected = []
+    for location in locations:
+        expected += find_location_accesses(spacecraft_polar, location, t_start, t_end,
+                                           request=request_sf_point)
+
+    assert len(opportunities) == len(expected)
+    for o, e in zip(opportunities, expected):
+        assert o.t_start == e.t_start
+        assert o.t_end == e.t_end
+        assert o.center == e.center
+
+    # Columnar opportunities are created on demand
+    opportunity_set = find_access_set([spacecraft_polar], locations, t_start, t_end,
+                                      requests=[request_sf_point])
+
+    assert len(opportunity_set) == len(expected)
+    assert opportunity_set['t_end'] - opportunity_set['t_start'] == approx([e.t_duration for e in expected], abs=1e-3)
+    assert opportunity_set[0].access_properties.elevation_max == expected[0].access_properties.elevation_max
+
+    # Tiles require their request
+    with pytest.raises(ValueError):
+        find_accesses([spacecraft_polar], tiles, t_start, t_end)
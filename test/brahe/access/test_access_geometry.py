@@ -1,6 +1,7 @@
 import pytest
 from pytest import approx
 import uuid
+import numpy as np
 
 from brahe.epoch import Epoch
 
@@ -80,3 +81,20 @@ def test_look_direction_right(access_geometry_right):
     ld = look_direction(sat_ecef, loc_ecef)
 
     assert ld.value == 'right'
+
+
+def test_geometry_batch(access_geometry_left, access_geometry_right):
+    _, sat_left, loc_ecef = access_geometry_left
+    _, sat_right, _ = access_geometry_right
+
+    sat_ecef = np.vstack((sat_left, sat_right))
+
+    # Batch geometry matches single-state geometry
+    azelrng_b = azelrng_batch(sat_ecef, loc_ecef, use_degrees=True)
+    assert azelrng_b.shape == (2, 3)
+    for k in [0, 1]:
+        assert azelrng_b[k] == approx(azelrng(sat_ecef[k], loc_ecef, use_degrees=True), abs=1e-8)
+        assert look_angle_batch(sat_ecef, loc_ecef)[k] == approx(look_angle(sat_ecef[k], loc_ecef), abs=1e-8)
+
+    assert list(ascdsc_batch(sat_ecef)) == [ascdsc(sat_left), ascdsc(sat_right)]
+    assert list(look_direction_batch(sat_ecef, loc_ecef)) == [bdm.LookDirection.left, bdm.LookDirection.right]
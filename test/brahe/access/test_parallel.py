@@ -0,0 +1,63 @@
+import pytest
+import multiprocessing.shared_memory
+import numpy as np
+
+from brahe.eop import EOP
+from brahe.epoch import Epoch
+from brahe.frames import frame_precision, set_frame_precision
+
+from brahe.access.tessellation import tessellate
+from brahe.access.access import find_accesses
+import brahe.access.parallel as parallel
+from brahe.access.parallel import find_accesses_parallel
+
+
+def test_find_accesses_parallel(spacecraft_polar, stations, request_sf_point):
+    t_start = Epoch(2020, 1, 1, time_system='UTC')
+    t_end = Epoch(2020, 1, 2, time_system='UTC')
+
+    tiles = tessellate(spacecraft_polar, request_sf_point)
+    locations = stations + tiles
+
+    expected = find_accesses([spacecraft_polar], locations, t_start, t_end,
+                             requests=[request_sf_point])
+
+    opportunities = find_accesses_parallel([spacecraft_polar], locations, t_start, t_end,
+                                           requests=[request_sf_point],
+                                           max_workers=2, chunk_size=2)
+
+    # Same opportunities in the same order as the serial computation
+    assert len(opportunities) == len(expected)
+    for o, e in zip(opportunities, expected):
+        assert o.t_start == e.t_start
+        assert o.t_end == e.t_end
+        assert o.center == e.center
+
+    with pytest.raises(RuntimeError):
+        find_accesses_parallel([spacecraft_polar], locations, t_start, t_end,
+                               requests=[request_sf_point], chunk_size=0)
+
+
+def test_initialize_worker():
+    eop_data = EOP._data
+    precision = frame_precision()
+
+    shm = multiprocessing.shared_memory.SharedMemory(create=True, size=6*8)
+
+    try:
+        # Worker uses the Earth orientation data and frame precision it is given
+        data = np.array(eop_data[:10])
+        parallel._initialize_worker(shm.name, (1, 1, 6), data, 'full')
+
+        assert EOP._data is data
+        assert frame_precision() == 'full'
+        assert parallel._WORKER_EPHEMERIDES[1].shape == (1, 1, 6)
+
+        parallel._WORKER_EPHEMERIDES[0].close()
+        parallel._WORKER_EPHEMERIDES = None
+    finally:
+        EOP._data = eop_data
+        set_frame_precision(precision)
+
+        shm.close()
+        shm.unlink()
@@ -0,0 +1,48 @@
+import pytest
+from pytest import approx
+
+from brahe.epoch import Epoch
+
+from brahe.access.access import find_access_windows
+from brahe.access.passes import *
+
+
+def test_predict_passes(spacecraft_polar, stations):
+    t_start = Epoch(2020, 1, 1, time_system='UTC')
+    t_end = Epoch(2020, 1, 2, time_system='UTC')
+
+    tle = spacecraft_polar.tle
+
+    for station in stations:
+        # Dense search finds short passes missed by the default grid
+        windows = find_access_windows(tle, station.center_ecef, station.constraints, ['elevation'],
+                                      t_start, t_end, timestep=5)
+
+        passes = predict_passes(tle, station.center_ecef, t_start, t_end,
+                                elevation_min=station.constraints.elevation_min)
+
+        assert len(passes) == len(windows)
+        for (aos, tca, los), (ws, we) in zip(passes, windows):
+            assert aos - ws == approx(0.0, abs=1e-2)
+            assert los - we == approx(0.0, abs=1e-2)
+            assert aos < tca < los
+
+            # Elevation peaks at closest approach
+            el, el_dot = elevation_rate(tle, tca, [-10.0, 0.0, 10.0], station.center_ecef)
+            assert el[1] > el[0] and el[1] > el[2]
+            assert el_dot[1] == approx(0.0, abs=1e-6)
+
+    with pytest.raises(RuntimeError):
+        predict_passes(tle, stations[0].center_ecef, t_start, t_end, steps_per_orbit=2)
+
+
+def test_find_station_contacts(spacecraft_polar, station_svalbard):
+    t_start = Epoch(2020, 1, 1, time_system='UTC')
+    t_end = Epoch(2020, 1, 2, time_system='UTC')
+
+    contacts = find_station_contacts(spacecraft_polar, station_svalbard, t_start, t_end)
+
+    assert len(contacts) == 15
+    for contact in contacts:
+        assert contact.station_id == station_svalbard.station_id
+        assert contact.access_properties.elevation_max >= station_svalbard.constraints.elevation_min
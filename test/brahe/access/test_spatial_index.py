@@ -0,0 +1,56 @@
+import pytest
+from pytest import approx
+import math
+import numpy as np
+
+import brahe
+from brahe.access.spatial_index import *
+
+
+def test_access_central_angle():
+    r_sat = brahe.R_EARTH + 500e3
+
+    # Horizon
+    lam = access_central_angle(r_sat, brahe.R_EARTH, elevation_min=0.0)
+    assert lam == approx(math.acos(brahe.R_EARTH / r_sat), abs=1e-12)
+
+    # Directly overhead
+    assert access_central_angle(r_sat, brahe.R_EARTH, elevation_min=90.0) == approx(0.0, abs=1e-12)
+
+    # Look angle constraint is tighter than the elevation constraint
+    lam_look = access_central_angle(r_sat, brahe.R_EARTH, elevation_min=0.0, look_angle_max=30.0)
+    assert lam_look == approx(math.asin(r_sat * math.sin(math.radians(30.0)) / brahe.R_EARTH) - math.radians(30.0), abs=1e-12)
+    assert lam_look < lam
+
+    # Unconstrained locations may always be accessible
+    assert access_central_angle(r_sat, brahe.R_EARTH) == approx(math.pi)
+
+
+def test_location_index():
+    rng = np.random.default_rng(0)
+
+    # Random locations on the Earth's surface
+    lon = rng.uniform(-180.0, 180.0, 500)
+    lat = np.degrees(np.arcsin(rng.uniform(-1.0, 1.0, 500)))
+    loc_ecef = np.array([brahe.sGEODtoECEF([lo, la, 0.0], use_degrees=True) for lo, la in zip(lon, lat)])
+    elevation_min = rng.uniform(0.0, 30.0, 500)
+
+    # Satellite positions
+    sat_ecef = np.array([brahe.sGEODtoECEF([lo, la, 500e3], use_degrees=True) for lo, la in zip(lon[:20], lat[:20])])
+
+    index = LocationIndex(loc_ecef, elevation_min=elevation_min)
+    sat_idx, loc_idx = index.query(sat_ecef)
+
+    assert len(index) == 500
+    assert np.all(np.diff(loc_idx) >= 0)
+
+    # Every location above its minimum elevation is found
+    candidates = set(zip(sat_idx.tolist(), loc_idx.tolist()))
+    for i, x in enumerate(sat_ecef):
+        for j, loc in enumerate(loc_ecef):
+            el = brahe.sENZtoAZEL(brahe.sECEFtoENZ(loc, x), use_degrees=True)[1]
+            if el >= elevation_min[j]:
+                assert (i, j) in candidates
+
+    # Most pairs are pruned
+    assert len(candidates) < 0.1 * len(sat_ecef) * len(loc_ecef)
@@ -0,0 +1,59 @@
+# Test Imports
+import pytest
+from pytest import approx
+import pickle
+import uuid
+import numpy as np
+
+# Modules Under Test
+from brahe.epoch import Epoch
+from brahe.data_models.earth_observation import *
+from brahe.data_models.opportunity_set import *
+
+def test_opportunity_set(stations):
+    station = stations[0]
+    epoch = Epoch(2020, 1, 1, time_system='UTC')
+
+    properties = {
+        'ascdsc': [AscendingDescending.ascending, AscendingDescending.descending],
+        'look_direction': [LookDirection.left, LookDirection.right],
+        'elevation_max': [45.0, 30.0],
+        'los_start': np.eye(3)[0:2],
+    }
+
+    opportunities = OpportunitySet.from_windows(epoch, 1, station, np.array([60.0, 6000.0]),
+                                                np.array([660.0, 6300.0]), properties)
+
+    assert len(opportunities) == 2
+    assert list(opportunities['elevation_max']) == [45.0, 30.0]
+    assert list(opportunities.t_duration) == [600.0, 300.0]
+    assert opportunities.t_start[1] == epoch + 6000.0
+    assert uuid.UUID(opportunities.ids[0]).version == 4
+
+    # Opportunities are created on demand
+    contact = opportunities[1]
+
+    assert type(contact) == Contact
+    assert contact.id == uuid.UUID(opportunities.ids[1])
+    assert contact.t_start_epc == epoch + 6000.0
+    assert contact.t_duration == 300.0
+    assert contact.station_id == station.station_id
+    assert contact.access_properties.ascdsc == AscendingDescending.descending
+    assert contact.access_properties.look_direction == LookDirection.right
+    assert contact.access_properties.los_start == [0.0, 1.0, 0.0]
+
+    # Subsets and joined sets reference the same locations
+    later = opportunities[opportunities['t_start'] > 100.0]
+    assert len(later) == 1 and later[0].id == contact.id
+
+    joined = OpportunitySet.concatenate([opportunities, later], epoch=epoch - 60.0)
+    assert len(joined) == 3
+    assert len(joined.locations) == 2
+    assert joined[2].t_start == contact.t_start
+
+    # Records are plain arrays
+    copied = pickle.loads(pickle.dumps(joined))
+    assert copied[0].id == opportunities[0].id
+
+    with pytest.raises(ValueError):
+        OpportunitySet(epoch, np.zeros(1))
@@ -22,4 +22,15 @@ def test_spacecraft():
     sc = Spacecraft(**spacecraft_json)
 
     assert sc.id == 1
-    assert sc.name == "Spacecraft 1"
\ No newline at end of file
+    assert sc.name == "Spacecraft 1"
+
+    # Parsed TLE is shared between spacecraft
+    tle = sc.tle
+    assert sc.tle is tle
+    assert Spacecraft(**spacecraft_json).tle is tle
+    assert sc == Spacecraft(**spacecraft_json)
+
+    # Changing the lines refreshes the TLE
+    sc.line1 = "1 39418U 13066C   19351.83278205 +.00000478 +00000-0 +44250-4 0  9993"
+    assert sc.tle is not tle
+    assert sc.tle.line1 == sc.line1
@@ -18,6 +18,24 @@ def test_load():
 
     assert _grav.GravityModel.is_normalized() == True
 
+def test_load_cache(tmp_path):
+    filepath = tmp_path / 'EGM2008_90.gfc'
+    filepath.write_bytes(_grav.GRAV_MODEL_EGM2008_90.read_bytes())
+
+    _grav.GravityModel.load(filepath, use_cache=False)
+    data = np.array(_grav.GravityModel._data)
+
+    # Second load is served from read-only memory-mapped cache
+    _grav.GravityModel.load(filepath)
+    _grav.GravityModel.load(filepath)
+
+    assert np.array_equal(_grav.GravityModel._data, data)
+    assert not _grav.GravityModel._data.flags.writeable
+    assert _grav.GravityModel.n_max == 90
+    assert _grav.GravityModel.is_normalized() == True
+
+    _grav.GravityModel.load(_grav.GRAV_MODEL_EGM2008_90)
+
 def test_accel_point_mass(state_itrf):
     # Test Two-Input Acceleration
     r_sat  = np.array([_constants.R_EARTH, 0, 0])
@@ -55,9 +73,40 @@ def test_accel_gravity():
 
     a_grav = _grav.accel_gravity(r_sat, r_i2b, 60, 60)
 
+    # Reference values depend on the Earth rotation at the epoch, with UT1-UTC
+    # evaluated at the UTC date
     assert a_grav[0] == approx(-9.814176980825541, abs=1e-8)
-    assert a_grav[1] == approx(7.94095107080036e-05, abs=1e-12)
-    assert a_grav[2] == approx(-2.0799337e-05, abs=1e-12)
+    assert a_grav[1] == approx(7.940954236862474e-05, abs=1e-12)
+    assert a_grav[2] == approx(-2.0799316867097053e-05, abs=1e-12)
+
+def test_accel_gravity_batch():
+    r_bf = np.array([
+        [_constants.R_EARTH, 0, 0],
+        [0, _constants.R_EARTH + 500e3, 0],
+        [1000e3, -2000e3, _constants.R_EARTH],
+    ])
+
+    a_grav = _grav.accel_gravity_batch(r_bf, 60, 60)
+
+    assert a_grav.shape == (3, 3)
+    for i in range(3):
+        assert a_grav[i, :] == approx(_grav.accel_gravity(r_bf[i, :], np.eye(3), 60, 60), abs=1e-12)
+
+    with pytest.raises(RuntimeError):
+        _grav.accel_gravity_batch(r_bf, 999, 0)
+
+def test_denormalized_coefficients():
+    _grav.GravityModel.load(_grav.GRAV_MODEL_EGM2008_90)
+
+    CS = _grav.GravityModel.denormalized_coefficients(20, 20)
+
+    # Coefficients are cached per degree and order
+    assert _grav.GravityModel.denormalized_coefficients(20, 20) is CS
+    assert _grav.GravityModel.denormalized_coefficients(10, 10) is not CS
+
+    # C20 and S22 denormalization
+    assert CS[2, 0] == approx(math.sqrt(5)*_grav.GravityModel._data[2, 0], abs=1e-15)
+    assert CS[1, 2] == approx(math.sqrt(2*5*_grav._facprod(2, 2))*_grav.GravityModel._data[1, 2], abs=1e-15)
 
 def test_accel_thirdbody(state_gcrf):
     epc = Epoch(2018, 3, 20, 16, 15, 0)
@@ -0,0 +1,56 @@
+# Test Imports
+import pytest
+from pytest import approx
+import math
+import numpy as np
+
+# Modules Under Test
+from brahe.epoch import Epoch
+import brahe.constants as _constants
+from brahe.orbit_dynamics.propagator import ForceModel, NumericalPropagator
+
+def circular_orbit(t, a):
+    n = math.sqrt(_constants.GM_EARTH/a**3)
+    return np.column_stack([a*np.cos(n*t), a*np.sin(n*t), 0*t, -a*n*np.sin(n*t), a*n*np.cos(n*t), 0*t])
+
+@pytest.mark.parametrize('integrator,step', [('rk4', 10.0), ('dp54', 60.0)])
+def test_propagate_two_body(integrator, step):
+    epc = Epoch(2019, 1, 1)
+    a   = _constants.R_EARTH + 500e3
+    T   = 2*math.pi*math.sqrt(a**3/_constants.GM_EARTH)
+    x0  = circular_orbit(np.array([0.0]), a)[0, :]
+
+    force_model = ForceModel(n_max=0, m_max=0, sun=False, moon=False)
+    propagator  = NumericalPropagator(epc, x0, force_model, integrator=integrator, step=step)
+    trajectory  = propagator.propagate(epc + T)
+
+    assert trajectory.t[-1] == approx(T, abs=1e-9)
+    assert trajectory.x[-1, :] == approx(x0, abs=5e-2)
+
+    # Dense output between integration steps
+    t = np.linspace(0.0, T, 101)
+    assert trajectory.states(t) == approx(circular_orbit(t, a), abs=5e-2)
+    assert trajectory.state(epc + 1000.0) == approx(circular_orbit(np.array([1000.0]), a)[0, :], abs=5e-2)
+
+    with pytest.raises(RuntimeError):
+        trajectory.state(T + 10.0)
+
+def test_propagate_backward(state_gcrf):
+    epc = Epoch(2018, 3, 20, 16, 15, 0)
+
+    force_model = ForceModel(n_max=20, m_max=20, sun=True, moon=True, srp=True, relativity=True)
+
+    forward  = NumericalPropagator(epc, state_gcrf, force_model).propagate(3600.0)
+    backward = NumericalPropagator(forward.epoch_end, forward.x[-1, :], force_model).propagate(-3600.0)
+
+    assert backward.epoch_end == epc
+    assert backward.x[-1, :] == approx(state_gcrf, abs=1e-2)
+
+def test_propagator_errors(state_gcrf):
+    epc = Epoch(2018, 3, 20, 16, 15, 0)
+
+    with pytest.raises(RuntimeError):
+        NumericalPropagator(epc, state_gcrf, integrator='euler')
+
+    with pytest.raises(RuntimeError):
+        NumericalPropagator(epc, state_gcrf, ForceModel(n_max=999, m_max=0)).propagate(60.0)
@@ -389,4 +389,45 @@ def test_sez_azel():
     azel = sSEZtoAZEL(sez)
     assert azel[0] != 0
     assert azel[1] != 0
-    assert azel[2] != 0
\ No newline at end of file
+    assert azel[2] != 0
+
+def test_batch():
+    geod = np.array([[0.0, 0.0, 0.0], [90.0, 90.0, 0.0], [-122.4056, 37.7716, 100.0],
+                     [77.875, -20.9752, 500e3], [10.0, -90.0, 35786e3]])
+
+    ecef = sGEODtoECEF_batch(geod, use_degrees=True)
+    geod2 = sECEFtoGEOD_batch(ecef, use_degrees=True)
+
+    for k in range(len(geod)):
+        assert ecef[k] == approx(sGEODtoECEF(geod[k], use_degrees=True), abs=1e-7)
+        assert geod2[k, 1:3] == approx(geod[k, 1:3], abs=1e-7)
+
+    assert sGEODtoECEF_batch(geod[:, 0:2], use_degrees=True) == approx(sGEODtoECEF_batch(geod * [1, 1, 0], use_degrees=True))
+
+    # Topocentric conversions of multiple states
+    epc  = Epoch(2018, 1, 1, 12, 0, 0)
+    oe   = [R_EARTH + 500e3, 1e-3, 97.8, 75, 25, 45]
+    ecef = np.array([sECItoECEF(epc + dt, sOSCtoCART(oe, use_degrees=True)) for dt in [0.0, 600.0, 1200.0]])
+
+    station_ecef = sGEODtoECEF([-122.4056, 37.7716, 0.0], use_degrees=True)
+
+    enz  = sECEFtoENZ_batch(station_ecef, ecef)
+    sez  = sECEFtoSEZ_batch(station_ecef, ecef, conversion="geocentric")
+    azel = sENZtoAZEL_batch(enz, use_degrees=True)
+
+    for k in range(len(ecef)):
+        assert enz[k]  == approx(sECEFtoENZ(station_ecef, ecef[k]), abs=1e-6)
+        assert sez[k]  == approx(sECEFtoSEZ(station_ecef, ecef[k], conversion="geocentric"), abs=1e-6)
+        assert azel[k] == approx(sENZtoAZEL(enz[k], use_degrees=True), abs=1e-8)
+
+    assert sENZtoAZEL_batch(enz[:, 0:3]).shape == (3, 3)
+
+    # Test Error Conditions
+    with pytest.raises(RuntimeError):
+        sGEODtoECEF_batch([[0.0, 90.1]], use_degrees=True)
+
+    with pytest.raises(RuntimeError):
+        sECEFtoENZ_batch([station_ecef, station_ecef], ecef)
+
+    with pytest.raises(RuntimeError):
+        sENZtoAZEL_batch(enz[:, 0:2])
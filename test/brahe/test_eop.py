@@ -70,4 +70,40 @@ def test_interp():
     assert EOP.xp(58747.5, interp=True) == xp
 
     yp = (EOP.yp(58748) + EOP.yp(58747))/2.0
-    assert EOP.yp(58747.5, interp=True) == yp
\ No newline at end of file
+    assert EOP.yp(58747.5, interp=True) == yp
+
+def test_array_lookup():
+    mjds = np.array([58747.0, 58747.25, 58747.5, 58748.75])
+
+    # Vectorized lookups match scalar lookups
+    assert EOP.ut1_utc(mjds) == approx([EOP.ut1_utc(m) for m in mjds], abs=1e-12)
+    assert EOP.ut1_utc(mjds, interp=True) == approx([EOP.ut1_utc(m, interp=True) for m in mjds], abs=1e-12)
+    assert EOP.xp(mjds, interp=True) == approx([EOP.xp(m, interp=True) for m in mjds], abs=1e-15)
+    assert EOP.yp(mjds, interp=True) == approx([EOP.yp(m, interp=True) for m in mjds], abs=1e-15)
+
+    xp, yp = EOP.pole_locator(mjds, interp=True)
+    assert xp.shape == (4,)
+    assert yp == approx([EOP.yp(m, interp=True) for m in mjds], abs=1e-15)
+
+    # Dates outside of loaded data raise an error
+    with pytest.raises(RuntimeError):
+        EOP.ut1_utc(np.array([0.0, 58747.0]))
+
+def test_load_cache(tmp_path):
+    filepath = tmp_path / 'finals.txt'
+    filepath.write_bytes(IERS_AB_EOP_DATA.read_bytes())
+
+    EOP.load(filepath, use_cache=False)
+    data = np.array(EOP._data)
+
+    # Cached and uncached loads are identical
+    EOP.load(filepath)
+    EOP.load(filepath)
+    assert np.array_equal(EOP._data, data)
+    assert not EOP._data.flags.writeable
+
+    # Values can still be set on cached data
+    EOP.set(58747, -0.2, 0.225, 0.3)
+    assert EOP.ut1_utc(58747) == -0.2
+
+    EOP.load(DEFAULT_EOP_DATA)
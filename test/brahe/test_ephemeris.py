@@ -0,0 +1,77 @@
+# Test Imports
+import pytest
+from pytest import approx
+import numpy as np
+
+# Modules Under Test
+from brahe.epoch import Epoch
+from brahe.tle import TLE
+from brahe.ephemeris import Ephemeris
+from brahe.access.access import find_access_windows
+
+ISS_TLE_LINE1 = '1 25544U 98067A   08264.51782528 -.00002182  00000-0 -11606-4 0  2927'
+ISS_TLE_LINE2 = '2 25544  51.6416 247.4627 0006703 130.5360 325.0288 15.72125391563537'
+
+def test_ephemeris_interpolation():
+    tle = TLE(ISS_TLE_LINE1, ISS_TLE_LINE2)
+    dt = np.random.default_rng(0).uniform(0.0, 86400.0, 2000)
+
+    x_tle = tle.states_itrf(dt)
+
+    for method in ['lagrange', 'hermite']:
+        eph = Ephemeris(tle, method=method, tol=0.1)
+        x = eph.states_itrf(dt)
+
+        assert np.max(np.linalg.norm(x[:, 0:3] - x_tle[:, 0:3], axis=1)) < 0.2
+        assert np.max(np.linalg.norm(x[:, 3:6] - x_tle[:, 3:6], axis=1)) < 0.1
+
+        # Single states match batch
+        assert eph.state_itrf(float(dt[0])) == approx(x[0], abs=1e-6)
+        assert eph.state_itrf(tle.epoch + float(dt[1])) == approx(x[1], abs=1e-3)
+
+    # Sampling keeps the first spacing meeting the tolerance
+    eph = Ephemeris(tle, step=60.0, tol=0.1)
+    eph.state_itrf(0.0)
+    assert eph._windows[0][1] == 60.0
+
+def test_ephemeris_cache():
+    tle = TLE(ISS_TLE_LINE1, ISS_TLE_LINE2)
+    eph = Ephemeris(tle, window=600.0, cache_size=2)
+
+    eph.states_itrf([0.0, 700.0, 1300.0])
+    assert list(eph._windows.keys()) == [1, 2]
+
+    # Access moves window to end of cache
+    eph.state_itrf(650.0)
+    eph.state_itrf(-10.0)
+    assert list(eph._windows.keys()) == [1, -1]
+
+    eph.clear_cache()
+    assert len(eph._windows) == 0
+
+    # Attributes of the source are available
+    assert eph.elements == approx(tle.elements)
+    assert eph.state_gcrf(60.0) == approx(tle.state_gcrf(60.0))
+
+    with pytest.raises(RuntimeError):
+        Ephemeris(tle, method='spline')
+
+    with pytest.raises(RuntimeError):
+        Ephemeris(tle, order=3)
+
+def test_ephemeris_access(spacecraft_polar, station_svalbard):
+    tle = spacecraft_polar.tle
+    eph = Ephemeris(tle)
+
+    t_start = Epoch(2020, 1, 1, time_system='UTC')
+    t_end = Epoch(2020, 1, 2, time_system='UTC')
+
+    args = (station_svalbard.center_ecef, station_svalbard.constraints, ['elevation'], t_start, t_end)
+
+    windows_tle = find_access_windows(tle, *args)
+    windows_eph = find_access_windows(eph, *args)
+
+    assert len(windows_eph) == len(windows_tle)
+    for (s_tle, e_tle), (s_eph, e_eph) in zip(windows_tle, windows_eph):
+        assert s_eph - s_tle == approx(0.0, abs=1e-2)
+        assert e_eph - e_tle == approx(0.0, abs=1e-2)
@@ -277,4 +277,52 @@ def test_epoch_rage():
 
     assert len(epcs) == 86401
     assert epcs[0] == epc_start
-    assert epcs[-1] == epc_end
\ No newline at end of file
+    assert epcs[-1] == epc_end
+
+def test_epoch_array():
+    epc  = Epoch(2016, 12, 31, 23, 59, 0, 123456789)
+    dt   = [-86400.0, -0.5, 0.0, 30.0, 61.0, 86400.0 + 0.25]
+    epcs = [epc + t for t in dt]
+
+    epc_array = EpochArray(epcs)
+    assert len(epc_array) == len(epcs)
+    assert all(epc_array == EpochArray.from_offsets(epc, dt))
+
+    # Round trip to Epoch list
+    for a, b in zip(epc_array.to_epochs(), epcs):
+        assert a == b
+
+    # Time system conversions match scalar Epoch across the leap second
+    for tsys in VALID_TIME_SYSTEMS:
+        assert epc_array.mjd(tsys) == approx([e.mjd(tsys) for e in epcs], abs=1e-12)
+        assert epc_array.jd(tsys) == approx([e.jd(tsys) for e in epcs], abs=1e-9)
+
+    assert epc_array.gmst() == approx([e.gmst() for e in epcs], abs=1e-10)
+
+def test_epoch_array_operators():
+    epc       = Epoch(2000, 1, 1, 12, 23, 59, 123456789)
+    epc_array = EpochArray.from_offsets(epc, [-1.0, 0.0, 1.0])
+
+    assert epc_array - epc == approx([-1.0, 0.0, 1.0], abs=1e-12)
+    assert (epc_array + 0.5)[1] == epc + 0.5
+    assert (epc_array - 1.0e-9)[1] == epc - 1.0e-9
+    assert list(epc_array < epc)  == [True, False, False]
+    assert list(epc_array <= epc) == [True, True, False]
+    assert list(epc_array > epc)  == [False, False, True]
+    assert list(epc_array >= epc) == [False, True, True]
+    assert list(epc_array == epc) == [False, True, False]
+    assert list(epc_array != epc) == [True, False, True]
+
+def test_epoch_array_range():
+    epc_start = Epoch(2020, 1, 1)
+    epc_end   = Epoch(2020, 1, 2)
+
+    epcs = EpochArray.range(epc_start, epc_end, 1)
+
+    assert len(epcs) == 86401
+    assert epcs[0] == epc_start
+    assert epcs[-1] == epc_end
+
+    # Non-integer divisible ranges match epoch_range
+    epc_end = Epoch(2020, 1, 1, 0, 0, 10.5)
+    assert all(EpochArray.range(epc_start, epc_end, 3) == EpochArray(epoch_range(epc_start, epc_end, 3)))
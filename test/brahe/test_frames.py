@@ -1,6 +1,7 @@
 # Test Imports
 from pytest import approx
 import pytest 
+import numpy as np
 
 # Modules Under Test
 from brahe.constants   import *
@@ -117,4 +118,64 @@ def test_circular():
     assert ecef[2] == approx(ecef2[2], abs=tol)
     assert ecef[3] == approx(ecef2[3], abs=tol)
     assert ecef[4] == approx(ecef2[4], abs=tol)
-    assert ecef[5] == approx(ecef2[5], abs=tol)
\ No newline at end of file
+    assert ecef[5] == approx(ecef2[5], abs=tol)
+
+def test_batch():
+    epc = Epoch(2018,1,1,12,0,0)
+    epcs = EpochArray.from_offsets(epc, [0.0, 600.0, 3600.0, 86400.0])
+
+    oe  = [R_EARTH + 500e3, 1e-3, 97.8, 75, 25, 45]
+    eci = np.array([sOSCtoCART(oe, use_degrees=True)]*len(epcs))
+
+    ecef = sECItoECEF_batch(epcs, eci)
+    r    = rECItoECEF_batch(epcs)
+
+    # Batch transformations match scalar transformations
+    for k, e in enumerate(epcs):
+        assert r[k] == approx(rECItoECEF(e), abs=1e-9)
+        assert ecef[k] == approx(sECItoECEF(e, eci[k]), abs=1e-3)
+        assert sECEFtoECI_batch(epcs, ecef)[k] == approx(eci[k], abs=1e-6)
+
+    assert rECEFtoECI_batch(epcs)[0] == approx(r[0].T)
+    assert sECItoECEF_batch(epcs, eci[:, 0:3]) == approx(ecef[:, 0:3])
+
+    with pytest.raises(RuntimeError):
+        sECItoECEF_batch(epcs, eci[0:2])
+
+def test_full_precision():
+    epc = Epoch(2007, 4, 5, 12, 0, 0, tsys="UTC")
+
+    EOP.load()
+    EOP.set(54195.5, -0.072073685, 0.0349282, 0.4833163)
+
+    set_frame_precision('full')
+
+    try:
+        rc2i = bias_precession_nutation(epc)
+        r    = earth_rotation(epc) @ rc2i
+
+        tol = 1e-8
+        assert rc2i[0, 0] == approx(+0.999999746339445, abs=tol)
+        assert rc2i[0, 2] == approx(-0.000712264730072, abs=tol)
+        assert rc2i[1, 2] == approx(-0.000044385242827, abs=tol)
+        assert rc2i[2, 0] == approx(+0.000712264729599, abs=tol)
+
+        assert r[0, 0] == approx(+0.973104317573127, abs=tol)
+        assert r[0, 1] == approx(+0.230363826247709, abs=tol)
+        assert r[1, 2] == approx(+0.000120888549586, abs=tol)
+
+        # Batch transformations match scalar transformations
+        epcs = EpochArray.from_offsets(epc, [0.0, 1800.0, 5400.0])
+
+        for k, e in enumerate(epcs):
+            assert bias_precession_nutation_batch(epcs)[k] == approx(bias_precession_nutation(e), abs=1e-12)
+            assert polar_motion_batch(epcs)[k] == approx(polar_motion(e), abs=1e-12)
+
+        assert frame_precision() == 'full'
+    finally:
+        set_frame_precision('fast')
+
+    assert polar_motion(epc) == approx(np.eye(3))
+
+    with pytest.raises(RuntimeError):
+        set_frame_precision('exact')
@@ -3,6 +3,7 @@ from pytest import approx
 
 # Modules Under Test
 import brahe.constants as _constants
+from brahe.eop import EOP
 from brahe.time import *
 
 def test_caldate_to_mjd():
@@ -71,4 +72,31 @@ def test_time_system_offset():
     assert time_system_offset(jd, 0, "TAI", "TT")  == _constants.TT_TAI
     assert time_system_offset(jd, 0, "TAI", "UTC") == dutc
     assert approx(time_system_offset(jd, 0, "TAI", "UT1"), abs=1e-4) == -36.92267
-    assert time_system_offset(jd, 0, "TAI", "TAI") == 0
\ No newline at end of file
+    assert time_system_offset(jd, 0, "TAI", "TAI") == 0
+
+def test_time_system_offset_ut1():
+    # UT1-UTC changes at midnight, so evaluating it at any date other than the
+    # UTC date shortly after midnight gives a different offset
+    mjd_utc = caldate_to_mjd(2018, 6, 1, 0, 0, 10)
+    dutc = tai_utc(mjd_utc)
+
+    assert EOP.ut1_utc(mjd_utc) != EOP.ut1_utc(mjd_utc - dutc/86400.0)
+
+    offset = time_system_offset(_constants.MJD_ZERO, mjd_utc + dutc/86400.0, "TAI", "UT1")
+    assert offset == approx(-dutc + EOP.ut1_utc(mjd_utc), abs=1e-9)
+
+def test_tai_utc():
+    # Constant offsets after 1972
+    assert tai_utc(caldate_to_mjd(1972, 1, 1)) == 10.0
+    assert tai_utc(caldate_to_mjd(2016, 12, 31, 23, 59, 59)) == 36.0
+    assert tai_utc(caldate_to_mjd(2017, 1, 1)) == 37.0
+
+    # Drift term before 1972
+    assert approx(tai_utc(caldate_to_mjd(1965, 3, 2, 12)), abs=1e-6) == 3.718538
+
+    # Offsets either side of a leap second
+    jd = caldate_to_jd(2017, 1, 1)
+    assert time_system_offset(jd, -1.0/86400.0, "UTC", "TAI") == 36.0
+    assert time_system_offset(jd, 0.0, "UTC", "TAI") == 37.0
+    assert time_system_offset(jd, 36.5/86400.0, "TAI", "UTC") == -36.0
+    assert time_system_offset(jd, 37.0/86400.0, "TAI", "UTC") == -37.0
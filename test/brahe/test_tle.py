@@ -1,8 +1,13 @@
 # Test Imports
+import io
+import gzip
+import pickle
+import pytest
+import numpy as np
 from pytest import approx
 
 # Modules Under Test
-from brahe.epoch import Epoch
+from brahe.epoch import Epoch, EpochArray
 import brahe.constants as bconst
 import brahe.tle as btle
 
@@ -14,6 +19,10 @@ def test_tle_format_exp():
     num_str = btle.tle_format_exp(num)
     assert num_str == ' 10000-2'
 
+def test_tle_checksums():
+    lines = [ISS_TLE_LINE1, ISS_TLE_LINE2]
+    assert list(btle.tle_checksums(lines)) == [btle.tle_checksum(line) for line in lines]
+
 def test_tle_checksum():
     checksum = btle.tle_checksum(ISS_TLE_LINE1)
     assert checksum == 7
@@ -68,7 +77,13 @@ def test_elements():
     assert elements[4] == 130.536
     assert elements[5] == 325.0288
 
-    
+    # Elements are parsed once and shared between calls
+    assert tle.elements is elements
+    assert not elements.flags.writeable
+    assert tle.a == elements[0]
+    assert tle.bstar == tle.tle_elements[8]
+
+
 def test_tle_state():
     tle = btle.TLE(ISS_TLE_LINE1, ISS_TLE_LINE2)
     
@@ -101,11 +116,11 @@ def test_tle_state_pef():
     state = tle.state_pef(tle.epoch)
 
     assert len(state) == 6
-    assert state[0] == approx(-3953205.7105210484, abs=1e-8)
-    assert state[1] == approx(1427514.7048106815, abs=1e-8)
+    assert state[0] == approx(-3953205.7091108356, abs=1e-8)
+    assert state[1] == approx(1427514.708715972, abs=1e-8)
     assert state[2] == approx(5243614.536966579, abs=1e-8)
-    assert state[3] == approx(-3175.692140186211, abs=1e-8)
-    assert state[4] == approx(-6658.887120918979, abs=1e-8)
+    assert state[3] == approx(-3175.692146764389, abs=1e-8)
+    assert state[4] == approx(-6658.887117781778, abs=1e-8)
     assert state[5] == approx(-583.775727402632, abs=1e-8)
 
 def test_tle_state_itrf():
@@ -114,11 +129,11 @@ def test_tle_state_itrf():
     state = tle.state_itrf(tle.epoch)
 
     assert len(state) == 6
-    assert state[0] == approx(-3953205.7105210484, abs=1e-8)
-    assert state[1] == approx(1427514.7048106815, abs=1e-8)
+    assert state[0] == approx(-3953205.7091108356, abs=1e-8)
+    assert state[1] == approx(1427514.708715972, abs=1e-8)
     assert state[2] == approx(5243614.536966579, abs=1e-8)
-    assert state[3] == approx(-3175.692140186211, abs=1e-8)
-    assert state[4] == approx(-6658.88712091898, abs=1e-8)
+    assert state[3] == approx(-3175.692146764389, abs=1e-8)
+    assert state[4] == approx(-6658.887117781778, abs=1e-8)
     assert state[5] == approx(-583.775727402632, abs=1e-8)
 
 def test_tle_state_gcrf():
@@ -127,11 +142,11 @@ def test_tle_state_gcrf():
     state = tle.state_gcrf(tle.epoch)
 
     assert len(state) == 6
-    assert state[0] == approx(4081964.4567414266, abs=1e-3)
-    assert state[1] == approx(-1001598.6202299929, abs=1e-8)
+    assert state[0] == approx(4081964.455728603, abs=1e-3)
+    assert state[1] == approx(-1001598.6243577021, abs=1e-8)
     assert state[2] == approx(5243614.536966579, abs=1e-8)
-    assert state[3] == approx(2526.984013205157, abs=1e-8)
-    assert state[4] == approx(7254.955984597943, abs=1e-8)
+    assert state[3] == approx(2526.984020541417, abs=1e-8)
+    assert state[4] == approx(7254.955982042638, abs=1e-8)
     assert state[5] == approx(-583.775727402632, abs=1e-8)
 
 def test_tle_state_eci():
@@ -140,9 +155,154 @@ def test_tle_state_eci():
     state = tle.state_eci(tle.epoch)
 
     assert len(state) == 6
-    assert state[0] == approx(4081964.4567414266, abs=1e-8)
-    assert state[1] == approx(-1001598.6202299929, abs=1e-8)
+    assert state[0] == approx(4081964.455728603, abs=1e-8)
+    assert state[1] == approx(-1001598.6243577021, abs=1e-8)
     assert state[2] == approx(5243614.536966579, abs=1e-8)
-    assert state[3] == approx(2526.984013205157, abs=1e-8)
-    assert state[4] == approx(7254.955984597943, abs=1e-8)
-    assert state[5] == approx(-583.775727402632, abs=1e-8)
\ No newline at end of file
+    assert state[3] == approx(2526.984020541417, abs=1e-8)
+    assert state[4] == approx(7254.955982042638, abs=1e-8)
+    assert state[5] == approx(-583.775727402632, abs=1e-8)
+
+def test_tle_states():
+    tle = btle.TLE(ISS_TLE_LINE1, ISS_TLE_LINE2)
+
+    times  = [0.0, 60.0, 3600.0, 86400.0]
+    states = tle.states(times)
+
+    assert states.shape == (4, 6)
+    for idx, t in enumerate(times):
+        assert states[idx, :] == approx(tle.state(t), abs=1e-6)
+
+    # Epoch inputs are equivalent to elapsed time since epoch
+    epochs = [tle.epoch + t for t in times]
+    assert tle.states(epochs) == approx(states, abs=1e-6)
+    assert tle.states(EpochArray(epochs)) == approx(states, abs=1e-6)
+    assert tle.states(EpochArray(epochs), epoch=epochs[1]) == approx(states, abs=1e-6)
+
+def test_tle_states_frames():
+    tle = btle.TLE(ISS_TLE_LINE1, ISS_TLE_LINE2)
+
+    times = [0.0, 60.0, 3600.0, 86400.0, 2*86400.0 + 123.0]
+
+    states_pef  = tle.states_pef(times)
+    states_itrf = tle.states_itrf(times)
+    states_gcrf = tle.states_gcrf(times)
+
+    for idx, t in enumerate(times):
+        assert states_pef[idx, :] == approx(tle.state_pef(t), abs=5e-2)
+        assert states_itrf[idx, :] == approx(tle.state_itrf(t), abs=5e-2)
+        assert states_gcrf[idx, :] == approx(tle.state_gcrf(t), abs=5e-2)
+
+    # Times relative to another epoch share the rotations of the time grid
+    epoch = tle.epoch + 1800.0
+    dt = [t - 1800.0 for t in times]
+
+    assert tle.states_itrf(dt, epoch=epoch) == approx(states_itrf, abs=1e-5)
+
+    grid = 60.0*np.arange(100)
+    assert btle._teme_grid(epoch, grid) is btle._teme_grid(epoch, grid)
+
+def test_intern_tle():
+    tle = btle.intern_tle(ISS_TLE_LINE1, ISS_TLE_LINE2)
+
+    # Line pairs share one TLE object
+    assert btle.intern_tle(ISS_TLE_LINE1, ISS_TLE_LINE2) is tle
+
+    # Shared TLEs are read-only
+    with pytest.raises(AttributeError):
+        tle.line1 = ISS_TLE_LINE2
+
+    with pytest.raises(AttributeError):
+        setattr(tle, '_sgp', None)
+
+    # TLEs are rebuilt from their lines when pickled
+    tle2 = pickle.loads(pickle.dumps(tle))
+    assert tle2.line1 == ISS_TLE_LINE1
+    assert tle2.state(0.0) == approx(tle.state(0.0), abs=1e-9)
+
+    btle.intern_tle.cache_clear()
+    assert btle.intern_tle(ISS_TLE_LINE1, ISS_TLE_LINE2) is not tle
+
+def test_tle_catalog(tle_polar, tle_inclined):
+    tles    = [tle_polar, tle_inclined]
+    catalog = btle.TLECatalog([tle_polar, (tle_inclined.line1, tle_inclined.line2)])
+
+    assert len(catalog) == 2
+    assert catalog.tle_elements.shape == (2, 9)
+    assert catalog.i[0] == approx(tle_polar.i, abs=1e-12)
+    assert catalog[1].line1 == tle_inclined.line1
+
+    # Entries are only parsed once
+    assert catalog[1] is catalog[1]
+    assert list(catalog)[0] is catalog[0]
+
+    epochs = [tle_polar.epoch + t for t in [0.0, 60.0, 3600.0, 86400.0]]
+
+    for method in ['states', 'states_pef', 'states_itrf', 'states_gcrf']:
+        states = getattr(catalog, method)(epochs)
+
+        assert states.shape == (2, 4, 6)
+        for sat, tle in enumerate(tles):
+            assert states[sat, :, :] == approx(getattr(tle, method)(epochs), abs=1e-5)
+
+    assert catalog.states(EpochArray(epochs)) == approx(catalog.states(epochs), abs=1e-6)
+
+    # Elapsed time inputs are equivalent to epoch inputs
+    times = [0.0, 60.0, 3600.0, 86400.0]
+    assert catalog.states(times, epoch=tle_polar.epoch) == approx(catalog.states(epochs), abs=1e-6)
+
+def test_tle_catalog_leap_second(tle_polar):
+    # Element set propagated across the leap second at the end of 2016
+    line1, line2 = btle.tle_string_from_elements(Epoch(2016, 12, 31, 12, time_system='UTC'),
+                                                 [bconst.R_EARTH + 500e3, 0.001, 97.7, 45, 30, 15, 0, 0, 0],
+                                                 norad_id=99999, input_sma=True)
+    tle = btle.TLE(line1, line2)
+
+    catalog = btle.TLECatalog([tle_polar, tle])
+    epochs = [tle.epoch + t for t in [0.0, 43200.0, 86400.0]]
+
+    states = catalog.states(epochs)
+
+    for sat, sat_tle in enumerate([tle_polar, tle]):
+        assert states[sat, :, :] == approx(sat_tle.states(epochs), abs=1e-5)
+
+def test_read_tle_lines(tmp_path, tle_polar):
+    # Newer element set of the ISS
+    line1 = ISS_TLE_LINE1[:20] + '265' + ISS_TLE_LINE1[23:68]
+    line1 += str(btle.tle_checksum(line1))
+
+    text = '\n'.join(['0 ISS (ZARYA)', ISS_TLE_LINE1, ISS_TLE_LINE2,
+                      tle_polar.line1, tle_polar.line2,
+                      'ISS (ZARYA)', line1, ISS_TLE_LINE2]) + '\n'
+
+    entries = list(btle.read_tle_lines(io.StringIO(text)))
+
+    assert len(entries) == 3
+    assert entries[0] == ('ISS (ZARYA)', ISS_TLE_LINE1, ISS_TLE_LINE2)
+    assert entries[1] == (None, tle_polar.line1, tle_polar.line2)
+
+    # Deduplication keeps newest element set in order of first appearance
+    entries = list(btle.read_tle_lines(io.StringIO(text), deduplicate=True))
+
+    assert len(entries) == 2
+    assert entries[0][1] == line1
+
+    # Compressed files
+    filepath = tmp_path / 'catalog.txt.gz'
+    with gzip.open(filepath, 'wt') as fp:
+        fp.write(text)
+
+    tles = list(btle.read_tles(filepath))
+    assert len(tles) == 3
+    assert tles[1].state(0.0) == approx(tle_polar.state(0.0), abs=1e-9)
+
+    catalog = btle.TLECatalog.from_file(filepath, deduplicate=True)
+    assert len(catalog) == 2
+    assert catalog.line1[0] == line1
+
+    # Invalid element sets
+    invalid = text.replace(ISS_TLE_LINE2, ISS_TLE_LINE2[:-1] + '0', 1)
+
+    with pytest.raises(RuntimeError):
+        list(btle.read_tle_lines(io.BytesIO(invalid.encode())))
+
+    assert len(list(btle.read_tle_lines(io.BytesIO(invalid.encode()), strict=False))) == 2
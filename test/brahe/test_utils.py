@@ -1,5 +1,6 @@
 # Test Imports
 from pytest import approx
+import numpy as np
 
 # Modules Under Test
 import brahe.utils as butil
@@ -21,4 +22,35 @@ def test_tle_format_exp():
     c = butil.fcross([0, 1, 0], [0, 0, 1])
     assert c[0] == 1
     assert c[1] == 0
-    assert c[2] == 0
\ No newline at end of file
+    assert c[2] == 0
+
+def test_load_cached_array(tmp_path):
+    filepath = tmp_path / 'data.txt'
+    filepath.write_text('1 2\n3 4\n')
+
+    calls = []
+    def parser(path):
+        calls.append(path)
+        return np.loadtxt(path)
+
+    # First load parses file and writes cache
+    data = butil.load_cached_array(filepath, parser, tag='test')
+    npy_path, meta_path = butil.cached_array_paths(filepath, tag='test')
+    assert len(calls) == 1
+    assert npy_path.exists() and meta_path.exists()
+
+    # Second load is served from the memory-mapped cache
+    cached = butil.load_cached_array(filepath, parser, tag='test')
+    assert len(calls) == 1
+    assert not cached.flags.writeable
+    assert np.array_equal(cached, data)
+
+    # Changing source contents invalidates cache
+    filepath.write_text('5 6\n7 8\n')
+    data = butil.load_cached_array(filepath, parser, tag='test')
+    assert len(calls) == 2
+    assert data[0, 0] == 5
+
+    # Changing parser version invalidates cache
+    butil.load_cached_array(filepath, parser, tag='test', version=2)
+    assert len(calls) == 3